@@ -0,0 +1,188 @@
+"""Benchmark the deletion of received sendables, along with the cleanup of sendables
+left hanging, as the inbox table grows.
+
+Compares the current implementation, which checks the maintained remaining recipients
+of the affected sendables, against a reference one that selects the referenced
+sendables out of the whole inbox table. Uses an in-memory SQLite database.
+
+Usage: python -m benchmarks.hanging_cleanup [--sizes N [N ...]] [--repeat N]
+"""
+
+import argparse
+import os
+import timeit
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import django
+
+
+def reference_delete(serializer: Any) -> None:
+    """Delete the selected received sendables and clean up the hanging sendables the
+    way it was done before, comparing against every referenced sendable.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+
+    Sendable = serializer.entity_settings.SENDABLE_CLASS
+    content_type = ContentType.objects.get_for_model(Sendable)
+
+    sendable_ids_set = set(serializer.valid_items.values_list("object_id", flat=True))
+    serializer.valid_items.delete()
+
+    referenced_sendable_ids = ReceivedSendable.objects.filter(
+        content_type=content_type
+    ).values("object_id")
+    sendable_ids = Sendable.objects.filter(id__in=sendable_ids_set).values("id")
+    unreferenced_sendable_ids = sendable_ids.difference(referenced_sendable_ids)
+
+    ids_for_deleting = Sendable.objects.filter(
+        id__in=unreferenced_sendable_ids, is_removed=True
+    ).values("id")
+    RecipientSendableAssociation.objects.filter(
+        object_id__in=ids_for_deleting, content_type=content_type
+    ).delete()
+    Sendable.objects.filter(id__in=ids_for_deleting).delete()
+
+
+def add_others(count: int) -> None:
+    """Add given number of received sendables to the inbox table, for other users."""
+    from django.contrib.auth import get_user_model
+    from django.contrib.contenttypes.models import ContentType
+
+    from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+    from tests.models import Sendable
+
+    User = get_user_model()
+    content_type = ContentType.objects.get_for_model(Sendable)
+
+    others = list(User.objects.filter(username__startswith="other"))
+    if not others:
+        others = User.objects.bulk_create(
+            [User(username=f"other{i}") for i in range(100)]
+        )
+
+    sendables = Sendable.objects.bulk_create(
+        [
+            Sendable(content="sendable", remaining_recipients=len(others))
+            for _ in range(count // len(others))
+        ]
+    )
+    for model_class in ReceivedSendable, RecipientSendableAssociation:
+        model_class.objects.bulk_create(
+            [
+                model_class(
+                    recipient=user, content_type=content_type, object_id=sendable.id
+                )
+                for sendable in sendables
+                for user in others
+            ],
+            batch_size=10_000,
+        )
+
+
+def add_user() -> tuple[Any, list[int]]:
+    """Add a user, who received a few sendables removed from their senders' outboxes.
+
+    Returns:
+        The user, and the ids of their received sendables
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.contenttypes.models import ContentType
+
+    from sendables.core.models import ReceivedSendable
+    from tests.models import Sendable
+
+    User = get_user_model()
+    content_type = ContentType.objects.get_for_model(Sendable)
+
+    user = User.objects.create(username="user")
+    removed_sendables = Sendable.objects.bulk_create(
+        [
+            Sendable(content="removed", is_removed=True, remaining_recipients=1)
+            for _ in range(10)
+        ]
+    )
+    received_sendables = ReceivedSendable.objects.bulk_create(
+        [
+            ReceivedSendable(
+                recipient=user, content_type=content_type, object_id=sendable.id
+            )
+            for sendable in removed_sendables
+        ]
+    )
+
+    return user, [received_sendable.id for received_sendable in received_sendables]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Time given function, rolling back its changes after each run."""
+    from django.db import transaction
+
+    def run() -> None:
+        with transaction.atomic():
+            function()
+            transaction.set_rollback(True)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+
+    from django.apps import apps
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import connection
+
+    from sendables.core.serializers import DeleteSerializer
+    from sendables.core.settings import app_settings
+    from tests.models import Sendable
+
+    settings.MIGRATION_MODULES = {"sendables": None, "tests": None}
+    app_settings["sendable"].SENDABLE_CLASS = Sendable
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+    # Not synced along, as the models are defined in submodules.
+    with connection.schema_editor() as schema_editor:
+        for model in apps.get_app_config("sendables").get_models():
+            schema_editor.create_model(model)
+
+    user, received_sendable_ids = add_user()
+    table_size = 0
+
+    # Grow the inbox table, measuring at each of the given sizes.
+    for size in sorted(args.sizes):
+        add_others(size - table_size)
+        table_size = size
+
+        def get_serializer() -> DeleteSerializer:
+            serializer = DeleteSerializer(
+                data={"sendable_ids": received_sendable_ids},
+                context={
+                    "request": SimpleNamespace(user=user),
+                    "entity_name": "sendable",
+                },
+            )
+            serializer.is_valid(raise_exception=True)
+            return serializer
+
+        before = measure(lambda: reference_delete(get_serializer()), args.repeat)
+        after = measure(lambda: get_serializer().delete(), args.repeat)
+
+        print(
+            f"{size:>9} inbox records: whole-table {before * 1000:.1f}ms, "
+            f"current {after * 1000:.1f}ms, speedup x{before / after:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
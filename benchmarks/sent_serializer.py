@@ -0,0 +1,136 @@
+"""Benchmark the grouping of recipient-sendable associations under their sendables,
+done by the sent sendables' parent serializer.
+
+Compares the current implementation against a reference one that instantiates the
+recipient serializer per association record, using both model instances and
+projected dicts as input. Requires no database.
+
+Usage: python -m benchmarks.sent_serializer [--sendables N] [--recipients N]
+"""
+
+import argparse
+import os
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, cast
+
+import django
+
+
+def reference_to_representation(
+    serializer: Any, association_data: Iterable
+) -> list[dict[str, Any]]:
+    """Group association records the way it was done before, resolving the recipient
+    serializer for every record.
+    """
+    from rest_framework.fields import get_attribute
+
+    from sendables.core.settings import app_settings
+
+    settings = app_settings[serializer.context["entity_name"]]
+
+    sendables = {}
+    recipients: dict[Any, list[dict[str, Any]]] = {}
+
+    for record in association_data:
+        if (sendable_id := get_attribute(record, ["sendable", "id"])) not in sendables:
+            sendables[sendable_id] = serializer.child.to_representation(record)
+            recipients[sendable_id] = []
+
+        field_type = (
+            settings.RECIPIENT_FIELD_TYPE_DETAIL
+            if serializer.in_detail_view()
+            else settings.RECIPIENT_FIELD_TYPE_LIST
+        )
+        field = field_type(context=serializer.context)
+        recipient = get_attribute(record, ["recipient"])
+        recipients[sendable_id].append(field.to_representation(recipient))
+
+    for sendable_id, sendable_data in sendables.items():
+        sendable_data["recipients"] = recipients[sendable_id]
+
+    return list(sendables.values())
+
+
+def make_records(
+    sendable_count: int, recipient_count: int
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Make association records, both as objects holding (unsaved) model instances and
+    as dicts.
+    """
+    from django.contrib.auth import get_user_model
+
+    from tests.models import Message
+
+    User = get_user_model()
+    sent_on = datetime.now(timezone.utc)
+
+    users = [User(id=i, username=f"user{i}") for i in range(recipient_count)]
+    messages = [
+        Message(id=i, content=f"message {i}", sent_on=sent_on)
+        for i in range(sendable_count)
+    ]
+
+    instances = []
+    rows = []
+    for message in messages:
+        for user in users:
+            instances.append(SimpleNamespace(sendable=message, recipient=user))
+
+            rows.append(
+                {
+                    "sendable": {
+                        "id": message.id,
+                        "content": message.content,
+                        "sent_on": sent_on,
+                    },
+                    "recipient": {"id": user.id, "username": user.username},
+                }
+            )
+
+    return instances, rows
+
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sendables", type=int, default=10)
+    parser.add_argument("--recipients", type=int, default=10_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+
+    from sendables.core.views import ListSentView
+    from sendables.messages.serializers import MessageSentSerializer
+
+    view = cast(Any, ListSentView)()
+    serializer: Any = MessageSentSerializer(
+        many=True, context={"entity_name": "message", "view": view}
+    )
+    instances, rows = make_records(args.sendables, args.recipients)
+
+    print(
+        f"{args.sendables} sendables x {args.recipients} recipients "
+        f"({len(rows)} association records)"
+    )
+    for label, records in ("instances", instances), ("projected", rows):
+        before = measure(lambda: reference_to_representation(serializer, records))
+        after = measure(lambda: serializer.to_representation(records))
+
+        assert reference_to_representation(
+            serializer, records
+        ) == serializer.to_representation(records)
+
+        print(
+            f"{label:>10}: per-record {before:.3f}s, current {after:.3f}s, "
+            f"speedup x{before / after:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
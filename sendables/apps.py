@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 from sendables.messages.apps import configure_messages_app
 from sendables.notices.apps import configure_notices_app
@@ -11,3 +12,11 @@ class SendablesConfig(AppConfig):
     def ready(self) -> None:
         configure_messages_app()
         configure_notices_app()
+
+        from sendables.core.search import create_search_index
+
+        # Not bound to this app as sender, since its models are defined in submodules,
+        # so the signal is not sent for it.
+        post_migrate.connect(
+            create_search_index, dispatch_uid="sendables_create_search_index"
+        )
@@ -0,0 +1,99 @@
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+from sendables.core.caching import invalidate_broadcast_responses
+from sendables.core.counters import add_to_counters
+from sendables.core.models import Broadcast, BroadcastCursor, ReceivedSendable
+from sendables.core.settings import Settings
+from sendables.core.storage import add_references
+
+
+def send_broadcast(
+    entity_settings: Settings, entity_name: str, sendable: Any, group: Any = None
+) -> Broadcast:
+    """Send given sendable to all users, or to the members of given group, by storing
+    a single broadcast record for it.
+    """
+    broadcast: Broadcast = Broadcast.objects.create(
+        sendable=sendable, group=group, sent_on=sendable.sent_on
+    )
+    invalidate_broadcast_responses(entity_settings, entity_name)
+
+    return broadcast
+
+
+def deliver_broadcasts(user: Any, entity_settings: Settings) -> int:
+    """Deliver to given user's inbox the broadcasts of given entity type that were
+    sent since their last delivery, if broadcasts are allowed.
+
+    Users only get inbox "copies" of broadcasts once they retrieve their sendables,
+    so that a broadcast costs no rows for users who never do. Delivered "copies" are
+    then marked and deleted like any other.
+
+    Returns:
+        The number of delivered broadcasts
+    """
+    if not entity_settings.ALLOW_BROADCASTS or not user.is_authenticated:
+        return 0
+
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+    cursors = BroadcastCursor.objects.filter(user=user, content_type=content_type)
+
+    # Check for pending broadcasts in a single query, without locking.
+    if not Broadcast.objects.filter(
+        content_type=content_type,
+        id__gt=Coalesce(Subquery(cursors.values("last_broadcast_id")), 0),
+    ).exists():
+        return 0
+
+    with transaction.atomic():
+        cursor, _ = BroadcastCursor.objects.select_for_update().get_or_create(
+            user=user, content_type=content_type
+        )
+        broadcasts = list(
+            Broadcast.objects.filter(
+                content_type=content_type, id__gt=cursor.last_broadcast_id
+            )
+            .order_by("id")
+            .values_list("id", "object_id", "group", "sent_on")
+        )
+        if not broadcasts:
+            return 0
+
+        group_ids = set()
+        if hasattr(user, "groups") and any(group for _, _, group, _ in broadcasts):
+            group_ids = set(user.groups.values_list("id", flat=True))
+
+        sent_copies = [
+            ReceivedSendable(
+                recipient=user,
+                content_type=content_type,
+                object_id=object_id,
+                sent_on=sent_on,
+                visible_to_sender=False,
+            )
+            for _, object_id, group_id, sent_on in broadcasts
+            if group_id is None or group_id in group_ids
+        ]
+        ReceivedSendable.objects.bulk_create(sent_copies)
+        add_references(
+            entity_settings.SENDABLE_CLASS,
+            [sent_copy.object_id for sent_copy in sent_copies],
+        )
+
+        cursor.last_broadcast_id = broadcasts[-1][0]
+        cursor.save(update_fields=["last_broadcast_id"])
+
+        if entity_settings.MAINTAIN_COUNTERS:
+            add_to_counters(
+                [user.pk],
+                content_type,
+                total=len(sent_copies),
+                unread=len(sent_copies),
+            )
+
+    return len(sent_copies)
@@ -0,0 +1,132 @@
+import hashlib
+import time
+import uuid
+from typing import Any, Callable, Iterable
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from sendables.core.settings import Settings
+
+KEY_PREFIX = "sendables"
+
+
+def _get_generation_key(entity_name: str, user_id: Any) -> str:
+    return f"{KEY_PREFIX}:generation:{entity_name}:{user_id}"
+
+
+def _get_response_key(entity_name: str, request: Request, view_name: str) -> str:
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    media_type = getattr(accepted_renderer, "media_type", "")
+
+    digest = hashlib.sha1(
+        f"{view_name}:{request.get_full_path()}:{media_type}".encode()
+    ).hexdigest()
+    return f"{KEY_PREFIX}:response:{entity_name}:{request.user.pk}:{digest}"
+
+
+def _new_generation() -> tuple[str, float]:
+    return uuid.uuid4().hex, time.time()
+
+
+def _get_headers(response: Response) -> dict[str, str]:
+    # The content type is set while rendering.
+    return {name: value for name, value in response.items() if name != "Content-Type"}
+
+
+def get_generation(
+    cache: BaseCache, entity_name: str, user_id: Any
+) -> tuple[str, float]:
+    """Get the current generation of given user's cached responses of given entity
+    type, as a token along with the time it started.
+
+    It is the combination of the user's own generation and that of the entity type's
+    broadcasts.
+    """
+    keys = [
+        _get_generation_key(entity_name, user_id),
+        _get_generation_key(entity_name, "broadcasts"),
+    ]
+
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, _new_generation(), None)
+            generations[key] = cache.get(key)
+
+    tokens, started_ons = zip(*(generations[key] for key in keys))
+    return ":".join(tokens), max(started_ons)
+
+
+def invalidate_responses(
+    entity_settings: Settings, entity_name: str, user_ids: Iterable[Any]
+) -> None:
+    """Make given users' cached responses of given entity type stale, by starting a
+    new generation for each of them, in a single cache round trip.
+    """
+    if entity_settings.RESPONSE_CACHE is None:
+        return
+
+    generation = _new_generation()
+
+    caches[entity_settings.RESPONSE_CACHE].set_many(
+        {_get_generation_key(entity_name, user_id): generation for user_id in user_ids},
+        None,
+    )
+
+
+def invalidate_broadcast_responses(entity_settings: Settings, entity_name: str) -> None:
+    """Make all users' cached responses of given entity type stale, by starting a new
+    generation for its broadcasts.
+    """
+    if entity_settings.RESPONSE_CACHE is None:
+        return
+
+    caches[entity_settings.RESPONSE_CACHE].set(
+        _get_generation_key(entity_name, "broadcasts"), _new_generation(), None
+    )
+
+
+def get_cached_response(
+    entity_settings: Settings,
+    entity_name: str,
+    request: Request,
+    view_name: str,
+    get_response: Callable[[], Any],
+) -> Any:
+    """Get the response to given request out of the cache, or else by calling given
+    function and cache it, if it is a successful, non-streamed response.
+
+    An entry of an older generation is still served for as long as configured after
+    the generation changes, while a single request refreshes it.
+    """
+    cache = caches[entity_settings.RESPONSE_CACHE]
+    stale_timeout = entity_settings.RESPONSE_CACHE_STALE_TIMEOUT or 0
+
+    token, started_on = get_generation(cache, entity_name, request.user.pk)
+    key = _get_response_key(entity_name, request, view_name)
+
+    entry = cache.get(key)
+    if entry is not None:
+        entry_token, data, headers = entry
+
+        if entry_token == token or (
+            time.time() - started_on < stale_timeout
+            # Let all requests but the first one have the stale entry.
+            and not cache.add(key + ":refresh", True, stale_timeout)
+        ):
+            return Response(data, headers=headers)
+
+    response = get_response()
+
+    if isinstance(response, Response) and response.status_code == 200:
+        cache.set(
+            key,
+            (token, response.data, _get_headers(response)),
+            entity_settings.RESPONSE_CACHE_TIMEOUT + stale_timeout,
+        )
+        cache.delete(key + ":refresh")
+
+    return response
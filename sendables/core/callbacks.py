@@ -0,0 +1,193 @@
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections, transaction
+from django.db.models import QuerySet
+
+from sendables.core.models import SendCallback
+from sendables.core.settings import Settings, app_settings
+from sendables.core.storage import get_associations
+
+User = get_user_model()
+
+THREAD_POOL_SIZE = 4
+
+logger = logging.getLogger(__name__)
+
+_thread_pool: ThreadPoolExecutor | None = None
+
+# Sends waiting for the thread pool, as (entity name, request, sent fields,
+# recipients) tuples.
+_pending: list[tuple[str, Any, dict[str, Any], QuerySet]] = []
+_pending_lock = threading.Lock()
+
+
+def coalesces_send_callbacks(entity_settings: Settings) -> bool:
+    """Whether sends of given entity type are handed to the batch callbacks all
+    together, which only applies to sends deferred by the dispatcher.
+    """
+    return bool(entity_settings.COALESCE_SEND_CALLBACKS) and (
+        entity_settings.SEND_CALLBACK_DISPATCHER is not dispatch_inline
+    )
+
+
+def has_send_callbacks(entity_settings: Settings) -> bool:
+    """Whether any post-send callbacks would be invoked, for given entity type."""
+    if coalesces_send_callbacks(entity_settings):
+        return bool(entity_settings.AFTER_SEND_BATCH_CALLBACKS)
+
+    return bool(entity_settings.AFTER_SEND_CALLBACKS)
+
+
+def run_send_callbacks(
+    entity_name: str, sends: list[tuple[Any, dict[str, Any], QuerySet]]
+) -> None:
+    """Invoke the post-send callbacks for given sends, given as (request, sent fields,
+    recipients) tuples.
+
+    If coalescing, invoke the batch callbacks once for all of the sends, without a
+    request. Otherwise, invoke the callbacks once per send.
+    """
+    entity_settings = app_settings[entity_name]
+
+    if coalesces_send_callbacks(entity_settings):
+        batch = [
+            (sent_fields, list(recipients.values_list("pk", flat=True)))
+            for _, sent_fields, recipients in sends
+        ]
+        for batch_callback in entity_settings.AFTER_SEND_BATCH_CALLBACKS:
+            batch_callback(None, batch)
+        return
+
+    for request, sent_fields, recipients in sends:
+        for callback in entity_settings.AFTER_SEND_CALLBACKS:
+            callback(request, sent_fields, recipients)
+
+
+def dispatch_inline(
+    entity_name: str,
+    request: Any,
+    sendable: Any,
+    sent_fields: dict[str, Any],
+    recipients: QuerySet,
+) -> None:
+    """Send callback dispatcher invoking the callbacks right away, inside the
+    request.
+    """
+    for callback in app_settings[entity_name].AFTER_SEND_CALLBACKS:
+        callback(request, sent_fields, recipients)
+
+
+def _drain_pending() -> None:
+    try:
+        with _pending_lock:
+            pending = _pending[:]
+            _pending.clear()
+
+        # Entity name, to its sends
+        sends_by_entity = defaultdict(list)
+        for entity_name, request, sent_fields, recipients in pending:
+            sends_by_entity[entity_name].append((request, sent_fields, recipients))
+
+        for entity_name, sends in sends_by_entity.items():
+            run_send_callbacks(entity_name, sends)
+    except Exception:
+        logger.exception("Post-send callbacks failed.")
+    finally:
+        connections.close_all()
+
+
+def dispatch_in_thread_pool(
+    entity_name: str,
+    request: Any,
+    sendable: Any,
+    sent_fields: dict[str, Any],
+    recipients: QuerySet,
+) -> None:
+    """Send callback dispatcher invoking the callbacks in an in-process thread pool,
+    once the current transaction is committed.
+
+    Sends committed while the pool is busy are queued, and handled together.
+    """
+    global _thread_pool
+
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=THREAD_POOL_SIZE, thread_name_prefix="sendables-callbacks"
+        )
+    pool = _thread_pool
+
+    def enqueue() -> None:
+        with _pending_lock:
+            _pending.append((entity_name, request, sent_fields, recipients))
+            # A drain is already scheduled for the rest.
+            if len(_pending) > 1:
+                return
+
+        pool.submit(_drain_pending)
+
+    transaction.on_commit(enqueue)
+
+
+def dispatch_to_outbox(
+    entity_name: str,
+    request: Any,
+    sendable: Any,
+    sent_fields: dict[str, Any],
+    recipients: QuerySet,
+) -> None:
+    """Send callback dispatcher storing the invocation in the same transaction as the
+    sending, for the worker command (`sendables_run_send_callbacks`) to carry out.
+    """
+    SendCallback.objects.create(entity_name=entity_name, sendable=sendable)
+
+
+def run_pending_send_callbacks(batch_size: int = 1000) -> int:
+    """Invoke the post-send callbacks of a batch of stored invocations, then delete
+    them, in a single transaction. If any callback fails, the batch is kept, to be
+    retried.
+
+    The callbacks are given no request, the sendable's current sent fields, and the
+    recipients it is still associated with.
+
+    Returns:
+        The number of handled invocations
+    """
+    with transaction.atomic():
+        records = list(
+            SendCallback.objects.select_for_update(
+                skip_locked=connection.features.has_select_for_update_skip_locked
+            )
+            .order_by("id")
+            .prefetch_related("sendable")[:batch_size]
+        )
+
+        # Entity name, to its sends
+        sends_by_entity = defaultdict(list)
+        for record in records:
+            # Skip sendables deleted in the meantime.
+            if (sendable := record.sendable) is None:
+                continue
+
+            entity_settings = app_settings[record.entity_name]
+            sent_fields = {
+                field_name: getattr(sendable, field_name)
+                for field_name in entity_settings.SENT_FIELD_NAMES
+            }
+            associations = get_associations(entity_settings).filter(
+                content_type=record.content_type_id, object_id=sendable.pk
+            )
+            recipients = User.objects.filter(pk__in=associations.values("recipient"))
+
+            sends_by_entity[record.entity_name].append((None, sent_fields, recipients))
+
+        for entity_name, sends in sends_by_entity.items():
+            run_send_callbacks(entity_name, sends)
+
+        SendCallback.objects.filter(pk__in=[record.pk for record in records]).delete()
+
+    return len(records)
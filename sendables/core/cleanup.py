@@ -0,0 +1,161 @@
+from typing import Any, Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from sendables.core.models import (
+    Broadcast,
+    CleanupCursor,
+    ReceivedSendable,
+    RecipientSendableAssociation,
+)
+from sendables.core.search import unindex_sendables
+from sendables.core.settings import Settings, app_settings
+
+DEFERRED = "deferred"
+
+
+def deletes_hanging_inline(entity_settings: Settings) -> bool:
+    """Whether the sendables left hanging are deleted along with the records that
+    referenced them, rather than by the background cleanup.
+    """
+    mode = entity_settings.DELETE_HANGING_SENDABLES
+    return bool(mode) and mode != DEFERRED
+
+
+def get_association_records(entity_settings: Settings) -> QuerySet:
+    """Get every record of who sendables were sent to, according to the storage mode,
+    including those hidden from their senders.
+    """
+    if entity_settings.UNIFIED_STORAGE:
+        return ReceivedSendable.objects.all()
+
+    return RecipientSendableAssociation.objects.all()
+
+
+def get_hanging_sendables(entity_settings: Settings) -> QuerySet:
+    """Get the sendables removed from their senders' outboxes, that have no
+    recipients left.
+    """
+    return entity_settings.SENDABLE_CLASS.objects.filter(
+        is_removed=True, remaining_recipients=0
+    )
+
+
+def delete_sendables(entity_settings: Settings, sendable_ids: Iterable[Any]) -> None:
+    """Delete given sendables, along with their recipient-sendable association
+    records and search index entries.
+    """
+    Sendable = entity_settings.SENDABLE_CLASS
+    content_type = ContentType.objects.get_for_model(Sendable)
+
+    get_association_records(entity_settings).filter(
+        object_id__in=sendable_ids, content_type=content_type
+    ).delete()
+
+    unindex_sendables(entity_settings, sendable_ids)
+
+    Sendable.objects.filter(id__in=sendable_ids).delete()
+
+
+def get_purgeable_received(entity_settings: Settings) -> QuerySet:
+    """Get the soft-deleted received sendable references of given entity type, that
+    are not kept as sent-to info.
+    """
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+    received_sendables = ReceivedSendable.objects.filter(
+        content_type=content_type, deleted_by_recipient=True
+    )
+
+    if entity_settings.UNIFIED_STORAGE:
+        return received_sendables.filter(visible_to_sender=False)
+
+    return received_sendables
+
+
+def purge_received(entity_name: str, batch_size: int = 1000) -> int:
+    """Physically delete the next batch of soft-deleted received sendable references
+    of given entity type.
+
+    Returns:
+        The number of deleted received sendable references
+    """
+    entity_settings = app_settings[entity_name]
+
+    received_ids = list(
+        get_purgeable_received(entity_settings)
+        .order_by("id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if not received_ids:
+        return 0
+
+    count, _ = ReceivedSendable.objects.filter(id__in=received_ids).delete()
+
+    return int(count)
+
+
+def count_hanging_sendables(entity_name: str) -> tuple[int, int]:
+    """Count the hanging sendables of given entity type, and their association
+    records, without deleting anything.
+
+    Returns:
+        The number of sendables, and the number of association records
+    """
+    entity_settings = app_settings[entity_name]
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+    hanging_sendables = get_hanging_sendables(entity_settings)
+
+    associations_count = (
+        get_association_records(entity_settings)
+        .filter(
+            content_type=content_type,
+            object_id__in=hanging_sendables.values("id"),
+        )
+        .count()
+    )
+
+    return hanging_sendables.count(), associations_count
+
+
+def collect_hanging_sendables(
+    entity_name: str, batch_size: int = 1000
+) -> tuple[int, bool]:
+    """Delete the next batch of hanging sendables of given entity type, after the
+    last checked one, and move the checkpoint past them. Once all are checked, reset
+    the checkpoint, for the next pass to start over.
+
+    Sendables in the batch are locked, so that none gets referenced while deleted.
+
+    Returns:
+        The number of deleted sendables, and whether the pass is finished
+    """
+    entity_settings = app_settings[entity_name]
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+
+    with transaction.atomic():
+        cursor, _ = CleanupCursor.objects.select_for_update().get_or_create(
+            content_type=content_type
+        )
+        sendable_ids = list(
+            get_hanging_sendables(entity_settings)
+            .filter(id__gt=cursor.last_sendable_id)
+            .order_by("id")
+            .select_for_update(
+                skip_locked=connection.features.has_select_for_update_skip_locked
+            )
+            .values_list("id", flat=True)[:batch_size]
+        )
+
+        if sendable_ids:
+            Broadcast.objects.filter(
+                object_id__in=sendable_ids, content_type=content_type
+            ).delete()
+            delete_sendables(entity_settings, sendable_ids)
+
+        is_finished = len(sendable_ids) < batch_size
+        cursor.last_sendable_id = 0 if is_finished else sendable_ids[-1]
+        cursor.save(update_fields=["last_sendable_id"])
+
+    return len(sendable_ids), is_finished
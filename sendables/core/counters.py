@@ -0,0 +1,189 @@
+import collections
+from typing import Any, Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet
+
+from sendables.core.models import ReceivedSendable, ReceivedSendableCounter
+from sendables.core.settings import app_settings
+from sendables.core.watermarks import recipient_read_state_filter
+
+
+def add_to_counters(
+    recipient_ids: Iterable[Any],
+    content_type: ContentType,
+    total: int = 0,
+    unread: int = 0,
+) -> None:
+    """Add given amounts to the counters of given recipients, creating any missing
+    counter records first.
+    """
+    recipient_ids = list(recipient_ids)
+    if not recipient_ids or not (total or unread):
+        return
+
+    ReceivedSendableCounter.objects.bulk_create(
+        [
+            ReceivedSendableCounter(
+                recipient_id=recipient_id, content_type=content_type
+            )
+            for recipient_id in recipient_ids
+        ],
+        ignore_conflicts=True,
+    )
+    ReceivedSendableCounter.objects.filter(
+        recipient__in=recipient_ids, content_type=content_type
+    ).update(total=F("total") + total, unread=F("unread") + unread)
+
+
+def count_by_type(
+    received_sendables: QuerySet, unread_filter: Q = Q(is_read=False)
+) -> list[dict[str, Any]]:
+    """Group given received sendables by recipient and content type, and count the
+    total and the unread ones (passing given filter) of each group.
+    """
+    return list(
+        received_sendables.order_by()
+        .values("recipient", "content_type")
+        .annotate(total=Count("id"), unread=Count("id", filter=unread_filter))
+    )
+
+
+def lock_by_type(
+    received_sendables: QuerySet,
+) -> tuple[list[int], list[dict[str, Any]]]:
+    """Lock given received sendables until the transaction ends, for concurrent
+    changes of the same ones to wait, then group them by recipient and content type,
+    and count each group.
+
+    Returns:
+        The ids of the locked received sendables, and their groups, each with its
+        recipient, content type and total
+    """
+    rows = list(
+        received_sendables.select_for_update(of=("self",)).values_list(
+            "id", "recipient", "content_type"
+        )
+    )
+    totals = collections.Counter(
+        (recipient_id, content_type_id) for _, recipient_id, content_type_id in rows
+    )
+
+    groups = [
+        {"recipient": recipient_id, "content_type": content_type_id, "total": total}
+        for (recipient_id, content_type_id), total in totals.items()
+    ]
+    return [row[0] for row in rows], groups
+
+
+def subtract_from_counters(
+    received_sendables: QuerySet, unread_filter: Q = Q(is_read=False)
+) -> None:
+    """Subtract given received sendables (which are about to be deleted) from their
+    recipients' counters, counting as unread those passing given filter.
+    """
+    for group in count_by_type(received_sendables, unread_filter):
+        ReceivedSendableCounter.objects.filter(
+            recipient=group["recipient"], content_type=group["content_type"]
+        ).update(
+            total=F("total") - group["total"], unread=F("unread") - group["unread"]
+        )
+
+
+def clear_unread_counters(recipient_id: Any, content_type: ContentType) -> None:
+    """Count all of given recipient's received sendables of given type as read."""
+    ReceivedSendableCounter.objects.filter(
+        recipient=recipient_id, content_type=content_type
+    ).update(unread=0)
+
+
+def rebuild_counters(content_types: Iterable[ContentType] | None = None) -> None:
+    """Recalculate the counters, out of the existing received sendables.
+
+    Args:
+        content_types: Content types of the sendables to recalculate counters for. If
+            `None`, recalculate all counters.
+    """
+    counters = ReceivedSendableCounter.objects.all()
+    received_sendables = ReceivedSendable.objects.filter(deleted_by_recipient=False)
+
+    if content_types is not None:
+        counters = counters.filter(content_type__in=content_types)
+        received_sendables = received_sendables.filter(content_type__in=content_types)
+
+    with transaction.atomic():
+        counters.delete()
+        ReceivedSendableCounter.objects.bulk_create(
+            [
+                ReceivedSendableCounter(
+                    recipient_id=group["recipient"],
+                    content_type_id=group["content_type"],
+                    total=group["total"],
+                    unread=group["unread"],
+                )
+                for group in count_by_type(
+                    received_sendables, recipient_read_state_filter(False)
+                )
+            ],
+            batch_size=1000,
+        )
+
+
+def get_counts(user: Any, entity_names: Iterable[str]) -> dict[str, dict[str, int]]:
+    """Get counts of read, unread and total received sendables of given user, for
+    each of given entity types.
+
+    Use the maintained counters for the entity types configured so, and count the
+    received sendables of the rest.
+
+    Args:
+        user: The recipient user
+        entity_names: Names of the sendable entity types
+
+    Returns:
+        Mapping of entity name to its counts
+    """
+    content_types = {}
+    for entity_name in entity_names:
+        Sendable = app_settings[entity_name].SENDABLE_CLASS
+        content_types[entity_name] = ContentType.objects.get_for_model(Sendable)
+
+    counted_ids = {
+        content_types[entity_name].id
+        for entity_name in content_types
+        if app_settings[entity_name].MAINTAIN_COUNTERS
+    }
+    other_ids = {content_type.id for content_type in content_types.values()}
+    other_ids -= counted_ids
+
+    # Content type id, to (total, unread) counts
+    totals: dict[int, tuple[int, int]] = {}
+
+    if counted_ids:
+        counters = ReceivedSendableCounter.objects.filter(
+            recipient=user, content_type__in=counted_ids
+        ).values_list("content_type", "total", "unread")
+        for content_type_id, total, unread in counters:
+            totals[content_type_id] = total, unread
+
+    if other_ids:
+        groups = count_by_type(
+            ReceivedSendable.objects.filter(
+                recipient=user, content_type__in=other_ids, deleted_by_recipient=False
+            ),
+            (
+                recipient_read_state_filter(False)
+                if any(app_settings[name].READ_WATERMARK for name in content_types)
+                else Q(is_read=False)
+            ),
+        )
+        for group in groups:
+            totals[group["content_type"]] = group["total"], group["unread"]
+
+    result = {}
+    for entity_name, content_type in content_types.items():
+        total, unread = totals.get(content_type.id, (0, 0))
+        result[entity_name] = {"read": total - unread, "unread": unread, "total": total}
+
+    return result
@@ -0,0 +1,89 @@
+from typing import Any, cast
+
+from django.db import connections, router
+from django.db.models import F, Field, Model, QuerySet
+from django.utils import timezone
+
+from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+
+
+def insert_for_recipients(
+    model_class: type[Model], recipients: QuerySet, values: dict[str, Any]
+) -> int:
+    """Insert a record of given model for each of given recipients, with given field
+    values, straight from the recipients' query (`INSERT ... SELECT`), so that no
+    recipient records are fetched.
+
+    Returns:
+        The number of inserted records
+    """
+    connection = connections[router.db_for_write(model_class)]
+    quote_name = connection.ops.quote_name
+    meta = model_class._meta
+
+    recipient_column = cast(Field, meta.get_field("recipient")).column
+    select_sql, select_params = (
+        recipients.order_by()
+        .values(recipient_id=F("pk"))
+        .query.get_compiler(connection=connection)
+        .as_sql()
+    )
+
+    columns = [recipient_column]
+    params = []
+    for field_name, value in values.items():
+        field = cast(Field, meta.get_field(field_name))
+        columns.append(field.column)
+        params.append(field.get_db_prep_save(value, connection))
+
+    sql = "INSERT INTO {} ({}) SELECT {}, {} FROM ({}) {}".format(
+        quote_name(meta.db_table),
+        ", ".join(quote_name(column) for column in columns),
+        quote_name("recipient_id"),
+        ", ".join(["%s"] * len(params)),
+        select_sql,
+        quote_name("recipients"),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *select_params])
+        return int(cursor.rowcount)
+
+
+def fan_out(
+    sendable: Any, content_type: Any, recipients: QuerySet, unified: bool = False
+) -> int:
+    """Store the inbox "copies" of given sendable and its sendable-recipient
+    associations, for given recipients, in two statements, and count them as the
+    sendable's remaining recipients. In unified storage, the inbox "copies" double as
+    the associations, so a single statement is used for both.
+
+    Returns:
+        The number of recipients
+    """
+    count = insert_for_recipients(
+        ReceivedSendable,
+        recipients,
+        {
+            "is_read": False,
+            "content_type": content_type.pk,
+            "object_id": sendable.pk,
+            "sent_on": sendable.sent_on,
+            "marked_on": timezone.now(),
+            "deleted_by_recipient": False,
+            "visible_to_sender": True,
+        },
+    )
+    type(sendable).objects.filter(pk=sendable.pk).update(
+        remaining_recipients=F("remaining_recipients") + count
+    )
+    if unified:
+        return count
+
+    insert_for_recipients(
+        RecipientSendableAssociation,
+        recipients,
+        {"content_type": content_type.pk, "object_id": sendable.pk},
+    )
+
+    return count
@@ -0,0 +1,182 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections, transaction
+from django.db.models import Count, F, Max, Min, Q, QuerySet
+from django.db.models.functions import Floor
+from django.utils import timezone
+
+from sendables.core.counters import add_to_counters
+from sendables.core.fanout import fan_out, insert_for_recipients
+from sendables.core.models import SendJob, SendJobChunk, SendJobRecipient
+from sendables.core.settings import app_settings
+from sendables.core.versions import record_change
+
+User = get_user_model()
+
+THREAD_POOL_SIZE = 4
+
+_thread_pool: ThreadPoolExecutor | None = None
+
+
+def create_send_job(
+    entity_name: str, sendable: Any, recipients: QuerySet, sender: Any
+) -> SendJob:
+    """Create a job fanning out given sendable to given recipients, and hand it to the
+    configured executor.
+
+    The recipients are staged straight from their query, then split into chunks of
+    consecutive staged records.
+    """
+    entity_settings = app_settings[entity_name]
+    chunk_size = entity_settings.SEND_JOB_CHUNK_SIZE
+
+    job: SendJob = SendJob.objects.create(
+        entity_name=entity_name, sender=sender, sendable=sendable
+    )
+    insert_for_recipients(SendJobRecipient, recipients, {"job": job.pk})
+
+    staged = SendJobRecipient.objects.filter(job=job)
+    first_id = staged.aggregate(first_id=Min("id"))["first_id"] or 0
+
+    chunks = (
+        staged.annotate(number=Floor((F("id") - first_id) / chunk_size))
+        .order_by("number")
+        .values("number")
+        .annotate(first_id=Min("id"), last_id=Max("id"), size=Count("id"))
+    )
+    SendJobChunk.objects.bulk_create(
+        [
+            SendJobChunk(
+                job=job,
+                first_id=chunk["first_id"],
+                last_id=chunk["last_id"],
+                size=chunk["size"],
+            )
+            for chunk in chunks
+        ]
+    )
+
+    entity_settings.SEND_JOB_EXECUTOR(job)
+
+    return job
+
+
+def _run_chunk(job: SendJob, chunk: SendJobChunk) -> None:
+    entity_settings = app_settings[job.entity_name]
+
+    staged = SendJobRecipient.objects.filter(
+        job=job, id__gte=chunk.first_id, id__lte=chunk.last_id
+    )
+    recipients = User.objects.filter(pk__in=staged.values("recipient"))
+
+    fan_out(job.sendable, job.content_type, recipients, entity_settings.UNIFIED_STORAGE)
+
+    recipient_ids = staged.values_list("recipient", flat=True)
+    if entity_settings.MAINTAIN_COUNTERS:
+        add_to_counters(recipient_ids, job.content_type, total=1, unread=1)
+    record_change(entity_settings, job.entity_name, recipient_ids)
+
+    staged.delete()
+
+
+def run_send_job(job_id: Any) -> SendJob:
+    """Run the pending chunks of given send job, each in its own transaction, retrying
+    failed ones up to the configured number of attempts. Then update the job's status.
+    """
+    job: SendJob = SendJob.objects.select_related("content_type").get(pk=job_id)
+    entity_settings = app_settings[job.entity_name]
+
+    runnable_chunks = job.chunks.filter(
+        Q(status=SendJob.Status.PENDING)
+        | Q(
+            status=SendJob.Status.FAILED,
+            attempts__lt=entity_settings.SEND_JOB_MAX_ATTEMPTS,
+        )
+    ).order_by("id")
+
+    while True:
+        chunk = None
+        try:
+            with transaction.atomic():
+                # Let concurrent workers run different chunks, where supported.
+                chunk = runnable_chunks.select_for_update(
+                    skip_locked=connection.features.has_select_for_update_skip_locked
+                ).first()
+                if chunk is None:
+                    break
+
+                _run_chunk(job, chunk)
+
+                chunk.status = SendJob.Status.DONE
+                chunk.attempts += 1
+                chunk.save(update_fields=["status", "attempts"])
+        except Exception as error:
+            if chunk is None:
+                raise
+
+            SendJobChunk.objects.filter(pk=chunk.pk).update(
+                status=SendJob.Status.FAILED,
+                attempts=F("attempts") + 1,
+                error=repr(error),
+            )
+
+    statuses = set(job.chunks.values_list("status", flat=True))
+    if statuses <= {SendJob.Status.DONE}:
+        job.status = SendJob.Status.DONE
+        record_change(entity_settings, job.entity_name, [job.sender_id])
+    elif not runnable_chunks.exists():
+        job.status = SendJob.Status.FAILED
+    else:
+        return job
+
+    job.finished_on = timezone.now()
+    job.save(update_fields=["status", "finished_on"])
+
+    return job
+
+
+def run_pending_send_jobs() -> int:
+    """Run all of the pending send jobs.
+
+    Returns:
+        The number of jobs run
+    """
+    job_ids = list(
+        SendJob.objects.filter(status=SendJob.Status.PENDING)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    for job_id in job_ids:
+        run_send_job(job_id)
+
+    return len(job_ids)
+
+
+def _run_in_thread(job_id: Any) -> None:
+    try:
+        run_send_job(job_id)
+    finally:
+        connections.close_all()
+
+
+def run_in_thread_pool(job: SendJob) -> None:
+    """Send job executor running the job in an in-process thread pool, once the
+    current transaction is committed.
+    """
+    global _thread_pool
+
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=THREAD_POOL_SIZE, thread_name_prefix="sendables"
+        )
+    pool = _thread_pool
+
+    transaction.on_commit(lambda: pool.submit(_run_in_thread, job.pk))
+
+
+def run_in_worker(job: SendJob) -> None:
+    """Send job executor leaving the job for the worker command
+    (`sendables_run_send_jobs`) to run.
+    """
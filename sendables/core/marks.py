@@ -0,0 +1,220 @@
+import atexit
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, transaction
+from django.db.models import Case, Q, Value, When
+from django.utils import timezone
+
+from sendables.core.counters import add_to_counters, lock_by_type
+from sendables.core.models import ReceivedSendable
+from sendables.core.settings import app_settings
+from sendables.core.versions import record_change
+from sendables.core.watermarks import recipient_read_state_filter
+
+logger = logging.getLogger(__name__)
+
+# Marks waiting to be flushed, as entity name, to recipient id, to received sendable
+# id, to the read state it was last marked as.
+_pending: defaultdict[str, defaultdict[Any, dict[int, bool]]] = defaultdict(
+    lambda: defaultdict(dict)
+)
+_pending_lock = threading.Lock()
+
+# Held while flushing, for reads to wait for marks being flushed by another thread.
+_flush_lock = threading.Lock()
+
+_timer: threading.Timer | None = None
+_is_exit_registered = False
+
+
+def _schedule_flush(interval: float) -> None:
+    """Start the timer flushing the pending marks after given seconds, unless
+    already started. Called holding the pending marks lock.
+    """
+    global _timer
+
+    if _timer is None:
+        _timer = threading.Timer(interval, _flush_in_thread)
+        _timer.daemon = True
+        _timer.start()
+
+
+def buffer_marks(
+    entity_name: str, recipient_id: Any, received_ids: Iterable[int], is_read: bool
+) -> None:
+    """Keep given received sendables' marking, to be flushed along with the rest of
+    the pending marks, once the buffer gets full, or after the configured interval.
+
+    Later marks of the same received sendable replace the earlier ones.
+    """
+    global _is_exit_registered
+
+    entity_settings = app_settings[entity_name]
+
+    with _pending_lock:
+        marks = _pending[entity_name][recipient_id]
+        marks.update(dict.fromkeys(received_ids, is_read))
+
+        is_full = (
+            sum(len(marks) for marks in _pending[entity_name].values())
+            >= entity_settings.MARK_BUFFER_SIZE
+        )
+
+        if not is_full:
+            _schedule_flush(entity_settings.MARK_BUFFER_INTERVAL)
+
+        # Flush whatever is left, on shutdown.
+        if not _is_exit_registered:
+            atexit.register(flush_marks)
+            _is_exit_registered = True
+
+    if is_full:
+        flush_marks(entity_names=[entity_name])
+
+
+def _restore_marks(
+    flushed: dict[str, dict[Any, dict[int, bool]]], entity_names: Iterable[str]
+) -> None:
+    """Put the marks of given entity types back among the pending ones, after failing
+    to flush them, without replacing any marks of the same received sendables made in
+    the meantime, and have them flushed again later.
+    """
+    with _pending_lock:
+        for entity_name in entity_names:
+            for recipient_id, marks in flushed[entity_name].items():
+                pending_marks = _pending[entity_name][recipient_id]
+                for received_id, is_read in marks.items():
+                    pending_marks.setdefault(received_id, is_read)
+
+            _schedule_flush(app_settings[entity_name].MARK_BUFFER_INTERVAL)
+
+
+def flush_marks(
+    recipient: Any = None, entity_names: Iterable[str] | None = None
+) -> int:
+    """Apply the pending marks, optionally only the ones of given recipient and/or of
+    given entity types, in a single UPDATE statement per entity type.
+
+    If applying fails, the marks not applied are kept pending.
+
+    Returns:
+        The number of changed received sendables
+    """
+    global _timer
+
+    recipient_id = None if recipient is None else recipient.pk
+
+    with _flush_lock:
+        # Entity name, to recipient id, to received sendable id, to read state
+        flushed: dict[str, dict[Any, dict[int, bool]]] = {}
+
+        with _pending_lock:
+            for entity_name in list(entity_names or _pending):
+                marks_by_recipient = _pending.get(entity_name)
+                if not marks_by_recipient:
+                    continue
+
+                if recipient_id is None:
+                    flushed[entity_name] = dict(_pending.pop(entity_name))
+                elif recipient_id in marks_by_recipient:
+                    flushed[entity_name] = {
+                        recipient_id: marks_by_recipient.pop(recipient_id)
+                    }
+
+            # Nothing left for the timer to flush.
+            if not any(_pending.values()) and _timer is not None:
+                _timer.cancel()
+                _timer = None
+
+        count = 0
+        unapplied = list(flushed)
+        for entity_name, entity_marks in flushed.items():
+            marks = {}
+            for recipient_marks in entity_marks.values():
+                marks.update(recipient_marks)
+
+            try:
+                count += apply_marks(entity_name, marks, list(entity_marks))
+            except Exception:
+                _restore_marks(flushed, unapplied)
+                raise
+
+            unapplied.remove(entity_name)
+
+        return count
+
+
+def apply_marks(
+    entity_name: str, marks: dict[int, bool], recipient_ids: list[Any]
+) -> int:
+    """Set the read state of given received sendables, given as received sendable id,
+    to read state mapping, changing only the ones that do not already count as marked
+    so, in a single UPDATE statement.
+
+    Returns:
+        The number of changed received sendables
+    """
+    entity_settings = app_settings[entity_name]
+
+    read_ids = [received_id for received_id, is_read in marks.items() if is_read]
+    unread_ids = [received_id for received_id, is_read in marks.items() if not is_read]
+
+    if entity_settings.READ_WATERMARK:
+        read_filter = recipient_read_state_filter(True)
+        unread_filter = recipient_read_state_filter(False)
+    else:
+        read_filter = Q(is_read=True)
+        unread_filter = Q(is_read=False)
+
+    to_read = Q(unread_filter, id__in=read_ids)
+    to_unread = Q(read_filter, id__in=unread_ids)
+    changed_items = ReceivedSendable.objects.filter(
+        to_read | to_unread, deleted_by_recipient=False
+    )
+
+    with transaction.atomic():
+        if entity_settings.MAINTAIN_COUNTERS:
+            # Lock the ones to change before counting them, so that concurrent
+            # markings of the same ones are counted once.
+            changed_ids = []
+            for condition, sign in (to_read, -1), (to_unread, 1):
+                locked_ids, groups = lock_by_type(
+                    ReceivedSendable.objects.filter(
+                        condition, deleted_by_recipient=False
+                    )
+                )
+                changed_ids += locked_ids
+                for group in groups:
+                    add_to_counters(
+                        [group["recipient"]],
+                        ContentType.objects.get_for_id(group["content_type"]),
+                        unread=sign * group["total"],
+                    )
+            changed_items = ReceivedSendable.objects.filter(id__in=changed_ids)
+
+        count = changed_items.update(
+            is_read=Case(When(id__in=read_ids, then=Value(True)), default=Value(False)),
+            marked_on=timezone.now(),
+        )
+        if count:
+            record_change(entity_settings, entity_name, recipient_ids)
+
+    return int(count)
+
+
+def _flush_in_thread() -> None:
+    global _timer
+
+    with _pending_lock:
+        _timer = None
+
+    try:
+        flush_marks()
+    except Exception:
+        logger.exception("Flushing the pending marks failed.")
+    finally:
+        connections.close_all()
@@ -1,15 +1,50 @@
+import functools
+import itertools
 import re
-from typing import Any, Callable, cast
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Sequence, cast
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import QuerySet
+from django.core.exceptions import FieldError, ValidationError
+from django.db.models import Exists, OuterRef, QuerySet, prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from rest_framework.pagination import BasePagination
 from rest_framework.permissions import BasePermission
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
+from rest_framework.response import Response
 
+from sendables.core.broadcasts import deliver_broadcasts
+from sendables.core.caching import get_cached_response
+from sendables.core.marks import flush_marks
 from sendables.core.models import ReceivedSendable
+from sendables.core.policies.filter import (
+    filter_recipients,
+    filter_sendables,
+    get_recipients_query_params,
+    get_sendables_query_params,
+)
+from sendables.core.projection import (
+    attach_sendables,
+    fetch_sendables,
+    split_lookups,
+    unique,
+)
 from sendables.core.settings import Settings, app_settings
-from sendables.core.types import Configured, GenericViewProtocol
+from sendables.core.types import Configured, FilterType, GenericViewProtocol
+from sendables.core.utils import (
+    compile_filters,
+    get_generic_related_query_name,
+    prefix_filters,
+)
+from sendables.core.versions import get_version, make_etag
+from sendables.core.watermarks import (
+    get_read_watermark,
+    order_by_read_state,
+    read_state_filter,
+)
 
 
 class PermissionsMixin(GenericViewProtocol):
@@ -45,17 +80,73 @@ class ContextMixin(PermissionsMixin):
         return context
 
 
+class ConditionalMixin(Configured):
+    """Responds to conditional GET requests with the version stamp of current user's
+    sendables, before running any other query, if so configured.
+    """
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if not self.entity_settings.CONDITIONAL_REQUESTS:
+            return cast(
+                Response, super().get(request, *args, **kwargs)  # type: ignore[misc]
+            )
+
+        Sendable = self.entity_settings.SENDABLE_CLASS
+        content_type = ContentType.objects.get_for_model(Sendable)
+
+        version, modified_on = get_version(
+            request.user, content_type, self.entity_settings.ALLOW_BROADCASTS
+        )
+        etag = make_etag(request, version)
+        last_modified = None if modified_on is None else int(modified_on.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)  # type: ignore[misc]
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+
+        # Have clients revalidate on every request.
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return cast(Response, response)
+
+
+class CacheMixin(Configured):
+    """Serves responses out of a per-user cache, if so configured."""
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        get_response = functools.partial(
+            super().get, request, *args, **kwargs  # type: ignore[misc]
+        )
+        if self.entity_settings.RESPONSE_CACHE is None:
+            return cast(Response, get_response())
+
+        return cast(
+            Response,
+            get_cached_response(
+                self.entity_settings,
+                self.entity_name,
+                request,
+                self.__class__.__name__,
+                get_response,
+            ),
+        )
+
+
 class FilterMixin(Configured):
-    def get_filtered_ids(
+    def get_filtered(
         self,
         queryset: QuerySet,
         filter_function: (
             Callable[[Request, QuerySet, Settings], QuerySet] | None
         ) = None,
     ) -> QuerySet:
-        """Apply appropriate filter function to given QuerySet and return the resulting
-        id values.
-        """
+        """Apply appropriate filter function to given QuerySet."""
         if filter_function is None:
             filter_function = (
                 self.get_view_setting("FILTER_SENDABLES")
@@ -67,58 +158,294 @@ class FilterMixin(Configured):
                 queryset,
                 self.entity_settings,
             )
-        return cast(QuerySet, queryset.values("id"))
+        return queryset
+
+    def get_stock_filter_spec(
+        self, filter_function: Callable
+    ) -> tuple[Callable[[Request], dict[str, list[str]]], dict[str, FilterType]] | None:
+        """If given filter function is a stock one, get the query parameter getter and
+        the filter type mapping it uses.
+        """
+        if filter_function is filter_sendables:
+            return (
+                get_sendables_query_params,
+                self.entity_settings.FILTER_FIELDS_SENDABLES,
+            )
 
-    def get_search_filters(
+        if filter_function is filter_recipients:
+            return (
+                get_recipients_query_params,
+                self.entity_settings.FILTER_FIELDS_RECIPIENTS,
+            )
+
+        return None
+
+    def filter_by_related(
         self,
-        foreign_key_name: str,
         queryset: QuerySet,
+        key_name: str,
+        related_queryset: QuerySet,
         filter_function: (
             Callable[[Request, QuerySet, Settings], QuerySet] | None
         ) = None,
-    ) -> dict[str, QuerySet]:
-        """Return "foreign key in" lookup dict, if applied filters narrow down the given
-        QuerySet. If it remains intact, return empty dict.
+        relation_name: str | None = None,
+    ) -> QuerySet:
+        """Keep the records of given QuerySet whose related record, referenced by given
+        key field, passes the appropriate filter function.
+
+        The filter is applied, within the same SQL statement, as one of:
+        1. A join through given (single-valued) relation, if any, for stock filter
+           functions
+        2. An EXISTS correlated subquery on the related records, for stock filter
+           functions, if there is no such relation
+        3. An IN subquery of the ids of the related records returned by the filter
+           function, for any other filter function
+
+        If no filters apply, the given QuerySet itself is returned, without
+        constructing any subquery.
+        """
+        if filter_function is None:
+            filter_function = (
+                self.get_view_setting("FILTER_SENDABLES")
+                or self.entity_settings.FILTER_SENDABLES
+            )
+        if filter_function is None:
+            return queryset
+
+        request = self.request  # type: ignore[attr-defined]
+
+        if (spec := self.get_stock_filter_spec(filter_function)) is None:
+            filtered = filter_function(request, related_queryset, self.entity_settings)
+            if filtered is related_queryset or not filtered.query.where:
+                return queryset
+
+            return queryset.filter(**{f"{key_name}__in": filtered.values("pk")})
+
+        get_query_params, filter_type_mapping = spec
+        compiled_filters = compile_filters(filter_type_mapping)
+
+        if not (selected := compiled_filters.select(get_query_params(request))):
+            return queryset
+
+        filters = compiled_filters.build(selected, related_queryset.model)
+        if not filters:
+            return queryset
+
+        try:
+            # Resolve the lookups against the related model first, for any invalid
+            # field or value to be caught.
+            related_queryset = related_queryset.filter(filters)
+        except (FieldError, ValidationError):
+            return queryset.none()
+
+        if relation_name is not None:
+            return queryset.filter(prefix_filters(filters, relation_name + "__"))
+
+        return queryset.filter(Exists(related_queryset.filter(pk=OuterRef(key_name))))
+
+
+class ProjectionMixin(Configured):
+    """Fetches records as dicts holding only the columns chosen by the projection
+    setting, instead of as model instances.
+    """
+
+    projection_setting = "PROJECTION_RECEIVED"
+
+    def get_projection(self) -> list[str] | None:
+        """Get the projection lookups, if a projection function is set."""
+        if not hasattr(self, "_projection"):
+            function = getattr(self.entity_settings, self.projection_setting)
+            self._projection = (
+                None if function is None else function(self.entity_settings)
+            )
+
+        return self._projection
+
+    def project_received(self, queryset: QuerySet) -> QuerySet:
+        """Make given received sendable references be fetched as dicts of their
+        projected columns, along with the columns needed for ordering them.
         """
-        filtered_ids = self.get_filtered_ids(queryset, filter_function)
+        lookups = self.get_projection()
+        if lookups is None:
+            return queryset
 
-        if filtered_ids.query.where:
-            return {f"{foreign_key_name}__in": filtered_ids}
+        self.projected_received = True
 
-        return {}
+        own_lookups, _ = split_lookups(lookups)
+        ordering = [
+            field_name.lstrip("-")
+            for field_name in queryset.query.order_by
+            if isinstance(field_name, str)
+        ]
 
+        # Fetch the time the read state was last set too, for the read watermark.
+        if self.entity_settings.READ_WATERMARK:
+            own_lookups = [*own_lookups, "marked_on"]
 
-class RetrieveReceivedMixin(ContextMixin, FilterMixin):
-    """Provides QuerySet of current user's received sendable references, along with
-    their respective sendable records.
+        return cast(
+            QuerySet,
+            queryset.prefetch_related(None).values(
+                *unique(["id", "object_id", *ordering, *own_lookups])
+            ),
+        )
+
+    def attach_received_sendables(
+        self, rows: Iterable[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Fetch the projected sendable data of given received sendable references,
+        in a single query, and attach it to them.
+        """
+        rows = list(rows)
+        _, sendable_lookups = split_lookups(cast(list[str], self.get_projection()))
+
+        sendables_by_id = fetch_sendables(
+            self.entity_settings.SENDABLE_CLASS,
+            {row["object_id"] for row in rows},
+            sendable_lookups,
+        )
+        return attach_sendables(rows, sendables_by_id)
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> Any:
+        if args and getattr(self, "projected_received", False):
+            instance, *rest = args
+            if kwargs.get("many"):
+                instance = self.attach_received_sendables(instance)
+            else:
+                (instance,) = self.attach_received_sendables([instance])
+            args = (instance, *rest)
+
+        return super().get_serializer(*args, **kwargs)  # type: ignore[misc]
+
+
+class ReadStateMixin(ContextMixin):
+    """Flushes current user's pending marks, and provides their read watermark to
+    serializers, for the read state of received sendables to be shown accordingly.
+    """
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+
+        # Have the user see their own buffered marks.
+        if self.entity_settings.BUFFER_MARKS:
+            flush_marks(request.user, [self.entity_name])
+
+    def get_read_before(self) -> datetime | None:
+        """Get current user's read watermark, if enabled, fetching it once."""
+        if not hasattr(self, "_read_before"):
+            self._read_before = get_read_watermark(
+                self.entity_settings, self.request.user  # type: ignore[attr-defined]
+            )
+
+        return self._read_before
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        context = super().get_serializer_context()
+        context["read_before"] = self.get_read_before()
+
+        return context
+
+
+class FilterReceivedMixin(ReadStateMixin, FilterMixin):
+    """Provides QuerySet of current user's received sendable references, passing the
+    filters.
     """
 
     filters: dict[str, bool] = {}
 
-    def get_queryset(self) -> QuerySet:
+    def get_received(self) -> QuerySet:
+        """Deliver any pending broadcasts, then get current user's received sendable
+        references, passing the view's own filters, unordered.
+        """
         Sendable = self.entity_settings.SENDABLE_CLASS
 
-        search_sendables_filters = self.get_search_filters(
-            "object_id", Sendable.objects.all()
-        )
+        user = self.request.user  # type: ignore[attr-defined]
+        deliver_broadcasts(user, self.entity_settings)
+
         content_type = ContentType.objects.get_for_model(Sendable)
 
+        # Filter by the read state the read watermark results in, if any.
+        filters = dict(self.filters)
+        conditions = []
+        if "is_read" in filters:
+            conditions.append(
+                read_state_filter(filters.pop("is_read"), self.get_read_before())
+            )
+
+        return ReceivedSendable.objects.filter(
+            *conditions,
+            recipient=user,
+            content_type=content_type,
+            deleted_by_recipient=False,
+            **filters,
+        )
+
+    def filter_received(self, queryset: QuerySet) -> QuerySet:
+        """Keep the received sendable references of given QuerySet whose sendables
+        pass the filters.
+        """
+        Sendable = self.entity_settings.SENDABLE_CLASS
+
+        # Join to the sendables for filtering, if they define a query name for that.
+        return self.filter_by_related(
+            queryset,
+            "object_id",
+            Sendable.objects.all(),
+            relation_name=get_generic_related_query_name(Sendable, ReceivedSendable),
+        )
+
+    def get_filtered_received(self) -> QuerySet:
+        """Get current user's received sendable references, passing all of the
+        filters, unordered.
+        """
+        return self.filter_received(self.get_received())
+
+
+class SelectAllMixin(FilterReceivedMixin):
+    """Provides current user's received sendable references that pass the list
+    filters to serializers, as the items to act upon.
+    """
+
+    def get_view_setting(self, setting_type: str) -> Any:
+        # Filter the way the list view does.
+        if setting_type == "FILTER_SENDABLES":
+            return self.entity_settings.LIST_FILTER_SENDABLES
+
+        return super().get_view_setting(setting_type)
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        context = super().get_serializer_context()
+
+        received = self.get_received()
+        context["queryset"] = self.filter_received(received)
+        context["is_filtered"] = context["queryset"] is not received
+
+        return context
+
+
+class RetrieveReceivedMixin(FilterReceivedMixin, ProjectionMixin):
+    """Provides QuerySet of current user's received sendable references, along with
+    their respective sendable records.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        Sendable = self.entity_settings.SENDABLE_CLASS
         prefetch_fields = self.entity_settings.GET_RECEIVED_PREFETCH_FIELDS(Sendable)
 
-        # With the sendable Model not being tied down/known beforehand, there is no
-        # guarantee there is a GenericRelation on it, so .prefetch_related() cannot be
-        # called with a Prefetch() of "sendable" and a QuerySet ordered by `sent_on` or
-        # any other field. Therefore, do the sorting in Python.
+        results = self.get_filtered_received().prefetch_related(*prefetch_fields)
 
-        results = ReceivedSendable.objects.filter(
-            recipient=self.request.user,  # type: ignore[attr-defined]
-            content_type=content_type,
-            **self.filters,
-            **search_sendables_filters,
-        ).prefetch_related(*prefetch_fields)
+        if (sort_key := self.entity_settings.SORT_RECEIVED_KEY) is not None:
+            # With the sendable Model not being tied down/known beforehand, there is no
+            # guarantee there is a GenericRelation on it, so .prefetch_related() cannot
+            # be called with a Prefetch() of "sendable" and a QuerySet ordered by any
+            # of its fields. Therefore, a custom sorting key means sorting in Python.
+            return cast(QuerySet, sorted(results, key=sort_key))
 
-        return cast(
-            QuerySet, sorted(results, key=self.entity_settings.SORT_RECEIVED_KEY)
+        # Otherwise, order by the sort columns copied onto the received sendable
+        # references, so that ordering (and slicing, when paginated) is done in SQL.
+        return self.project_received(
+            order_by_read_state(
+                results, self.entity_settings.ORDERING_RECEIVED, self.get_read_before()
+            )
         )
 
 
@@ -142,3 +469,77 @@ class PaginatedMixin(Configured):
                 self._paginator = view_pagination_class()
 
         return self._paginator
+
+
+class StreamingMixin(Configured):
+    """Streams unpaginated lists as JSON arrays, fetching their records in chunks."""
+
+    def is_streamed(self) -> bool:
+        """Whether the response is going to be streamed."""
+        return (
+            self.paginator is None  # type: ignore[attr-defined]
+            and bool(self.entity_settings.STREAM_CHUNK_SIZE)
+            and isinstance(
+                self.request.accepted_renderer,  # type: ignore[attr-defined]
+                JSONRenderer,
+            )
+        )
+
+    def get_chunks(self, queryset: QuerySet | Sequence) -> Iterator[Sequence]:
+        """Split given records into chunks, prefetching related records per chunk."""
+        chunk_size = self.entity_settings.STREAM_CHUNK_SIZE
+
+        if not isinstance(queryset, QuerySet):
+            for start in range(0, len(queryset), chunk_size):
+                yield queryset[start : start + chunk_size]
+            return
+
+        lookups = queryset._prefetch_related_lookups  # type: ignore[attr-defined]
+        records = queryset.prefetch_related(None).iterator(chunk_size=chunk_size)
+
+        while chunk := list(itertools.islice(records, chunk_size)):
+            prefetch_related_objects(chunk, *lookups)
+            yield chunk
+
+    def serialize_chunk(self, chunk: Sequence) -> Any:
+        return self.get_serializer(chunk, many=True).data  # type: ignore[attr-defined]
+
+    def get_streaming_response(
+        self, queryset: QuerySet | Sequence
+    ) -> StreamingHttpResponse:
+        """Render the serialized chunks of given records one by one, as parts of a
+        single JSON array.
+        """
+        request = self.request  # type: ignore[attr-defined]
+        renderer = request.accepted_renderer
+        renderer_context = self.get_renderer_context()  # type: ignore[attr-defined]
+
+        def render() -> Iterator[bytes]:
+            yield b"["
+            separator = b""
+
+            for chunk in self.get_chunks(queryset):
+                content = renderer.render(
+                    self.serialize_chunk(chunk),
+                    request.accepted_media_type,
+                    renderer_context,
+                )
+                # Strip the brackets of the rendered chunk array.
+                if items := content.strip()[1:-1].strip():
+                    yield separator + items
+                    separator = b","
+
+            yield b"]"
+
+        return StreamingHttpResponse(render(), content_type=renderer.media_type)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if self.is_streamed():
+            queryset = self.filter_queryset(  # type: ignore[attr-defined]
+                self.get_queryset()  # type: ignore[attr-defined]
+            )
+            return cast(Response, self.get_streaming_response(queryset))
+
+        return cast(
+            Response, super().list(request, *args, **kwargs)  # type: ignore[misc]
+        )
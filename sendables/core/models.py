@@ -1,29 +1,75 @@
+from typing import Any, cast
+
 from django.conf import settings
-from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 
 from sendables.core.types import ManagedModel
 from sendables.core.utils import conditionally_concrete
 
 
-@conditionally_concrete
-class Sendable(ManagedModel, models.Model):
-    content = models.TextField()
-    is_removed = models.BooleanField(
+class ReceivedSendable(ManagedModel, models.Model):
+    """Reference to some sendable, in a user's inbox (their own "copy")."""
+
+    is_read = models.BooleanField(default=False)
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    sendable = GenericForeignKey()
+    sent_on = models.DateTimeField(
+        null=True,
+        help_text="Copy of the sendable's sent on value, used for ordering in SQL.",
+    )
+    marked_on = models.DateTimeField(
+        null=True,
+        default=timezone.now,
+        help_text="When the read state was last set, on delivery or by marking.",
+    )
+    deleted_by_recipient = models.BooleanField(
         default=False,
-        help_text="Whether the sendable is marked as deleted from its sender's outbox.",
+        help_text=(
+            "Whether it is deleted from its recipient's inbox, while kept as "
+            "sent-to info (unified storage), or until purged (soft deletion)."
+        ),
+    )
+    visible_to_sender = models.BooleanField(
+        default=True,
+        help_text=(
+            "Whether it is shown as sent-to info in its sender's outbox "
+            "(unified storage only)."
+        ),
     )
-    sent_on = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        abstract = True
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+            models.Index(fields=["recipient", "content_type", "is_read", "sent_on"]),
+        ]
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # Copy the sort columns of the sendable, if not given.
+        if self.sent_on is None and self.object_id is not None:
+            self.sent_on = cast("Sendable", self.sendable).sent_on
 
-class ReceivedSendable(ManagedModel, models.Model):
-    """Reference to some sendable, in a user's inbox (their own "copy")."""
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        # Count the new reference to the sendable. Bulk inserts count their own.
+        if adding:
+            model_class = self.content_type.model_class()
+            cast(Any, model_class).objects.filter(pk=self.object_id).update(
+                remaining_recipients=models.F("remaining_recipients") + 1
+            )
+
+
+class RecipientSendableAssociation(ManagedModel, models.Model):
+    """Connection between recipient and sendable sent to them (who a sendable
+    was sent to).
+    """
 
-    is_read = models.BooleanField(default=False)
     recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField()
@@ -33,15 +79,170 @@ class ReceivedSendable(ManagedModel, models.Model):
         indexes = [models.Index(fields=["content_type", "object_id"])]
 
 
-class RecipientSendableAssociation(ManagedModel, models.Model):
-    """Connection between recipient and sendable sent to them (who a sendable
-    was sent to).
+class ReceivedSendableCounter(ManagedModel, models.Model):
+    """Counts of a user's received sendables of some type."""
+
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    total = models.IntegerField(default=0)
+    unread = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [["recipient", "content_type"]]
+
+
+class ReadWatermark(ManagedModel, models.Model):
+    """Time before which a user's received sendables of some type count as read,
+    unless marked otherwise since.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    read_before = models.DateTimeField()
+
+    class Meta:
+        unique_together = [["user", "content_type"]]
+
+
+class SendableVersion(ManagedModel, models.Model):
+    """Version stamp of a user's sendables of some type, changed whenever their inbox
+    or outbox changes.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    version = models.BigIntegerField(default=0)
+    modified_on = models.DateTimeField(null=True)
+
+    class Meta:
+        unique_together = [["user", "content_type"]]
+
+
+class Broadcast(ManagedModel, models.Model):
+    """Sendable sent to a whole audience, stored once. It gets delivered to each
+    user's inbox the first time they retrieve their sendables after it was sent.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    sendable = GenericForeignKey()
+    group = models.ForeignKey(
+        Group,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        help_text="Group whose members the sendable is sent to, or all users if null.",
+    )
+    sent_on = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=["content_type", "id"])]
+
+
+class BroadcastCursor(ManagedModel, models.Model):
+    """Last broadcast of some type delivered to a user's inbox."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    last_broadcast_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = [["user", "content_type"]]
+
+
+class CleanupCursor(ManagedModel, models.Model):
+    """Last sendable of some type checked for being left hanging, by the background
+    cleanup, to resume from.
     """
 
+    content_type = models.OneToOneField(ContentType, on_delete=models.CASCADE)
+    last_sendable_id = models.BigIntegerField(default=0)
+
+
+class SendJob(ManagedModel, models.Model):
+    """Fan-out of a sendable to its recipients, run in chunks in the background."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        DONE = "done"
+        FAILED = "failed"
+
+    entity_name = models.CharField(max_length=100)
+    sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    sendable = GenericForeignKey()
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+    finished_on = models.DateTimeField(null=True)
+
+
+class SendJobChunk(ManagedModel, models.Model):
+    """Part of a send job, covering a range of its staged recipients."""
+
+    job = models.ForeignKey(SendJob, on_delete=models.CASCADE, related_name="chunks")
+    first_id = models.BigIntegerField(help_text="First staged recipient record id.")
+    last_id = models.BigIntegerField(help_text="Last staged recipient record id.")
+    size = models.PositiveIntegerField()
+    status = models.CharField(
+        max_length=10, choices=SendJob.Status.choices, default=SendJob.Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+
+
+class SendJobRecipient(ManagedModel, models.Model):
+    """Recipient of a send job, staged until their chunk is run."""
+
+    job = models.ForeignKey(SendJob, on_delete=models.CASCADE)
     recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+
+
+class SendCallback(ManagedModel, models.Model):
+    """Pending invocation of the post-send callbacks for a sendable, stored along with
+    the sending and drained by a worker.
+    """
+
+    entity_name = models.CharField(max_length=100)
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField()
     sendable = GenericForeignKey()
+    created_on = models.DateTimeField(auto_now_add=True)
+
+
+class SearchEntry(ManagedModel, models.Model):
+    """Text of a sendable's field, kept in the full-text search index."""
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    field_name = models.CharField(max_length=100)
+    document = models.TextField()
 
     class Meta:
         indexes = [models.Index(fields=["content_type", "object_id"])]
+
+
+@conditionally_concrete
+class Sendable(ManagedModel, models.Model):
+    content = models.TextField()
+    is_removed = models.BooleanField(
+        default=False,
+        help_text="Whether the sendable is marked as deleted from its sender's outbox.",
+    )
+    sent_on = models.DateTimeField(auto_now_add=True)
+    remaining_recipients = models.PositiveIntegerField(
+        default=0,
+        help_text=(
+            'Number of inbox "copies" of the sendable not deleted by their '
+            "recipients."
+        ),
+    )
+    recipient_associations = GenericRelation(RecipientSendableAssociation)
+    received_sendables = GenericRelation(
+        ReceivedSendable, related_query_name="%(app_label)s_%(class)s"
+    )
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,272 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Sequence
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _get_value(item: Any, field_name: str) -> Any:
+    """Get value of a (possibly double underscore separated) field of given record."""
+    for part in field_name.split("__"):
+        if isinstance(item, Mapping):
+            item = item[part]
+        else:
+            item = getattr(item, part)
+
+    return item
+
+
+def _as_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    return str(value)
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination using the full composite sort key of the paginated QuerySet.
+
+    The position of a page is kept in an opaque cursor holding the sort key values of
+    its boundary record, and the next page is selected with a filter on those values
+    instead of an offset. Thus, every page costs the same regardless of its depth, and
+    records added while browsing do not cause others to be skipped or repeated.
+
+    The QuerySet must be ordered in SQL, by concrete fields. If its ordering does not
+    end with the primary key, the primary key is appended to it, as a tiebreaker.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = "Invalid cursor"
+
+    # Client can control the page size using this query parameter.
+    page_size_query_param: str | None = None
+
+    # Upper limit of the page size the client may request.
+    max_page_size: int | None = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list | None:
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        if not isinstance(queryset, QuerySet):
+            raise ImproperlyConfigured(
+                "Keyset pagination requires the records to be ordered in SQL."
+            )
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+
+        position, reverse = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [self._reverse(field_name) for field_name in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(
+                    self.get_position_filter(ordering, position, queryset)
+                )
+            except (ValidationError, TypeError, ValueError):
+                # Values not fit for the fields, out of a tampered cursor.
+                raise NotFound(self.invalid_cursor_message)
+
+        # Fetch an extra record, to find out whether there are more in this direction.
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        page = results[: self.page_size]
+
+        if reverse:
+            page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = page
+        return page
+
+    def get_page_size(self, request: Request) -> int | None:
+        if self.page_size_query_param:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+            except (KeyError, ValueError):
+                pass
+            else:
+                if page_size > 0:
+                    if self.max_page_size:
+                        return min(page_size, self.max_page_size)
+                    return page_size
+
+        return self.page_size
+
+    def get_ordering(self, queryset: QuerySet) -> list[str]:
+        """Get the QuerySet's ordering, ending with the primary key."""
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+
+        if not all(isinstance(field_name, str) for field_name in ordering):
+            raise ImproperlyConfigured(
+                "Keyset pagination requires ordering by field names only."
+            )
+
+        pk_names = {"pk", queryset.model._meta.pk.name}
+        if not any(field_name.lstrip("-") in pk_names for field_name in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+
+        return ordering
+
+    @staticmethod
+    def _reverse(field_name: str) -> str:
+        if field_name.startswith("-"):
+            return field_name[1:]
+
+        return "-" + field_name
+
+    def get_position_filter(
+        self, ordering: list[str], position: Sequence, queryset: QuerySet
+    ) -> Q:
+        """Build filter selecting records of given QuerySet that come after given
+        position.
+
+        For ordering fields `f1, f2, ..., fn` and position values `v1, v2, ..., vn`,
+        that is `f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...`, using "less than" instead,
+        for fields of descending order. NULL values are placed where the database
+        sorts them.
+        """
+        if len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        nulls_order_largest = connections[queryset.db].features.nulls_order_largest
+
+        result = Q()
+        equal_so_far = Q()
+
+        for field_name, value in zip(ordering, position):
+            name = field_name.lstrip("-")
+            descending = field_name.startswith("-")
+            operator = "lt" if descending else "gt"
+
+            # Whether NULL values come after all others, in this direction.
+            nulls_after = nulls_order_largest != descending
+            is_nullable = self._is_nullable(queryset.model, name)
+
+            if value is None:
+                if nulls_after:
+                    after: Q | None = None
+                else:
+                    after = Q(**{f"{name}__isnull": False})
+                equal = Q(**{f"{name}__isnull": True})
+            else:
+                after = Q(**{f"{name}__{operator}": value})
+                if nulls_after and is_nullable:
+                    after |= Q(**{f"{name}__isnull": True})
+                equal = Q(**{name: value})
+
+            if after is not None:
+                result |= equal_so_far & after
+            equal_so_far &= equal
+
+        # Nothing comes after the very last position.
+        return result if result else Q(pk__in=[])
+
+    @staticmethod
+    def _is_nullable(model: type[Model], name: str) -> bool:
+        try:
+            return bool(getattr(model._meta.get_field(name), "null", True))
+        except FieldDoesNotExist:
+            # An annotation, or a lookup through relations.
+            return True
+
+    def decode_cursor(self, request: Request) -> tuple[list | None, bool]:
+        """Get the position and direction held by the request's cursor, if any."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            position = data["p"]
+            reverse = bool(data.get("r", False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or not all(
+            value is None or isinstance(value, (bool, int, float, str))
+            for value in position
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def encode_cursor(self, item: Any, reverse: bool) -> str:
+        """Get URL of the page starting after the given record."""
+        position = [
+            _as_cursor_value(_get_value(item, field_name.lstrip("-")))
+            for field_name in self.ordering
+        ]
+        data: dict[str, Any] = {"p": position}
+        if reverse:
+            data["r"] = True
+
+        encoded = urlsafe_b64encode(json.dumps(data).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
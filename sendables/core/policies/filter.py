@@ -5,6 +5,31 @@ from sendables.core.settings import Settings
 from sendables.core.utils import filter_queryset
 
 
+def get_sendables_query_params(request: Request) -> dict[str, list[str]]:
+    """Get the URL query parameters used to filter sendables.
+
+    Keep only query parameters whose name does not start with "recipient_".
+    """
+    return {
+        key: request.query_params.getlist(key)
+        for key in request.query_params
+        if not key.startswith("recipient_")
+    }
+
+
+def get_recipients_query_params(request: Request) -> dict[str, list[str]]:
+    """Get the URL query parameters used to filter recipients.
+
+    Keep only query parameters whose name starts with "recipient_", without that
+    prefix.
+    """
+    return {
+        key[10:]: request.query_params.getlist(key)
+        for key in request.query_params
+        if key.startswith("recipient_")
+    }
+
+
 def filter_sendables(
     request: Request, sendables: QuerySet, entity_settings: Settings
 ) -> QuerySet:
@@ -18,14 +43,10 @@ def filter_sendables(
     Returns:
         The filtered sendables QuerySet
     """
-    # Keep only query parameters whose name does not start with "recipient_".
-    query_params_sendables = {
-        key: request.query_params.getlist(key)
-        for key in request.query_params
-        if not key.startswith("recipient_")
-    }
     return filter_queryset(
-        query_params_sendables, sendables, entity_settings.FILTER_FIELDS_SENDABLES
+        get_sendables_query_params(request),
+        sendables,
+        entity_settings.FILTER_FIELDS_SENDABLES,
     )
 
 
@@ -42,13 +63,8 @@ def filter_recipients(
     Returns:
         The filtered users QuerySet
     """
-    # Keep only query parameters whose name starts with "recipient_". Pass them down
-    # without that prefix.
-    query_params_recipients = {
-        key[10:]: request.query_params.getlist(key)
-        for key in request.query_params
-        if key.startswith("recipient_")
-    }
     return filter_queryset(
-        query_params_recipients, users, entity_settings.FILTER_FIELDS_RECIPIENTS
+        get_recipients_query_params(request),
+        users,
+        entity_settings.FILTER_FIELDS_RECIPIENTS,
     )
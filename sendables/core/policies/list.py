@@ -5,6 +5,8 @@ from sendables.core.models import (
     RecipientSendableAssociation,
     Sendable,
 )
+from sendables.core.projection import unique
+from sendables.core.settings import Settings
 from sendables.core.types import ManagedModel
 
 
@@ -28,6 +30,55 @@ def get_received_prefetch_fields(sendable_class: type[ManagedModel]) -> list[str
     return result
 
 
+def get_received_projection(entity_settings: Settings) -> list[str]:
+    """Provide the columns of received sendables to serialize, in received sendable
+    list and detail views.
+
+    Pick `id` and `is_read` of the received sendable reference, `content` and `sent_on`
+    of the sendable, and if there is a `sender` field on the sendable, the sender's
+    unique key and username.
+
+    Args:
+        entity_settings: The Settings object for current entity
+
+    Returns:
+        The chosen lookups, relative to the received sendable reference
+    """
+    result = ["id", "is_read", "sendable__content", "sendable__sent_on"]
+
+    if hasattr(entity_settings.SENDABLE_CLASS, "sender"):
+        key_name = entity_settings.PARTICIPANT_KEY_NAME
+        result += [f"sendable__sender__{key_name}", "sendable__sender__username"]
+
+    return unique(result)
+
+
+def get_sent_projection(entity_settings: Settings) -> list[str]:
+    """Provide the columns of sent sendables to serialize, in sent sendable list and
+    detail views.
+
+    Pick `id`, `content` and `sent_on` of the sendable, and the recipient's unique key
+    and username.
+
+    Args:
+        entity_settings: The Settings object for current entity
+
+    Returns:
+        The chosen lookups, relative to the recipient-sendable association
+    """
+    key_name = entity_settings.PARTICIPANT_KEY_NAME
+
+    return unique(
+        [
+            "sendable__id",
+            "sendable__content",
+            "sendable__sent_on",
+            f"recipient__{key_name}",
+            "recipient__username",
+        ]
+    )
+
+
 def sort_received_key(received_sendable: ReceivedSendable) -> tuple[bool, float]:
     """Get sorting key for received sendables.
 
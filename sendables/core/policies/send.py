@@ -1,11 +1,13 @@
 from typing import Any
 
 from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldError, ValidationError
 from django.db.models import QuerySet
+from rest_framework import serializers
 from rest_framework.request import Request
 
 from sendables.core.serializers import SendSerializer
-from sendables.core.utils import assert_all_requested_valid
+from sendables.core.utils import assert_all_requested_valid, compile_filters
 
 User = get_user_model()
 
@@ -32,6 +34,12 @@ def get_valid_recipients_lenient(
     filters = {f"{send_serializer.item_key_name}__in": requested_recipient_keys}
     recipients = User.objects.filter(**filters)
 
+    return _maybe_exclude_self(request, recipients, send_serializer)
+
+
+def _maybe_exclude_self(
+    request: Request, recipients: QuerySet, send_serializer: SendSerializer
+) -> QuerySet:
     if callable(setting := send_serializer.entity_settings.ALLOW_SEND_TO_SELF):
         allow_send_to_self = setting(request)
     else:
@@ -71,3 +79,47 @@ def get_valid_recipients_strict(
     assert_all_requested_valid(requested_recipient_keys, recipients, send_serializer)
 
     return recipients
+
+
+def get_audience_recipients(
+    request: Request,
+    audience: dict[str, list[str]],
+    send_serializer: SendSerializer,
+    *args: Any,
+    **kwargs: Any,
+) -> QuerySet:
+    """Method of choosing valid recipients, out of an audience specification.
+
+    Filter users like recipients are searched (as configured by
+    `FILTER_FIELDS_RECIPIENTS`), possibly excluding current user. The audience is
+    resolved lazily, as a subquery.
+
+    Args:
+        request: The request object
+        audience: Mapping of recipient filter name to a list of its values
+        send_serializer: The "send" action's serializer
+
+    Returns:
+        A QuerySet of eligible recipients
+
+    Raises:
+        ValidationError: If none of the audience filters apply
+    """
+    compiled_filters = compile_filters(
+        send_serializer.entity_settings.FILTER_FIELDS_RECIPIENTS
+    )
+
+    # Never let an empty specification stand for all users.
+    if not (selected := compiled_filters.select(audience)):
+        raise serializers.ValidationError({"audience": "No valid audience filters."})
+
+    try:
+        matching_users = User.objects.filter(compiled_filters.build(selected, User))
+    except (FieldError, ValidationError):
+        recipients = User.objects.none()
+    else:
+        # Select by primary key, for users matching through multi-valued relations
+        # more than once to be included once.
+        recipients = User.objects.filter(pk__in=matching_users.values("pk"))
+
+    return _maybe_exclude_self(request, recipients, send_serializer)
@@ -0,0 +1,82 @@
+from typing import Any, Iterable
+
+from sendables.core.types import ManagedModel
+
+SENDABLE_PREFIX = "sendable__"
+
+
+def unique(names: Iterable[str]) -> list[str]:
+    """Drop repeated names, keeping their first occurrence's order."""
+    return list(dict.fromkeys(names))
+
+
+def split_lookups(lookups: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Split given projection lookups into those of the referencing record and those
+    of the sendable (stripped of their "sendable__" prefix).
+    """
+    own_lookups = []
+    sendable_lookups = []
+
+    for lookup in lookups:
+        if lookup.startswith(SENDABLE_PREFIX):
+            sendable_lookups.append(lookup[len(SENDABLE_PREFIX) :])
+        else:
+            own_lookups.append(lookup)
+
+    return own_lookups, sendable_lookups
+
+
+def nest(row: dict[str, Any]) -> dict[str, Any]:
+    """Turn the double underscore separated keys of given flat row into nested dicts.
+
+    A nested dict whose values are all `None` stands for a missing related record, so
+    it becomes `None` itself.
+    """
+    result: dict[str, Any] = {}
+
+    for key, value in row.items():
+        *parents, name = key.split("__")
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = value
+
+    return _collapse(result)
+
+
+def _collapse(data: dict[str, Any]) -> dict[str, Any]:
+    for key, value in data.items():
+        if isinstance(value, dict):
+            value = _collapse(value)
+            data[key] = None if all(item is None for item in value.values()) else value
+
+    return data
+
+
+def fetch_sendables(
+    sendable_class: type[ManagedModel], ids: Iterable[Any], lookups: Iterable[str]
+) -> dict[Any, dict[str, Any]]:
+    """Fetch the projected columns of given sendables, in a single query.
+
+    Returns:
+        Mapping of sendable id, to nested sendable data
+    """
+    rows = sendable_class.objects.filter(id__in=ids).values(*unique(["id", *lookups]))
+
+    return {row["id"]: nest(row) for row in rows}
+
+
+def attach_sendables(
+    rows: Iterable[dict[str, Any]], sendables_by_id: dict[Any, dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Nest given rows of referencing records (received sendable references or
+    recipient-sendable associations) and attach their sendable data to them.
+    """
+    result = []
+
+    for row in rows:
+        data = nest(row)
+        data["sendable"] = sendables_by_id[row["object_id"]]
+        result.append(data)
+
+    return result
@@ -0,0 +1,198 @@
+import itertools
+from typing import Any, Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import BooleanField, Model, Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from sendables.core.models import SearchEntry
+from sendables.core.settings import Settings
+from sendables.core.types import FilterType
+
+# PostgreSQL text search configuration, used by both the index and the queries.
+SEARCH_CONFIG = "simple"
+
+ENTRY_TABLE = SearchEntry._meta.db_table
+FTS_TABLE = ENTRY_TABLE + "_fts"
+
+_fts5_available: bool | None = None
+
+
+def supports_fulltext(connection: BaseDatabaseWrapper) -> bool:
+    """Whether given database connection can keep a full-text search index."""
+    global _fts5_available
+
+    if connection.vendor == "postgresql":
+        return True
+
+    if connection.vendor != "sqlite":
+        return False
+
+    if _fts5_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            _fts5_available = ("ENABLE_FTS5",) in cursor.fetchall()
+
+    return _fts5_available
+
+
+def _get_write_connection() -> BaseDatabaseWrapper:
+    return connections[router.db_for_write(SearchEntry)]
+
+
+def create_search_index(using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """Create the database objects backing the full-text search index, if missing.
+
+    On SQLite, that is an FTS5 table indexing the search entries' documents, kept in
+    sync by triggers. On PostgreSQL, a GIN index of the documents' `tsvector`.
+    Connected to the `post_migrate` signal.
+    """
+    connection = connections[using]
+
+    if not (
+        supports_fulltext(connection)
+        and ENTRY_TABLE in connection.introspection.table_names()
+    ):
+        return
+
+    if connection.vendor == "sqlite":
+        statements = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"document, content='{ENTRY_TABLE}', content_rowid='id')",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON "
+            f"{ENTRY_TABLE} BEGIN INSERT INTO {FTS_TABLE}(rowid, document) "
+            f"VALUES (new.id, new.document); END",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON "
+            f"{ENTRY_TABLE} BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, "
+            f"document) VALUES ('delete', old.id, old.document); END",
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON "
+            f"{ENTRY_TABLE} BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, "
+            f"document) VALUES ('delete', old.id, old.document); "
+            f"INSERT INTO {FTS_TABLE}(rowid, document) "
+            f"VALUES (new.id, new.document); END",
+        ]
+    else:
+        statements = [
+            f"CREATE INDEX IF NOT EXISTS {ENTRY_TABLE}_document_gin ON {ENTRY_TABLE} "
+            f"USING GIN (to_tsvector('{SEARCH_CONFIG}', document))"
+        ]
+
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def get_fulltext_field_names(entity_settings: Settings) -> list[str]:
+    """Get names of the sendable fields searched in full-text, which are kept in the
+    search index.
+    """
+    return [
+        field_name
+        for field_name, filter_type in entity_settings.FILTER_FIELDS_SENDABLES.items()
+        if filter_type == FilterType.FULLTEXT and "__" not in field_name
+    ]
+
+
+def _as_fts5_query(value: str) -> str:
+    # Match all of the words, as prefixes, with any FTS5 syntax in them escaped.
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in value.split())
+
+
+def get_fulltext_filter(model_class: type[Model], field_name: str, value: str) -> Q:
+    """Build filter selecting records of given model whose given field matches given
+    search terms, using the full-text search index.
+
+    Falls back to a "contains" filter, if the database does not support full-text
+    search or the field is not kept in the index.
+    """
+    connection = connections[router.db_for_read(model_class)]
+
+    if "__" in field_name or not supports_fulltext(connection):
+        return Q(**{field_name + "__icontains": value})
+
+    entries = SearchEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(model_class),
+        field_name=field_name,
+    )
+
+    if connection.vendor == "sqlite":
+        if not (query := _as_fts5_query(value)):
+            return Q()
+
+        entries = entries.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [query]
+            )
+        )
+    else:
+        entries = entries.filter(
+            RawSQL(
+                f"to_tsvector('{SEARCH_CONFIG}', {ENTRY_TABLE}.document) "
+                f"@@ plainto_tsquery('{SEARCH_CONFIG}', %s)",
+                [value],
+                output_field=BooleanField(),
+            )
+        )
+
+    return Q(pk__in=entries.values("object_id"))
+
+
+def index_sendables(entity_settings: Settings, sendables: Iterable[Any]) -> None:
+    """Add the full-text searched fields of given sendables to the search index."""
+    field_names = get_fulltext_field_names(entity_settings)
+    if not field_names or not supports_fulltext(_get_write_connection()):
+        return
+
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+
+    SearchEntry.objects.bulk_create(
+        [
+            SearchEntry(
+                content_type=content_type,
+                object_id=sendable.pk,
+                field_name=field_name,
+                document=str(getattr(sendable, field_name)),
+            )
+            for sendable in sendables
+            for field_name in field_names
+        ],
+        batch_size=1000,
+    )
+
+
+def unindex_sendables(
+    entity_settings: Settings, sendable_ids: QuerySet | Iterable[Any]
+) -> None:
+    """Remove given sendables (which are about to be deleted) from the search index."""
+    if not get_fulltext_field_names(entity_settings) or not supports_fulltext(
+        _get_write_connection()
+    ):
+        return
+
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+
+    SearchEntry.objects.filter(
+        content_type=content_type, object_id__in=sendable_ids
+    ).delete()
+
+
+def rebuild_search_index(entity_settings: Settings, batch_size: int = 1000) -> None:
+    """Recreate the search index entries of the given entity type's sendables, out of
+    the existing sendables.
+    """
+    Sendable = entity_settings.SENDABLE_CLASS
+    content_type = ContentType.objects.get_for_model(Sendable)
+    field_names = get_fulltext_field_names(entity_settings)
+
+    with transaction.atomic():
+        SearchEntry.objects.filter(content_type=content_type).delete()
+
+        sendables = (
+            Sendable.objects.only("id", *field_names)
+            .order_by()
+            .iterator(chunk_size=batch_size)
+        )
+        while batch := list(itertools.islice(sendables, batch_size)):
+            index_sendables(entity_settings, batch)
@@ -1,13 +1,48 @@
+import collections
 import copy
-from typing import Any, Callable
+import itertools
+from typing import Any, Callable, Iterable, cast
 
+from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connections, router, transaction
 from django.db.models import QuerySet
+from django.utils import timezone
 from rest_framework import serializers
-
-from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
-from sendables.core.settings import app_settings
+from rest_framework.fields import get_attribute
+
+from sendables.core.broadcasts import send_broadcast
+from sendables.core.callbacks import has_send_callbacks
+from sendables.core.cleanup import (
+    delete_sendables,
+    deletes_hanging_inline,
+    get_hanging_sendables,
+)
+from sendables.core.counters import (
+    add_to_counters,
+    clear_unread_counters,
+    lock_by_type,
+    subtract_from_counters,
+)
+from sendables.core.fanout import fan_out
+from sendables.core.jobs import create_send_job
+from sendables.core.marks import buffer_marks
+from sendables.core.models import (
+    Broadcast,
+    ReceivedSendable,
+    RecipientSendableAssociation,
+)
+from sendables.core.search import index_sendables, unindex_sendables
+from sendables.core.settings import Settings, app_settings
+from sendables.core.storage import remove_received_references
 from sendables.core.types import ManagedModel
+from sendables.core.versions import record_change
+from sendables.core.watermarks import (
+    get_read_watermark,
+    is_read_by_watermark,
+    read_state_filter,
+    set_read_watermark,
+)
 
 
 class ReceivedSendableSerializer(serializers.Serializer):
@@ -16,6 +51,18 @@ class ReceivedSendableSerializer(serializers.Serializer):
     content = serializers.CharField(source="sendable.content")
     sent_on = serializers.DateTimeField(source="sendable.sent_on")
 
+    def to_representation(self, instance: Any) -> dict[str, Any]:
+        data: dict[str, Any] = super().to_representation(instance)
+
+        # Count it as read if its read state was last set before the read watermark.
+        read_before = self.context.get("read_before")
+        if read_before is not None and data.get("is_read") is False:
+            data["is_read"] = is_read_by_watermark(
+                get_attribute(instance, ["marked_on"]), read_before
+            )
+
+        return data
+
 
 class ContainerSerializer(serializers.Serializer):
     """Contains a `ListField` of certain-typed items."""
@@ -33,6 +80,10 @@ class ContainerSerializer(serializers.Serializer):
         self.entity_name = self.context["entity_name"]
         self.entity_settings = app_settings[self.entity_name]
 
+    def record_change(self, user_ids: Iterable[Any]) -> None:
+        """Record that given users' sendables of current type changed."""
+        record_change(self.entity_settings, self.entity_name, user_ids)
+
     @property
     def items_field_name(self) -> str:
         """Exposed name of the `ListField`."""
@@ -56,19 +107,47 @@ class ContainerSerializer(serializers.Serializer):
             self.user_role,
             **self.removal_filters,
         )
-        if not self.valid_items:
+        # Fetch only the keys, rather than whole records.
+        valid_keys = list(self.valid_items.values_list(self.item_key_name, flat=True))
+        if not valid_keys:
             raise serializers.ValidationError(
                 {self.items_field_name: f"No valid {self.item_entity_name}s."}
             )
 
-        data[self.items_field_name] = [
-            getattr(item, self.item_key_name) for item in self.valid_items
-        ]
+        data[self.items_field_name] = valid_keys
         return data
 
 
-class SendSerializer(ContainerSerializer):
-    """Creates and dispatches sendables to recipients."""
+class SentFieldsMixin(serializers.Serializer):
+    """Contains the fields of the sendable to be sent."""
+
+    entity_settings: Settings
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """Dynamically add any desired fields from the detail serializer."""
+        fields = super().get_fields()
+
+        # Make a detail serializer instance and copy desired fields.
+        detail_serializer = self.entity_settings.DETAIL_SERIALIZER_CLASS(
+            context=self.context
+        )
+        for field_name in self.entity_settings.SENT_FIELD_NAMES:
+            fields[field_name] = copy.deepcopy(detail_serializer[field_name]._field)
+
+        return fields
+
+    def get_sent_fields(self, data: dict[str, Any] | None = None) -> dict[str, Any]:
+        if data is None:
+            data = self.validated_data
+
+        return {
+            field_name: data["sendable"][field_name]
+            for field_name in self.entity_settings.SENT_FIELD_NAMES
+        }
+
+
+class RecipientsSerializer(ContainerSerializer):
+    """Contains requested recipient keys."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -79,50 +158,339 @@ class SendSerializer(ContainerSerializer):
         self.item_key_type = settings.PARTICIPANT_KEY_TYPE
         self.get_valid_items = settings.GET_VALID_RECIPIENTS
 
+
+class SendSerializer(SentFieldsMixin, RecipientsSerializer):
+    """Creates and dispatches sendables to recipients."""
+
+    job_id = serializers.IntegerField(read_only=True)
+
+    @property
+    def allow_audience(self) -> bool:
+        """Whether recipients may be targeted by filters, rather than by keys."""
+        if callable(setting := self.entity_settings.ALLOW_AUDIENCE_SEND):
+            return bool(setting(self.context["request"]))
+
+        return bool(setting)
+
     def get_fields(self) -> dict[str, serializers.Field]:
-        """Dynamically add any desired fields from the detail serializer."""
+        """Add the audience field, if allowed, making the recipients field optional."""
         fields = super().get_fields()
 
-        # Make a detail serializer instance and copy desired fields.
-        detail_serializer = self.entity_settings.DETAIL_SERIALIZER_CLASS(
-            context=self.context
-        )
-        for field_name in self.entity_settings.SENT_FIELD_NAMES:
-            fields[field_name] = copy.deepcopy(detail_serializer[field_name]._field)
+        if self.allow_audience:
+            fields[self.items_field_name].required = False
+            fields["audience"] = serializers.DictField(
+                child=serializers.ListField(child=serializers.CharField()),
+                required=False,
+                allow_empty=False,
+            )
 
         return fields
 
+    def to_internal_value(self, data: Any) -> dict[str, Any]:
+        # Accept single audience filter values, as well as lists of them.
+        if self.allow_audience and isinstance(audience := data.get("audience"), dict):
+            data = {
+                **data,
+                "audience": {
+                    key: value if isinstance(value, list) else [value]
+                    for key, value in audience.items()
+                },
+            }
+
+        return cast(dict[str, Any], super().to_internal_value(data))
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Keep only valid recipients, picked either by key or by audience filters.
+        Fail if there are none.
+        """
+        if "audience" not in data:
+            if self.items_field_name not in data:
+                raise serializers.ValidationError(
+                    {self.items_field_name: "This field is required."}
+                )
+            return super().validate(data)
+
+        if self.items_field_name in data:
+            raise serializers.ValidationError(
+                f"Specify either `{self.items_field_name}` or `audience`, not both."
+            )
+
+        # Keep the audience as a query, to be fed straight into the fan-out.
+        self.valid_items = self.entity_settings.GET_AUDIENCE_RECIPIENTS(
+            self.context["request"], data["audience"], self
+        )
+        if not self.valid_items.exists():
+            raise serializers.ValidationError({"audience": "No valid recipients."})
+
+        return data
+
+    def count_recipients(self) -> int:
+        """Count the valid recipients, using their fetched keys when available."""
+        if self.items_field_name in self.validated_data:
+            return len(self.validated_data[self.items_field_name])
+
+        return int(self.valid_items.count())
+
+    @transaction.atomic
     def save(self, **kwargs: Any) -> None:
-        """Create new sendable data and invoke any post-send callbacks.
+        """Create new sendable data and dispatch any post-send callbacks.
 
         Store the following:
         1. The sendable itself (content and anything else)
         2. Per-recipient references (users' inbox "copies")
         3. Sendable-recipient associations ("sent to who" info)
+        4. Recipients' counters, if maintained
+        5. Search index entries, if any fields are searched in full-text
+        6. Version stamps and cached responses of the recipients and the sender,
+           if needed
+
+        If there are more recipients than the configured threshold, leave the
+        per-recipient steps to a background job.
         """
-        sent_fields = {
-            field_name: self.validated_data["sendable"][field_name]
-            for field_name in self.entity_settings.SENT_FIELD_NAMES
-        }
+        sent_fields = self.get_sent_fields()
 
         Sendable = self.entity_settings.SENDABLE_CLASS
         sendable = Sendable(**sent_fields, **kwargs)
         sendable.save()
 
-        sent_copies = [
-            ReceivedSendable(recipient=user, sendable=sendable)
-            for user in self.valid_items
-        ]
-        ReceivedSendable.objects.bulk_create(sent_copies)
+        content_type = ContentType.objects.get_for_model(Sendable)
+        request = self.context["request"]
+
+        threshold = self.entity_settings.SEND_JOB_THRESHOLD
+        if threshold is not None and self.count_recipients() > threshold:
+            # Leave steps 2 to 4 and 6 to a job running in the background.
+            job = create_send_job(
+                self.entity_name, sendable, self.valid_items, request.user
+            )
+            self.validated_data["job_id"] = job.pk
+
+            index_sendables(self.entity_settings, [sendable])
+
+        else:
+            # Insert straight from the recipients' query, then fetch only their ids,
+            # if needed for the counters, version stamps or cached responses.
+            fan_out(
+                sendable,
+                content_type,
+                self.valid_items,
+                self.entity_settings.UNIFIED_STORAGE,
+            )
+            recipient_ids = self.valid_items.values_list("pk", flat=True)
+
+            if self.entity_settings.MAINTAIN_COUNTERS:
+                add_to_counters(recipient_ids, content_type, total=1, unread=1)
+
+            index_sendables(self.entity_settings, [sendable])
 
-        associations = [
-            RecipientSendableAssociation(recipient=user, sendable=sendable)
-            for user in self.valid_items
+            self.record_change(itertools.chain([request.user.pk], recipient_ids))
+
+        if has_send_callbacks(self.entity_settings):
+            self.entity_settings.SEND_CALLBACK_DISPATCHER(
+                self.entity_name, request, sendable, sent_fields, self.valid_items
+            )
+
+
+class SendBatchItemSerializer(SentFieldsMixin, RecipientsSerializer):
+    """Contains a sendable of a batch, along with its requested recipients."""
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        # Recipients are validated for the whole batch at once.
+        return data
+
+
+class SendBatchSerializer(serializers.Serializer):
+    """Creates and dispatches many sendables, each to its own recipients, at once."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.entity_name = self.context["entity_name"]
+        self.entity_settings = app_settings[self.entity_name]
+
+    @property
+    def items_field_name(self) -> str:
+        """Exposed name of the list of sendables."""
+        return f"{self.entity_name}s"
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        fields = super().get_fields()
+
+        fields[self.items_field_name] = SendBatchItemSerializer(
+            many=True,
+            allow_empty=False,
+            max_length=self.entity_settings.SEND_BATCH_MAX_SIZE,
+            context=self.context,
+        )
+        return fields
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Validate the recipients of all of the sendables with a single query. Keep
+        only valid ones. Fail if any sendable has none.
+        """
+        items = data[self.items_field_name]
+        item_serializer = cast(
+            SendBatchItemSerializer,
+            cast(serializers.ListSerializer, self.fields[self.items_field_name]).child,
+        )
+        recipients_field_name = item_serializer.items_field_name
+
+        requested_keys = list(
+            dict.fromkeys(
+                itertools.chain.from_iterable(
+                    item[recipients_field_name] for item in items
+                )
+            )
+        )
+        self.valid_items = self.entity_settings.GET_VALID_RECIPIENTS(
+            self.context["request"], requested_keys, item_serializer
+        )
+        key_to_id = dict(
+            self.valid_items.values_list(item_serializer.item_key_name, "pk")
+        )
+
+        self.recipient_ids = []
+        for index, item in enumerate(items):
+            valid_keys = [
+                key
+                for key in dict.fromkeys(item[recipients_field_name])
+                if key in key_to_id
+            ]
+            if not valid_keys:
+                raise serializers.ValidationError(
+                    {self.items_field_name: f"No valid recipients for item {index}."}
+                )
+
+            item[recipients_field_name] = valid_keys
+            self.recipient_ids.append([key_to_id[key] for key in valid_keys])
+
+        return data
+
+    @transaction.atomic
+    def save(self, **kwargs: Any) -> None:
+        """Create the data of all of the sendables in bulk, and invoke any post-batch
+        callbacks.
+
+        Store the same data as a single send does, with one statement per kind of data
+        for the whole batch, where possible.
+        """
+        Sendable = self.entity_settings.SENDABLE_CLASS
+        content_type = ContentType.objects.get_for_model(Sendable)
+        request = self.context["request"]
+
+        item_serializer = cast(
+            serializers.ListSerializer, self.fields[self.items_field_name]
+        ).child
+        sent_fields_list = [
+            cast(SentFieldsMixin, item_serializer).get_sent_fields(item)
+            for item in self.validated_data[self.items_field_name]
         ]
-        RecipientSendableAssociation.objects.bulk_create(associations)
+        sendables: list[Any] = [
+            Sendable(
+                **sent_fields,
+                **kwargs,
+                remaining_recipients=len(recipient_ids),
+            )
+            for sent_fields, recipient_ids in zip(sent_fields_list, self.recipient_ids)
+        ]
+        connection = connections[router.db_for_write(Sendable)]
+        if connection.features.can_return_rows_from_bulk_insert:
+            Sendable.objects.bulk_create(sendables)
+        else:
+            # The primary keys would not be set, otherwise.
+            for sendable in sendables:
+                sendable.save()
+
+        received_sendables = []
+        associations = []
+        recipient_counts: collections.Counter = collections.Counter()
+        for sendable, recipient_ids in zip(sendables, self.recipient_ids):
+            for recipient_id in recipient_ids:
+                received_sendables.append(
+                    ReceivedSendable(
+                        recipient_id=recipient_id,
+                        content_type=content_type,
+                        object_id=sendable.pk,
+                        sent_on=sendable.sent_on,
+                    )
+                )
+                associations.append(
+                    RecipientSendableAssociation(
+                        recipient_id=recipient_id,
+                        content_type=content_type,
+                        object_id=sendable.pk,
+                    )
+                )
+            recipient_counts.update(recipient_ids)
+
+        ReceivedSendable.objects.bulk_create(received_sendables)
+        if not self.entity_settings.UNIFIED_STORAGE:
+            RecipientSendableAssociation.objects.bulk_create(associations)
+
+        if self.entity_settings.MAINTAIN_COUNTERS:
+            # Recipients that got the same number of sendables share an update.
+            recipients_by_count = collections.defaultdict(list)
+            for recipient_id, count in recipient_counts.items():
+                recipients_by_count[count].append(recipient_id)
+
+            for count, recipient_ids in recipients_by_count.items():
+                add_to_counters(recipient_ids, content_type, total=count, unread=count)
+
+        index_sendables(self.entity_settings, sendables)
+
+        record_change(
+            self.entity_settings,
+            self.entity_name,
+            [request.user.pk, *recipient_counts],
+        )
+
+        batch = list(zip(sent_fields_list, self.recipient_ids))
+        for callback in self.entity_settings.AFTER_SEND_BATCH_CALLBACKS:
+            callback(request, batch)
 
-        for callback in self.entity_settings.AFTER_SEND_CALLBACKS:
-            callback(self.context["request"], sent_fields, self.valid_items)
+
+class BroadcastSerializer(SentFieldsMixin):
+    """Creates sendables and broadcasts them to all users, or to the members of a
+    group.
+    """
+
+    group = serializers.PrimaryKeyRelatedField(
+        queryset=Group.objects.all(), required=False, allow_null=True
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.entity_name = self.context["entity_name"]
+        self.entity_settings = app_settings[self.entity_name]
+
+    @transaction.atomic
+    def save(self, **kwargs: Any) -> None:
+        """Create new sendable data, once for its whole audience.
+
+        Store the following:
+        1. The sendable itself (content and anything else)
+        2. The broadcast record, to deliver it to each user's inbox on retrieval
+        3. Search index entries, if any fields are searched in full-text
+        """
+        Sendable = self.entity_settings.SENDABLE_CLASS
+        sendable = Sendable(**self.get_sent_fields(), **kwargs)
+        sendable.save()
+
+        send_broadcast(
+            self.entity_settings,
+            self.entity_name,
+            sendable,
+            self.validated_data.get("group"),
+        )
+
+        index_sendables(self.entity_settings, [sendable])
+
+
+class SendJobSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.CharField()
+    total = serializers.IntegerField()
+    sent = serializers.IntegerField()
+    created_on = serializers.DateTimeField()
+    finished_on = serializers.DateTimeField()
 
 
 class SelectSerializer(ContainerSerializer):
@@ -130,6 +498,7 @@ class SelectSerializer(ContainerSerializer):
 
     item_type: type[ManagedModel] = ReceivedSendable
     user_role = "recipient"
+    removal_filters = {"deleted_by_recipient": False}
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -144,51 +513,175 @@ class SelectSerializer(ContainerSerializer):
 class MarkSerializer(SelectSerializer):
     """Marks selected received sendables as read/unread."""
 
-    def mark(self, is_read: bool) -> None:
-        self.valid_items.update(is_read=is_read)
+    def mark(self, is_read: bool) -> int:
+        """Mark the selected received sendables, right away or, if so configured, by
+        buffering the marking, to be flushed along with others.
 
+        Returns:
+            The number of changed (or buffered) received sendables
+        """
+        if not self.entity_settings.BUFFER_MARKS:
+            return self.update_read_state(is_read)
 
-class DeleteSerializer(SelectSerializer):
-    """Deletes selected received sendables."""
+        received_ids = list(self.valid_items.values_list("id", flat=True))
+        buffer_marks(
+            self.entity_name, self.context["request"].user.pk, received_ids, is_read
+        )
 
-    def delete(self) -> None:
-        sendable_ids_set = set(self.valid_items.values_list("id", flat=True))
+        return len(received_ids)
+
+    @transaction.atomic
+    def update_read_state(self, is_read: bool) -> int:
+        """Mark the selected received sendables, without fetching them, other than
+        their ids, if counted.
+
+        Returns:
+            The number of changed received sendables
+        """
+        # Only update the ones that do not already count as marked so.
+        read_before = get_read_watermark(
+            self.entity_settings, self.context["request"].user
+        )
+        changed_items = self.valid_items.filter(
+            read_state_filter(not is_read, read_before)
+        )
+
+        if self.entity_settings.MAINTAIN_COUNTERS:
+            # Lock the ones to change before counting them, so that concurrent
+            # markings of the same ones are counted once.
+            changed_ids, groups = lock_by_type(changed_items)
+            for group in groups:
+                add_to_counters(
+                    [group["recipient"]],
+                    ContentType.objects.get_for_id(group["content_type"]),
+                    unread=-group["total"] if is_read else group["total"],
+                )
+            changed_items = ReceivedSendable.objects.filter(id__in=changed_ids)
 
-        # Delete inbox "copies".
-        self.valid_items.delete()
+        count = changed_items.update(is_read=is_read, marked_on=timezone.now())
+        if count:
+            self.record_change([self.context["request"].user.pk])
 
-        if not self.entity_settings.DELETE_HANGING_SENDABLES:
-            return
+        return count
 
+
+class DeleteSerializer(SelectSerializer):
+    """Deletes selected received sendables."""
+
+    @transaction.atomic
+    def delete(self) -> int:
+        """Delete the selected received sendables, without fetching them.
+
+        Returns:
+            The number of deleted received sendables
+        """
         Sendable = self.entity_settings.SENDABLE_CLASS
         content_type = ContentType.objects.get_for_model(Sendable)
+        selected_items = self.valid_items.filter(content_type=content_type)
+
+        # Count the references to be deleted, each sendable's row being locked until
+        # the transaction ends, so that concurrent deletions are applied one by one.
+        remove_received_references(Sendable, selected_items)
+
+        # Read under the lock, the sendables of the selected inbox "copies" left
+        # hanging: those marked as removed from their senders' outboxes, which have
+        # no recipients left.
+        ids_for_deleting = []
+        if (
+            deletes_hanging_inline(self.entity_settings)
+            and not self.entity_settings.SOFT_DELETE_RECEIVED
+        ):
+            ids_for_deleting = list(
+                get_hanging_sendables(self.entity_settings)
+                .filter(id__in=selected_items.values("object_id"))
+                .values_list("id", flat=True)
+            )
 
-        # Now that the received sendable references are deleted, those of their
-        # respective sendables which are marked as removed from their senders'
-        # outboxes, are no longer needed. Find the unreferenced ones by selecting
-        # all referenced sendables, then get those of the queried ones that are not
-        # in that set.
+        if self.entity_settings.MAINTAIN_COUNTERS:
+            read_before = get_read_watermark(
+                self.entity_settings, self.context["request"].user
+            )
+            subtract_from_counters(
+                self.valid_items, read_state_filter(False, read_before)
+            )
 
-        referenced_sendable_ids = ReceivedSendable.objects.filter(
-            content_type=content_type
-        ).values("object_id")
+        if self.entity_settings.SOFT_DELETE_RECEIVED:
+            # Hide inbox "copies" from their recipients, until purged.
+            count = self.valid_items.update(deleted_by_recipient=True)
+        elif self.entity_settings.UNIFIED_STORAGE:
+            # Delete inbox "copies" no longer needed as sent-to info, and hide the
+            # rest from their recipients.
+            count, _ = self.valid_items.filter(visible_to_sender=False).delete()
+            count += self.valid_items.update(deleted_by_recipient=True)
+        else:
+            # Delete inbox "copies".
+            count, _ = self.valid_items.delete()
 
-        sendable_ids = Sendable.objects.filter(id__in=sendable_ids_set).values("id")
+        self.record_change([self.context["request"].user.pk])
 
-        unreferenced_sendable_ids = sendable_ids.difference(referenced_sendable_ids)
+        # Now that the received sendable references are deleted, the hanging
+        # sendables are no longer needed. Delete them, along with their
+        # recipient-sendable association records.
+        if ids_for_deleting:
+            delete_sendables(self.entity_settings, ids_for_deleting)
 
-        # Delete unreferenced sendables which are removed from their outboxes,
-        # along with their recipient-sendable association records.
+        return count
 
-        ids_for_deleting = Sendable.objects.filter(
-            id__in=unreferenced_sendable_ids, is_removed=True
-        ).values("id")
 
-        RecipientSendableAssociation.objects.filter(
-            object_id__in=ids_for_deleting, content_type=content_type
-        ).delete()
+class SelectAllSerializer(SelectSerializer):
+    """Contains all of the received sendables given as `queryset` in the context
+    (those passing the list filters), instead of selected ones.
+    """
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        # Take no list of items.
+        return serializers.Serializer.get_fields(self)
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        self.valid_items = self.context["queryset"]
+        return data
+
+
+class MarkAllSerializer(SelectAllSerializer, MarkSerializer):
+    """Marks all of the filtered received sendables as read/unread."""
+
+    @transaction.atomic
+    def mark(self, is_read: bool) -> int:
+        """Mark the filtered received sendables. If marking all of them as read, with
+        read watermarks enabled, only move the watermark.
+
+        Returns:
+            The number of changed received sendables
+        """
+        if (
+            not is_read
+            or not self.entity_settings.READ_WATERMARK
+            or self.context["is_filtered"]
+        ):
+            return self.update_read_state(is_read)
+
+        user = self.context["request"].user
+        read_before = get_read_watermark(self.entity_settings, user)
+        count = int(
+            self.valid_items.filter(read_state_filter(False, read_before)).count()
+        )
+
+        set_read_watermark(self.entity_settings, user)
+
+        if self.entity_settings.MAINTAIN_COUNTERS:
+            clear_unread_counters(
+                user.pk,
+                ContentType.objects.get_for_model(self.entity_settings.SENDABLE_CLASS),
+            )
+
+        if count:
+            self.record_change([user.pk])
 
-        Sendable.objects.filter(id__in=ids_for_deleting).delete()
+        return count
+
+
+class DeleteAllSerializer(SelectAllSerializer, DeleteSerializer):
+    """Deletes all of the filtered received sendables."""
 
 
 class DeleteSentSerializer(SelectSerializer):
@@ -201,30 +694,51 @@ class DeleteSentSerializer(SelectSerializer):
         super().__init__(*args, **kwargs)
         self.item_type = self.entity_settings.SENDABLE_CLASS
 
+    @transaction.atomic
     def delete(self) -> None:
-        if self.entity_settings.DELETE_HANGING_SENDABLES:
-            Sendable = self.entity_settings.SENDABLE_CLASS
-            content_type = ContentType.objects.get_for_model(Sendable)
-
-            sendable_ids = self.valid_items.values("id")
-
-            # Delete recipient-sendable association records.
-            RecipientSendableAssociation.objects.filter(
-                object_id__in=sendable_ids, content_type=content_type
-            ).delete()
-
-            # Mark as removed the queried sendables that are referenced by any inbox
-            # "copies", and delete those that are not.
-
-            referenced_sendable_ids = ReceivedSendable.objects.filter(
-                content_type=content_type
-            ).values("object_id")
+        Sendable = self.entity_settings.SENDABLE_CLASS
+        content_type = ContentType.objects.get_for_model(Sendable)
 
-            ids_for_marking = sendable_ids.intersection(referenced_sendable_ids)
-            ids_for_deleting = sendable_ids.difference(referenced_sendable_ids)
+        # Stop delivering any of them that are broadcast.
+        Broadcast.objects.filter(
+            object_id__in=self.valid_items.values("id"), content_type=content_type
+        ).delete()
 
-            Sendable.objects.filter(id__in=ids_for_marking).update(is_removed=True)
+        if deletes_hanging_inline(self.entity_settings):
+            sendable_ids = list(self.valid_items.values_list("id", flat=True))
+
+            if self.entity_settings.UNIFIED_STORAGE:
+                # Delete inbox "copies" already deleted by their recipients, and
+                # hide the rest from the sender.
+                received_sendables = ReceivedSendable.objects.filter(
+                    object_id__in=sendable_ids, content_type=content_type
+                )
+                received_sendables.filter(deleted_by_recipient=True).delete()
+                received_sendables.update(visible_to_sender=False)
+            else:
+                # Delete recipient-sendable association records.
+                RecipientSendableAssociation.objects.filter(
+                    object_id__in=sendable_ids, content_type=content_type
+                ).delete()
+
+            # Mark the queried sendables as removed, locking them against concurrent
+            # deletions of their inbox "copies", and delete those with no recipients
+            # left.
+
+            sendables = Sendable.objects.filter(id__in=sendable_ids)
+            sendables.update(is_removed=True)
+
+            ids_for_deleting = list(
+                get_hanging_sendables(self.entity_settings)
+                .filter(id__in=sendable_ids)
+                .values_list("id", flat=True)
+            )
+            unindex_sendables(self.entity_settings, ids_for_deleting)
             Sendable.objects.filter(id__in=ids_for_deleting).delete()
 
         else:
+            # Leave the rest to the background cleanup (if deferred), once they are
+            # left hanging.
             self.valid_items.update(is_removed=True)
+
+        self.record_change([self.context["request"].user.pk])
@@ -8,15 +8,27 @@ from sendables.core.types import FilterType, SettingsBase
 
 POSSIBLY_CONCRETE_MODELS: set[type[models.Model]] = set()
 
+MOUNTED_ENTITY_NAMES: list[str] = []
+
 DEFAULTS = {
     # Sending
     "SEND_SERIALIZER_CLASS": "sendables.core.serializers.SendSerializer",
     "ALLOW_SEND_TO_SELF": False,
     "SENT_FIELD_NAMES": ["content"],
+    "SEND_JOB_THRESHOLD": None,
+    "SEND_JOB_CHUNK_SIZE": 10000,
+    "SEND_JOB_MAX_ATTEMPTS": 3,
+    "SEND_JOB_EXECUTOR": "sendables.core.jobs.run_in_thread_pool",
+    "SEND_BATCH_SERIALIZER_CLASS": "sendables.core.serializers.SendBatchSerializer",
+    "SEND_BATCH_MAX_SIZE": 1000,
+    "ALLOW_BROADCASTS": False,
+    "BROADCAST_SERIALIZER_CLASS": "sendables.core.serializers.BroadcastSerializer",
     # Senders/recipients
     "PARTICIPANT_KEY_NAME": "id",
     "PARTICIPANT_KEY_TYPE": "rest_framework.serializers.IntegerField",
     "GET_VALID_RECIPIENTS": "sendables.core.policies.send.get_valid_recipients_lenient",
+    "ALLOW_AUDIENCE_SEND": False,
+    "GET_AUDIENCE_RECIPIENTS": "sendables.core.policies.send.get_audience_recipients",
     # Sendables
     "SENDABLE_CLASS": "sendables.core.models.Sendable",
     "SENDABLE_KEY_NAME": "id",
@@ -25,8 +37,13 @@ DEFAULTS = {
     "LIST_SERIALIZER_CLASS": "sendables.core.serializers.ReceivedSendableSerializer",
     "DETAIL_SERIALIZER_CLASS": "sendables.core.serializers.ReceivedSendableSerializer",
     # Ordering
-    "SORT_RECEIVED_KEY": "sendables.core.policies.list.sort_received_key",
-    "SORT_SENT_KEY": "sendables.core.policies.list.sort_sent_key",
+    "ORDERING_RECEIVED": ["is_read", "-sent_on", "-id"],
+    "SORT_RECEIVED_KEY": None,
+    "ORDERING_SENT": ["-sent_on", "-id"],
+    "SORT_SENT_KEY": None,
+    # Projection
+    "PROJECTION_RECEIVED": None,
+    "PROJECTION_SENT": None,
     # Filter functions
     "FILTER_SENDABLES": "sendables.core.policies.filter.filter_sendables",
     "FILTER_RECIPIENTS": "sendables.core.policies.filter.filter_recipients",
@@ -43,18 +60,38 @@ DEFAULTS = {
     },
     # Misc
     "AFTER_SEND_CALLBACKS": [],
+    "AFTER_SEND_BATCH_CALLBACKS": [],
+    "SEND_CALLBACK_DISPATCHER": "sendables.core.callbacks.dispatch_inline",
+    "COALESCE_SEND_CALLBACKS": False,
     "DELETE_HANGING_SENDABLES": True,
+    "SOFT_DELETE_RECEIVED": False,
+    "UNIFIED_STORAGE": False,
+    "MAINTAIN_COUNTERS": False,
+    "READ_WATERMARK": False,
+    "BUFFER_MARKS": False,
+    "MARK_BUFFER_INTERVAL": 0.1,
+    "MARK_BUFFER_SIZE": 1000,
+    "CONDITIONAL_REQUESTS": False,
+    "RESPONSE_CACHE": None,
+    "RESPONSE_CACHE_TIMEOUT": 300,
+    "RESPONSE_CACHE_STALE_TIMEOUT": None,
     "GET_RECEIVED_PREFETCH_FIELDS": (
         "sendables.core.policies.list.get_received_prefetch_fields"
     ),
     "PAGINATION_CLASS": None,
+    "STREAM_CHUNK_SIZE": None,
 }
 
 IMPORT_STRINGS = {
     "SEND_SERIALIZER_CLASS",
+    "SEND_BATCH_SERIALIZER_CLASS",
+    "BROADCAST_SERIALIZER_CLASS",
+    "SEND_JOB_EXECUTOR",
     "ALLOW_SEND_TO_SELF",
     "PARTICIPANT_KEY_TYPE",
     "GET_VALID_RECIPIENTS",
+    "ALLOW_AUDIENCE_SEND",
+    "GET_AUDIENCE_RECIPIENTS",
     "SENDABLE_CLASS",
     "SENDABLE_KEY_TYPE",
     "GET_VALID_ITEMS",
@@ -62,18 +99,28 @@ IMPORT_STRINGS = {
     "DETAIL_SERIALIZER_CLASS",
     "SORT_RECEIVED_KEY",
     "SORT_SENT_KEY",
+    "PROJECTION_RECEIVED",
+    "PROJECTION_SENT",
     "FILTER_SENDABLES",
     "FILTER_RECIPIENTS",
     "AFTER_SEND_CALLBACKS",
+    "AFTER_SEND_BATCH_CALLBACKS",
+    "SEND_CALLBACK_DISPATCHER",
     "GET_RECEIVED_PREFETCH_FIELDS",
     "PAGINATION_CLASS",
 }
 
 PERMISSION_TYPES = [
     "SEND",
+    "SEND_BATCH",
+    "BROADCAST",
+    "SEND_JOB",
     "MARK_AS_READ",
     "MARK_AS_UNREAD",
+    "MARK_ALL_AS_READ",
+    "MARK_ALL_AS_UNREAD",
     "DELETE",
+    "DELETE_ALL",
     "DELETE_SENT",
     "LIST",
     "LIST_READ",
@@ -81,6 +128,8 @@ PERMISSION_TYPES = [
     "LIST_SENT",
     "DETAIL",
     "DETAIL_SENT",
+    "COUNTS",
+    "ALL_COUNTS",
 ]
 
 for permission_type in PERMISSION_TYPES:
@@ -89,6 +138,8 @@ for permission_type in PERMISSION_TYPES:
     DEFAULTS[permission_key] = ["rest_framework.permissions.IsAuthenticated"]
     IMPORT_STRINGS.add(permission_key)
 
+DEFAULTS["BROADCAST_PERMISSIONS"] = ["rest_framework.permissions.IsAdminUser"]
+
 LIST_TYPES = [
     "LIST",
     "LIST_READ",
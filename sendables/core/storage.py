@@ -0,0 +1,86 @@
+import collections
+from typing import Any, Iterable, cast
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F, Model, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+from sendables.core.settings import Settings
+
+
+def get_associations(entity_settings: Settings) -> QuerySet:
+    """Get the records of who sendables were sent to, according to the storage mode.
+
+    In unified storage, the inbox "copies" double as recipient-sendable associations,
+    so those still shown in their senders' outboxes are used.
+    """
+    if entity_settings.UNIFIED_STORAGE:
+        return ReceivedSendable.objects.filter(visible_to_sender=True)
+
+    return RecipientSendableAssociation.objects.all()
+
+
+def add_references(
+    sendable_class: type[Model], sendable_ids: Iterable[int], amount: int = 1
+) -> None:
+    """Add given amount to the remaining recipients of given sendables, once for each
+    time a sendable's id is given. Sendables given the same number of times share an
+    update statement.
+    """
+    ids_by_times = collections.defaultdict(list)
+    for sendable_id, times in collections.Counter(sendable_ids).items():
+        ids_by_times[times].append(sendable_id)
+
+    for times, ids in ids_by_times.items():
+        cast(Any, sendable_class).objects.filter(id__in=ids).update(
+            remaining_recipients=F("remaining_recipients") + amount * times
+        )
+
+
+def remove_references(sendable_class: type[Model], sendable_ids: Iterable[int]) -> None:
+    """Subtract from the remaining recipients of given sendables, once for each time
+    a sendable's id is given.
+    """
+    add_references(sendable_class, sendable_ids, amount=-1)
+
+
+def remove_received_references(
+    sendable_class: type[Model], received_sendables: QuerySet
+) -> None:
+    """Subtract given inbox "copies" (of sendables of given type) from the remaining
+    recipients of their sendables, in a single statement, without fetching them.
+    """
+    counts = (
+        received_sendables.filter(object_id=OuterRef("pk"))
+        .order_by()
+        .values("object_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+
+    cast(Any, sendable_class).objects.filter(
+        id__in=received_sendables.values("object_id")
+    ).update(remaining_recipients=F("remaining_recipients") - Subquery(counts))
+
+
+def rebuild_references(sendable_class: type[Model]) -> None:
+    """Recalculate the remaining recipients of the sendables of given type, out of
+    their existing inbox "copies".
+    """
+    content_type = ContentType.objects.get_for_model(sendable_class)
+    references = (
+        ReceivedSendable.objects.filter(
+            content_type=content_type,
+            object_id=OuterRef("pk"),
+            deleted_by_recipient=False,
+        )
+        .order_by()
+        .values("object_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+
+    cast(Any, sendable_class).objects.update(
+        remaining_recipients=Coalesce(Subquery(references), 0)
+    )
@@ -11,12 +11,15 @@ class FilterType(enum.Enum):
     EQUALS = 0
     CONTAINS = 1
     DATETIME = 2
+    FULLTEXT = 3
+    STARTSWITH = 4
 
 
 if TYPE_CHECKING:
     from sendables.core.settings import Settings
 
     class Configured:
+        entity_name: str
         entity_settings: Settings
         get_view_setting: Callable[[str], Any]
 
@@ -35,7 +38,10 @@ if TYPE_CHECKING:
         DETAIL_SERIALIZER_CLASS: type[serializers.Serializer]
         DETAIL_SENT_SERIALIZER_CLASS: type[serializers.Serializer]
         GET_VALID_RECIPIENTS: Callable[..., models.QuerySet]
+        GET_AUDIENCE_RECIPIENTS: Callable[..., models.QuerySet]
         SEND_SERIALIZER_CLASS: type[serializers.Serializer]
+        SEND_BATCH_SERIALIZER_CLASS: type[serializers.Serializer]
+        BROADCAST_SERIALIZER_CLASS: type[serializers.Serializer]
         SENT_FIELD_NAMES: list[str]
         PAGINATION_CLASS: type[pagination.BasePagination] | None
 
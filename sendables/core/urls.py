@@ -1,7 +1,7 @@
-from django.urls import URLResolver, include, path
+from django.urls import URLPattern, URLResolver, include, path
 
 from sendables.core import views
-from sendables.core.settings import app_settings
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
 from sendables.core.utils import check_direct_model_usage, get_url_arg_type
 
 
@@ -23,6 +23,9 @@ def sendables_path(route: str, entity_name: str = "sendable") -> URLResolver:
 
     check_direct_model_usage(entity_settings)
 
+    if entity_name not in MOUNTED_ENTITY_NAMES:
+        MOUNTED_ENTITY_NAMES.append(entity_name)
+
     detail_key_name = entity_settings.SENDABLE_KEY_NAME
     detail_key_type_internal = entity_settings.SENDABLE_KEY_TYPE
     detail_key_type = get_url_arg_type(detail_key_type_internal)
@@ -32,6 +35,21 @@ def sendables_path(route: str, entity_name: str = "sendable") -> URLResolver:
         include(
             [
                 path("send/", views.SendView.as_view(), name=f"{entity_name}-send"),
+                path(
+                    "send-batch/",
+                    views.SendBatchView.as_view(),
+                    name=f"{entity_name}-send-batch",
+                ),
+                path(
+                    "send-jobs/<int:id>/",
+                    views.SendJobView.as_view(),
+                    name=f"{entity_name}-send-job",
+                ),
+                path(
+                    "broadcast/",
+                    views.BroadcastView.as_view(),
+                    name=f"{entity_name}-broadcast",
+                ),
                 path(
                     "mark-read/",
                     views.MarkAsReadView.as_view(),
@@ -45,6 +63,21 @@ def sendables_path(route: str, entity_name: str = "sendable") -> URLResolver:
                 path(
                     "delete/", views.DeleteView.as_view(), name=f"{entity_name}-delete"
                 ),
+                path(
+                    "mark-all-read/",
+                    views.MarkAllAsReadView.as_view(),
+                    name=f"{entity_name}-mark-all-read",
+                ),
+                path(
+                    "mark-all-unread/",
+                    views.MarkAllAsUnreadView.as_view(),
+                    name=f"{entity_name}-mark-all-unread",
+                ),
+                path(
+                    "delete-all/",
+                    views.DeleteAllView.as_view(),
+                    name=f"{entity_name}-delete-all",
+                ),
                 path(
                     "delete-sent/",
                     views.DeleteSentView.as_view(),
@@ -66,6 +99,11 @@ def sendables_path(route: str, entity_name: str = "sendable") -> URLResolver:
                     views.ListSentView.as_view(),
                     name=f"{entity_name}-list-sent",
                 ),
+                path(
+                    "counts/",
+                    views.CountsView.as_view(),
+                    name=f"{entity_name}-counts",
+                ),
                 path(
                     f"<{detail_key_type}:{detail_key_name}>/",
                     views.DetailView.as_view(),
@@ -80,3 +118,16 @@ def sendables_path(route: str, entity_name: str = "sendable") -> URLResolver:
         ),
         {"entity_name": entity_name},
     )
+
+
+def counts_path(route: str) -> URLPattern:
+    """Generate and return the URL pattern for the counts of all mounted sendable
+    entity types.
+
+    Args:
+        route: The URL path pattern
+
+    Returns:
+        The URL pattern
+    """
+    return path(route, views.AllCountsView.as_view(), name="sendables-counts")
@@ -1,9 +1,12 @@
+import copy
+import functools
 import inspect
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, cast
 
 import django
 from django.conf import settings
+from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import FieldError, ValidationError
 from django.db.models import Model, Q, QuerySet
 from django.db.models.base import ModelBase
@@ -52,6 +55,23 @@ def check_direct_model_usage(entity_settings: Settings) -> None:
     setattr(module, model_class.__name__, concrete_model_class)
 
 
+def get_generic_related_query_name(
+    model_class: type[Model], related_model_class: type[Model]
+) -> str | None:
+    """Get the name that given related model class can query given model class by,
+    if there is a GenericRelation between them defining one.
+    """
+    for field in model_class._meta.private_fields:
+        if (
+            isinstance(field, GenericRelation)
+            and field.related_model is related_model_class
+            and field.remote_field.related_query_name
+        ):
+            return field.remote_field.related_query_name
+
+    return None
+
+
 def get_url_arg_type(serializer_field_type: type[serializers.Field]) -> str:
     """Get URL argument type out of serializer field type."""
     type_mapping = {
@@ -92,6 +112,111 @@ def assert_all_requested_valid(
         raise serializers.ValidationError({serializer.items_field_name: error_message})
 
 
+class CompiledFilters:
+    """Filter type mapping, compiled once, to pick the query parameters it applies to
+    and build their filters.
+    """
+
+    def __init__(self, filter_type_mapping: dict[str, FilterType]) -> None:
+        self.filter_types = dict(filter_type_mapping)
+        self.datetime_fields = {
+            field_key
+            for field_key, filter_type in self.filter_types.items()
+            if filter_type == FilterType.DATETIME
+        }
+
+    def select(
+        self, query_params: dict[str, list[str]]
+    ) -> list[tuple[str, FilterType, list[str]]]:
+        """Pick the query parameters that filters apply to, along with their types."""
+        selected = []
+
+        for filter_key, filter_values in query_params.items():
+            filter_type = self.filter_types.get(filter_key)
+            if filter_type is None:
+                # Try to get a "datetime" filter.
+                if filter_key.split("__")[0] not in self.datetime_fields:
+                    continue
+                filter_type = FilterType.DATETIME
+
+            selected.append((filter_key, filter_type, filter_values))
+
+        return selected
+
+    def build(
+        self,
+        selected: list[tuple[str, FilterType, list[str]]],
+        model_class: type[Model],
+    ) -> Q:
+        """Build the filters of given selected query parameters, for records of given
+        model.
+        """
+        filter_dict: dict[str, Any]
+        filters = Q()
+
+        for filter_key, filter_type, filter_values in selected:
+            # New filter group, joined with "AND" with the other groups.
+            filter_group = Q()
+            for value in filter_values:
+                if filter_type == FilterType.EQUALS:
+                    filter_dict = {filter_key: value}
+                elif filter_type == FilterType.CONTAINS:
+                    filter_dict = {filter_key + "__icontains": value}
+                elif filter_type == FilterType.STARTSWITH:
+                    filter_dict = {filter_key + "__istartswith": value}
+                elif filter_type == FilterType.FULLTEXT:
+                    from sendables.core.search import get_fulltext_filter
+
+                    filter_group |= get_fulltext_filter(model_class, filter_key, value)
+                    continue
+                else:
+                    kwargs = {}
+                    if django.VERSION >= (5, 0) or settings.USE_TZ:
+                        kwargs = {"tz": timezone.utc}
+
+                    try:
+                        datetime_object = datetime.fromtimestamp(float(value), **kwargs)
+                    except ValueError:
+                        continue
+
+                    filter_dict = {filter_key: datetime_object}
+
+                # Different value of same filter key, joined with "OR" with the rest
+                # of the group.
+                filter_group |= Q(**filter_dict)
+
+            filters &= filter_group
+
+        return filters
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_filters(items: tuple[tuple[str, FilterType], ...]) -> CompiledFilters:
+    return CompiledFilters(dict(items))
+
+
+def compile_filters(filter_type_mapping: dict[str, FilterType]) -> CompiledFilters:
+    """Get the compiled form of given filter type mapping, compiling it only once."""
+    return _compile_filters(tuple(filter_type_mapping.items()))
+
+
+def prefix_filters(filters: Q, prefix: str) -> Q:
+    """Make the lookups of given filters relative to a related model, through given
+    prefix.
+    """
+    children: list[Any] = []
+    for child in filters.children:
+        if isinstance(child, Q):
+            children.append(prefix_filters(child, prefix))
+        else:
+            lookup, value = cast(tuple, child)
+            children.append((prefix + lookup, value))
+
+    result = copy.copy(filters)
+    result.children = children
+    return result
+
+
 def filter_queryset(
     query_params: dict[str, list[str]],
     queryset: QuerySet,
@@ -102,8 +227,10 @@ def filter_queryset(
     Filter groups of different field keys are joined with an "AND" between them, while
     filters of the same key are joined with an "OR".
 
-    "Equals" and "contains" filters must be present as-is in the filter type mapping.
-    "Datetime" filters support double underscore querying.
+    "Equals", "contains", "starts with" and "full-text" filters must be present as-is
+    in the filter type mapping. "Datetime" filters support double underscore querying.
+
+    If no query parameters apply, the given QuerySet itself is returned.
 
     Args:
         query_params: Mapping of query parameter name to a list of its values
@@ -113,44 +240,12 @@ def filter_queryset(
     Returns:
         The filtered QuerySet
     """
-    filter_type: FilterType | None
-    filter_dict: dict[str, Any]
-    filters = Q()
-
-    for filter_key, filter_values in query_params.items():
-        try:
-            filter_type = filter_type_mapping[filter_key]
-        except KeyError:
-            # Try to get a "datetime" filter.
-            field_key = filter_key.split("__")[0]
-            field_filter_type = filter_type_mapping.get(field_key)
-            if (filter_type := field_filter_type) != FilterType.DATETIME:
-                continue
-
-        # New filter group, joined with "AND" with the other groups.
-        filter_group = Q()
-        for value in filter_values:
-            if filter_type == FilterType.EQUALS:
-                filter_dict = {filter_key: value}
-            elif filter_type == FilterType.CONTAINS:
-                filter_dict = {filter_key + "__icontains": value}
-            else:
-                kwargs = {}
-                if django.VERSION >= (5, 0) or settings.USE_TZ:
-                    kwargs = {"tz": timezone.utc}
-
-                try:
-                    datetime_object = datetime.fromtimestamp(float(value), **kwargs)
-                except ValueError:
-                    continue
-
-                filter_dict = {filter_key: datetime_object}
+    compiled_filters = compile_filters(filter_type_mapping)
 
-            # Different value of same filter key, joined with "OR" with the rest
-            # of the group.
-            filter_group |= Q(**filter_dict)
+    if not (selected := compiled_filters.select(query_params)):
+        return queryset
 
-        filters &= filter_group
+    filters = compiled_filters.build(selected, queryset.model)
 
     try:
         return queryset.filter(filters)
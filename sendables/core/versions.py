@@ -0,0 +1,97 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, Subquery
+from django.utils import timezone
+from rest_framework.request import Request
+
+from sendables.core.caching import invalidate_responses
+from sendables.core.models import Broadcast, SendableVersion
+from sendables.core.settings import Settings
+
+
+def bump_versions(user_ids: Iterable[Any], content_type: ContentType) -> None:
+    """Change the version stamps of given users' sendables of given type, creating any
+    missing version records first.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+
+    SendableVersion.objects.bulk_create(
+        [
+            SendableVersion(user_id=user_id, content_type=content_type)
+            for user_id in user_ids
+        ],
+        ignore_conflicts=True,
+    )
+    SendableVersion.objects.filter(user__in=user_ids, content_type=content_type).update(
+        version=F("version") + 1, modified_on=timezone.now()
+    )
+
+
+def record_change(
+    entity_settings: Settings, entity_name: str, user_ids: Iterable[Any]
+) -> None:
+    """Record that given users' sendables of given type changed, by changing their
+    version stamps and invalidating their cached responses, as configured.
+    """
+    if (
+        not entity_settings.CONDITIONAL_REQUESTS
+        and entity_settings.RESPONSE_CACHE is None
+    ):
+        return
+
+    user_ids = list(user_ids)
+
+    if entity_settings.CONDITIONAL_REQUESTS:
+        Sendable = entity_settings.SENDABLE_CLASS
+        bump_versions(user_ids, ContentType.objects.get_for_model(Sendable))
+
+    invalidate_responses(entity_settings, entity_name, user_ids)
+
+
+def get_version(
+    user: Any, content_type: ContentType, broadcasts: bool = False
+) -> tuple[str, datetime | None]:
+    """Get the version stamp of given user's sendables of given type, along with the
+    time it last changed, in a single indexed lookup.
+
+    If asked, include the latest broadcast of given type in the stamp.
+    """
+    versions = SendableVersion.objects.filter(user=user, content_type=content_type)
+
+    if not broadcasts:
+        version, modified_on = versions.values_list(
+            "version", "modified_on"
+        ).first() or (0, None)
+        return str(version), modified_on
+
+    # Anchor the subqueries to the (always present) content type row, to get both
+    # stamps in the same query.
+    latest = Broadcast.objects.filter(content_type=content_type).order_by("-id")
+    version, modified_on, broadcast_id, broadcast_on = (
+        ContentType.objects.filter(pk=content_type.pk)
+        .annotate(
+            version=Subquery(versions.values("version")),
+            modified_on=Subquery(versions.values("modified_on")),
+            broadcast_id=Subquery(latest.values("id")[:1]),
+            broadcast_on=Subquery(latest.values("sent_on")[:1]),
+        )
+        .values_list("version", "modified_on", "broadcast_id", "broadcast_on")
+        .get()
+    )
+
+    modified_ons = [time for time in (modified_on, broadcast_on) if time is not None]
+    return f"{version or 0}.{broadcast_id or 0}", max(modified_ons, default=None)
+
+
+def make_etag(request: Request, version: str) -> str:
+    """Make entity tag for the response to given request, out of given version."""
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    media_type = getattr(accepted_renderer, "media_type", "")
+
+    key = f"{request.user.pk}:{version}:{request.get_full_path()}:{media_type}"
+    return '"{}"'.format(hashlib.sha1(key.encode()).hexdigest()[:24])
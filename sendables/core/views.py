@@ -1,24 +1,47 @@
-from typing import Any, cast
+from typing import Any, Sequence, cast
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet, Sum
+from django.db.models.functions import Coalesce
 from rest_framework import exceptions, generics, serializers, status
+from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from sendables.core.broadcasts import deliver_broadcasts
+from sendables.core.counters import get_counts
+from sendables.core.marks import flush_marks
 from sendables.core.mixins import (
+    CacheMixin,
+    ConditionalMixin,
     ContextMixin,
     FilterMixin,
     PaginatedMixin,
+    ProjectionMixin,
+    ReadStateMixin,
     RetrieveReceivedMixin,
+    SelectAllMixin,
+    StreamingMixin,
+)
+from sendables.core.models import ReceivedSendable, SendJob
+from sendables.core.projection import (
+    attach_sendables,
+    fetch_sendables,
+    nest,
+    split_lookups,
+    unique,
 )
-from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
 from sendables.core.serializers import (
+    DeleteAllSerializer,
     DeleteSentSerializer,
     DeleteSerializer,
+    MarkAllSerializer,
     MarkSerializer,
+    SendJobSerializer,
 )
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
+from sendables.core.storage import get_associations
 
 User = get_user_model()
 
@@ -27,6 +50,51 @@ class SendView(ContextMixin, generics.CreateAPIView):
     def get_serializer_class(self) -> type[serializers.Serializer]:
         return self.entity_settings.SEND_SERIALIZER_CLASS
 
+    def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        response = super().create(request, *args, **kwargs)
+
+        # The sending goes on in the background.
+        if "job_id" in response.data:
+            response.status_code = status.HTTP_202_ACCEPTED
+
+        return response
+
+
+class SendBatchView(ContextMixin, generics.CreateAPIView):
+    def get_serializer_class(self) -> type[serializers.Serializer]:
+        return self.entity_settings.SEND_BATCH_SERIALIZER_CLASS
+
+    def get_permissions(self) -> list[BasePermission]:
+        """Require the permissions of sending, as well as of sending in batches."""
+        permissions = super().get_permissions()
+        send_permissions = self.entity_settings.SEND_PERMISSIONS
+
+        return [permission() for permission in send_permissions] + permissions
+
+
+class SendJobView(ContextMixin, generics.RetrieveAPIView):
+    serializer_class = SendJobSerializer
+    lookup_field = "id"
+
+    def get_queryset(self) -> QuerySet:
+        """Get current user's send jobs of current type, along with their progress."""
+        chunk_sizes = Coalesce(Sum("chunks__size"), 0)
+        sent_sizes = Coalesce(
+            Sum("chunks__size", filter=Q(chunks__status=SendJob.Status.DONE)), 0
+        )
+        jobs = SendJob.objects.filter(
+            sender=self.request.user, entity_name=self.entity_name
+        )
+        return cast(QuerySet, jobs.annotate(total=chunk_sizes, sent=sent_sizes))
+
+
+class BroadcastView(ContextMixin, generics.CreateAPIView):
+    def get_serializer_class(self) -> type[serializers.Serializer]:
+        if not self.entity_settings.ALLOW_BROADCASTS:
+            raise exceptions.NotFound
+
+        return self.entity_settings.BROADCAST_SERIALIZER_CLASS
+
 
 class MarkAsReadView(ContextMixin, generics.GenericAPIView):
     serializer_class = MarkSerializer
@@ -55,11 +123,45 @@ class DeleteView(ContextMixin, generics.GenericAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class MarkAllAsReadView(SelectAllMixin, generics.GenericAPIView):
+    serializer_class = MarkAllSerializer
+    is_read = True
+
+    def patch(self, request: Request, **kwargs: Any) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = serializer.mark(is_read=self.is_read)  # type: ignore[attr-defined]
+
+        return Response({"count": count})
+
+
+class MarkAllAsUnreadView(MarkAllAsReadView):
+    is_read = False
+
+
+class DeleteAllView(SelectAllMixin, generics.GenericAPIView):
+    serializer_class = DeleteAllSerializer
+
+    def delete(self, request: Request, **kwargs: Any) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = serializer.delete()  # type: ignore[attr-defined]
+
+        return Response({"count": count})
+
+
 class DeleteSentView(DeleteView):
     serializer_class = DeleteSentSerializer
 
 
-class ListView(PaginatedMixin, RetrieveReceivedMixin, generics.ListAPIView):
+class ListView(
+    ConditionalMixin,
+    CacheMixin,
+    PaginatedMixin,
+    StreamingMixin,
+    RetrieveReceivedMixin,
+    generics.ListAPIView,
+):
     def get_serializer_class(self) -> type[serializers.Serializer]:
         return self.entity_settings.LIST_SERIALIZER_CLASS
 
@@ -72,75 +174,188 @@ class ListUnreadView(ListView):
     filters = {"is_read": False}
 
 
-class ListSentView(PaginatedMixin, ContextMixin, FilterMixin, generics.ListAPIView):
+class ListSentView(
+    ConditionalMixin,
+    CacheMixin,
+    PaginatedMixin,
+    StreamingMixin,
+    ContextMixin,
+    ProjectionMixin,
+    FilterMixin,
+    generics.ListAPIView,
+):
+    projection_setting = "PROJECTION_SENT"
+
     def get_queryset(self) -> QuerySet:
-        """Fetch recipient-sendable association records of sendables
-        sent by current user.
+        """Fetch sendables sent by current user, passing both the "sendable" filters
+        and the "recipient" filters, ordered in SQL.
         """
         Sendable = self.entity_settings.SENDABLE_CLASS
 
         if not hasattr(Sendable, "sender"):
             raise exceptions.NotFound
 
+        # 1. Get user's sent sendables that pass the "sendable" filters.
+        sendables = self.get_filtered(
+            Sendable.objects.filter(sender=self.request.user, is_removed=False)
+        )
+
+        # 2. Keep those sent to any of the queried recipients, by checking for
+        # association records with such recipients in a correlated subquery, which
+        # (unlike a join) yields each sendable once.
         content_type = ContentType.objects.get_for_model(Sendable)
+        associations = get_associations(self.entity_settings).filter(
+            content_type=content_type, object_id=OuterRef("pk")
+        )
+        filtered_associations = self.filter_by_related(
+            associations,
+            "recipient",
+            User.objects.all(),
+            self.entity_settings.FILTER_RECIPIENTS,
+            relation_name="recipient",
+        )
+        if filtered_associations is not associations:
+            sendables = sendables.filter(Exists(filtered_associations))
 
-        # 1. Since there is no guarantee the sendable Model has a GenericRelation,
-        # `sendable__sender` on RecipientSendableAssociation cannot be queried. Fetch
-        # ids of user's sent sendables first, then get their respective associations
-        # along with recipients and sendables.
-        sendables = Sendable.objects.filter(sender=self.request.user, is_removed=False)
-        sendable_ids = self.get_filtered_ids(sendables)
+        sendables = sendables.order_by(*self.entity_settings.ORDERING_SENT)
 
-        filter_recipients_function = self.entity_settings.FILTER_RECIPIENTS
-        search_recipients_filters = self.get_search_filters(
-            "recipient", User.objects.all(), filter_recipients_function
+        # 3. Fetch only the projected columns, if a projection is set.
+        self.projected_sent = (
+            self.get_projection() is not None
+            and self.entity_settings.SORT_SENT_KEY is None
         )
+        if self.projected_sent:
+            _, sendable_lookups = split_lookups(cast(list[str], self.get_projection()))
+            ordering = [
+                field_name.lstrip("-")
+                for field_name in self.entity_settings.ORDERING_SENT
+            ]
+            sendables = sendables.values(*unique(["id", *ordering, *sendable_lookups]))
+
+        return sendables
+
+    def get_associations(
+        self, sendables: QuerySet | Sequence, paginated: bool
+    ) -> list[Any]:
+        """Fetch recipient-sendable association records of given sendables, in their
+        order, along with their recipients. If projected, fetch them as dicts.
+        """
+        Sendable = self.entity_settings.SENDABLE_CLASS
+        content_type = ContentType.objects.get_for_model(Sendable)
 
-        # 2. Get sendables of queried recipients.
-        sendables_with_recipients_ids = RecipientSendableAssociation.objects.filter(
-            content_type=content_type, **search_recipients_filters
-        ).values("object_id")
+        # Sendable id, to sendable (or its data, if projected)
+        if self.projected_sent:
+            sendables_by_id = {row["id"]: nest(row) for row in sendables}
+        else:
+            sendables_by_id = {sendable.id: sendable for sendable in sendables}
+
+        # Use the ids of a page, or the whole query when not paginated.
+        sendable_ids = (
+            list(sendables_by_id)
+            if paginated
+            else cast(QuerySet, sendables).order_by().values("id")
+        )
 
-        # 3. End up with sendables passing both the "sendable" filters and the
-        # "recipient" filters.
-        eligible_sendable_ids = sendable_ids.intersection(sendables_with_recipients_ids)
+        # Avoid using the "recipient" filters here, to include even association
+        # records that (unlike their "siblings") fail them, but are needed to compose
+        # the full data.
+        queryset = (
+            get_associations(self.entity_settings)
+            .filter(object_id__in=sendable_ids, content_type=content_type)
+            .order_by("id")
+        )
 
-        # Avoid using `search_recipients_filters` here, and do it at step 2. to include
-        # even association records that (unlike their "siblings") fail the "recipient"
-        # filters, but are needed to compose the full data.
-        results = RecipientSendableAssociation.objects.filter(
-            object_id__in=eligible_sendable_ids,
-            content_type=content_type,
-        ).prefetch_related("recipient", "sendable")
+        # Sendable id, to position
+        positions = {
+            sendable_id: position
+            for position, sendable_id in enumerate(sendables_by_id)
+        }
+
+        if self.projected_sent:
+            own_lookups, _ = split_lookups(cast(list[str], self.get_projection()))
+            rows = sorted(
+                queryset.values("object_id", *own_lookups),
+                key=lambda row: positions[row["object_id"]],
+            )
+            return attach_sendables(rows, sendables_by_id)
+
+        associations = list(queryset.select_related("recipient"))
+        for association in associations:
+            association.sendable = sendables_by_id[association.object_id]
+
+        if (sort_key := self.entity_settings.SORT_SENT_KEY) is not None:
+            associations.sort(key=sort_key)
+        else:
+            associations.sort(key=lambda association: positions[association.object_id])
+
+        return associations
+
+    def serialize_chunk(self, chunk: Sequence) -> Any:
+        associations = self.get_associations(chunk, paginated=True)
+        return self.get_serializer(associations, many=True).data
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Paginate the sendables themselves in SQL, then fetch association records
+        only for the sendables of the page.
+        """
+        queryset = self.get_queryset()
+
+        if self.is_streamed():
+            return cast(Response, self.get_streaming_response(queryset))
+
+        page = self.paginate_queryset(queryset)
 
-        # Do the sorting in Python, as explained in the comment of
-        # `mixins.RetrieveReceivedMixin.get_queryset`.
-        return cast(QuerySet, sorted(results, key=self.entity_settings.SORT_SENT_KEY))
+        if page is None:
+            associations = self.get_associations(queryset, paginated=False)
+        else:
+            associations = self.get_associations(page, paginated=True)
+
+        serializer = self.get_serializer(associations, many=True)
+
+        if page is None:
+            return Response(serializer.data)
+
+        return self.get_paginated_response(serializer.data)
 
     def get_serializer_class(self) -> type[serializers.Serializer]:
         return self.entity_settings.LIST_SENT_SERIALIZER_CLASS
 
 
-class DetailView(ContextMixin, generics.RetrieveAPIView):
+class DetailView(
+    ConditionalMixin,
+    CacheMixin,
+    ReadStateMixin,
+    ProjectionMixin,
+    generics.RetrieveAPIView,
+):
     def get_queryset(self) -> QuerySet:
         # Setup `lookup_field` for `get_object()` to use.
         self.lookup_field = self.entity_settings.SENDABLE_KEY_NAME
 
         Sendable = self.entity_settings.SENDABLE_CLASS
 
+        deliver_broadcasts(self.request.user, self.entity_settings)
+
         content_type = ContentType.objects.get_for_model(Sendable)
         prefetch_fields = self.entity_settings.GET_RECEIVED_PREFETCH_FIELDS(Sendable)
 
-        return ReceivedSendable.objects.filter(
-            recipient=self.request.user,
-            content_type=content_type,
-        ).prefetch_related(*prefetch_fields)
+        return self.project_received(
+            ReceivedSendable.objects.filter(
+                recipient=self.request.user,
+                content_type=content_type,
+                deleted_by_recipient=False,
+            ).prefetch_related(*prefetch_fields)
+        )
 
     def get_serializer_class(self) -> type[serializers.Serializer]:
         return self.entity_settings.DETAIL_SERIALIZER_CLASS
 
 
-class DetailSentView(ContextMixin, generics.ListAPIView):
+class DetailSentView(
+    ConditionalMixin, CacheMixin, ContextMixin, ProjectionMixin, generics.ListAPIView
+):
+    projection_setting = "PROJECTION_SENT"
+
     def get_queryset(self) -> QuerySet:
         """Get QuerySet with single sendable, chosen by URL argument."""
         Sendable = self.entity_settings.SENDABLE_CLASS
@@ -157,10 +372,42 @@ class DetailSentView(ContextMixin, generics.ListAPIView):
 
         content_type = ContentType.objects.get_for_model(Sendable)
 
-        return RecipientSendableAssociation.objects.filter(
+        associations = get_associations(self.entity_settings).filter(
             object_id__in=sendable_ids,
             content_type=content_type,
-        ).prefetch_related("recipient", "sendable")
+        )
+
+        if (lookups := self.get_projection()) is None:
+            return associations.prefetch_related("recipient", "sendable")
+
+        own_lookups, sendable_lookups = split_lookups(lookups)
+        sendables_by_id = fetch_sendables(Sendable, sendable_ids, sendable_lookups)
+        rows = associations.order_by("id").values("object_id", *own_lookups)
+
+        return cast(QuerySet, attach_sendables(rows, sendables_by_id))
 
     def get_serializer_class(self) -> type[serializers.Serializer]:
         return self.entity_settings.DETAIL_SENT_SERIALIZER_CLASS
+
+
+class CountsView(ContextMixin, generics.GenericAPIView):
+    def get(self, request: Request, **kwargs: Any) -> Response:
+        """Respond with counts of current user's received sendables."""
+        deliver_broadcasts(request.user, self.entity_settings)
+        if self.entity_settings.BUFFER_MARKS:
+            flush_marks(request.user, [self.entity_name])
+
+        counts = get_counts(request.user, [self.entity_name])
+        return Response(counts[self.entity_name])
+
+
+class AllCountsView(ContextMixin, generics.GenericAPIView):
+    def get(self, request: Request, **kwargs: Any) -> Response:
+        """Respond with counts of current user's received sendables, for each of the
+        mounted entity types.
+        """
+        for entity_name in MOUNTED_ENTITY_NAMES:
+            deliver_broadcasts(request.user, app_settings[entity_name])
+        flush_marks(request.user, MOUNTED_ENTITY_NAMES)
+
+        return Response(get_counts(request.user, MOUNTED_ENTITY_NAMES))
@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
+
+from sendables.core.models import ReadWatermark
+from sendables.core.settings import Settings
+
+# Name of the read state annotation, that counts in the read watermark.
+EFFECTIVE_IS_READ = "effective_is_read"
+
+
+def get_read_watermark(entity_settings: Settings, user: Any) -> datetime | None:
+    """Get the read watermark of given user's sendables of given type, if read
+    watermarks are enabled and the user has one.
+    """
+    if not entity_settings.READ_WATERMARK or not user.is_authenticated:
+        return None
+
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+
+    watermark = ReadWatermark.objects.filter(
+        user=user, content_type=content_type
+    ).first()
+
+    return watermark.read_before if watermark else None
+
+
+def set_read_watermark(entity_settings: Settings, user: Any) -> datetime:
+    """Count all of given user's sendables of given type, delivered or marked until
+    now, as read, by moving their read watermark to the current time.
+
+    Returns:
+        The new read watermark
+    """
+    content_type = ContentType.objects.get_for_model(entity_settings.SENDABLE_CLASS)
+    read_before = timezone.now()
+
+    ReadWatermark.objects.update_or_create(
+        user=user, content_type=content_type, defaults={"read_before": read_before}
+    )
+
+    return read_before
+
+
+def is_read_by_watermark(marked_on: datetime | None, read_before: datetime) -> bool:
+    """Whether a received sendable whose read state was last set at given time, counts
+    as read by given read watermark.
+    """
+    return marked_on is None or marked_on < read_before
+
+
+def read_state_filter(is_read: bool, read_before: datetime | None) -> Q:
+    """Condition of received sendables being read/unread, given their recipient's
+    read watermark, if any.
+
+    Received sendables whose read state was last set before the watermark, count as
+    read. The rest are read if marked so.
+    """
+    if read_before is None:
+        return Q(is_read=is_read)
+
+    if is_read:
+        return Q(is_read=True) | Q(marked_on__lt=read_before) | Q(marked_on=None)
+
+    return Q(is_read=False, marked_on__gte=read_before)
+
+
+def recipient_read_state_filter(is_read: bool) -> Q:
+    """Condition of received sendables being read/unread, given each one's recipient's
+    read watermark, correlated per record, for received sendables of many recipients.
+    """
+    watermarks = ReadWatermark.objects.filter(
+        user=OuterRef("recipient"), content_type=OuterRef("content_type")
+    )
+    read_before = Subquery(watermarks.values("read_before"))
+    has_watermark = Exists(watermarks)
+
+    if is_read:
+        return (
+            Q(is_read=True)
+            | Q(marked_on__lt=read_before)
+            | Q(has_watermark, marked_on=None)
+        )
+
+    return Q(is_read=False) & (Q(marked_on__gte=read_before) | ~Q(has_watermark))
+
+
+def order_by_read_state(
+    queryset: QuerySet, ordering: list[str], read_before: datetime | None
+) -> QuerySet:
+    """Order given received sendables by given ordering, replacing ordering by the
+    read state column with ordering by the read state the read watermark results in,
+    if any.
+
+    The effective read state is annotated under its own name, for ordering by a field
+    name only, that paginators can also read back from the records.
+    """
+    if read_before is None:
+        return queryset.order_by(*ordering)
+
+    queryset = queryset.annotate(
+        **{
+            EFFECTIVE_IS_READ: Case(
+                When(read_state_filter(True, read_before), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        }
+    )
+
+    return queryset.order_by(
+        *[
+            (
+                field_name.replace("is_read", EFFECTIVE_IS_READ)
+                if field_name.lstrip("-") == "is_read"
+                else field_name
+            )
+            for field_name in ordering
+        ]
+    )
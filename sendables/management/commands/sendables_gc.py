@@ -0,0 +1,94 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.urls import get_resolver
+
+from sendables.core.cleanup import collect_hanging_sendables, count_hanging_sendables
+from sendables.core.settings import MOUNTED_ENTITY_NAMES
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the sendables left hanging (removed from their senders' outboxes, "
+        "with no recipients left), in batches."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "entity_names",
+            nargs="*",
+            metavar="entity_name",
+            help="Entity types to delete hanging sendables of (default: all mounted).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum sendables deleted per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help="Maximum sendables deleted per second (default: unlimited).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep collecting, instead of exiting after a single pass.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=60,
+            help="Seconds to wait between passes, when looping (default: 60).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Load the URL patterns, for the entity types to get mounted.
+        get_resolver().url_patterns
+
+        entity_names = options["entity_names"] or MOUNTED_ENTITY_NAMES
+
+        if options["dry_run"]:
+            for name in entity_names:
+                sendables_count, associations_count = count_hanging_sendables(name)
+                self.stdout.write(
+                    f"Would delete {sendables_count} hanging {name}(s), with "
+                    f"{associations_count} association record(s)."
+                )
+            return
+
+        while True:
+            for name in entity_names:
+                count = self.collect(name, options["batch_size"], options["rate"])
+                self.stdout.write(f"Deleted {count} hanging {name}(s).")
+
+            if not options["loop"]:
+                return
+
+            time.sleep(options["interval"])
+
+    def collect(self, entity_name: str, batch_size: int, rate: float | None) -> int:
+        """Run a pass over the hanging sendables of given entity type, batch by batch,
+        resuming from the last checkpoint.
+
+        Returns:
+            The number of deleted sendables
+        """
+        total = 0
+        while True:
+            started_on = time.monotonic()
+            count, is_finished = collect_hanging_sendables(entity_name, batch_size)
+            total += count
+
+            if is_finished:
+                return total
+
+            if rate:
+                time.sleep(max(0, count / rate - (time.monotonic() - started_on)))
@@ -0,0 +1,83 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.urls import get_resolver
+
+from sendables.core.cleanup import (
+    collect_hanging_sendables,
+    deletes_hanging_inline,
+    get_purgeable_received,
+    purge_received,
+)
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Physically delete the received sendables soft-deleted by their recipients, "
+        "in batches, along with the sendables left hanging."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "entity_names",
+            nargs="*",
+            metavar="entity_name",
+            help="Entity types to purge received sendables of (default: all mounted).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum received sendables deleted per statement (default: 1000).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help="Maximum received sendables deleted per second (default: unlimited).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Load the URL patterns, for the entity types to get mounted.
+        get_resolver().url_patterns
+
+        entity_names = options["entity_names"] or MOUNTED_ENTITY_NAMES
+
+        for name in entity_names:
+            if options["dry_run"]:
+                count = get_purgeable_received(app_settings[name]).count()
+                self.stdout.write(f"Would purge {count} received {name}(s).")
+                continue
+
+            count = self.purge(name, options["batch_size"], options["rate"])
+            self.stdout.write(f"Purged {count} received {name}(s).")
+
+            # Left undeleted by the soft deletions.
+            if deletes_hanging_inline(app_settings[name]):
+                while not collect_hanging_sendables(name, options["batch_size"])[1]:
+                    pass
+
+    def purge(self, entity_name: str, batch_size: int, rate: float | None) -> int:
+        """Purge the soft-deleted received sendables of given entity type, batch by
+        batch.
+
+        Returns:
+            The number of deleted received sendables
+        """
+        total = 0
+        while True:
+            started_on = time.monotonic()
+            count = purge_received(entity_name, batch_size)
+            total += count
+
+            if count < batch_size:
+                return total
+
+            if rate:
+                time.sleep(max(0, count / rate - (time.monotonic() - started_on)))
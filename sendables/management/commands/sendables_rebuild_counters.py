@@ -0,0 +1,33 @@
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandParser
+from django.urls import get_resolver
+
+from sendables.core.counters import rebuild_counters
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
+
+
+class Command(BaseCommand):
+    help = "Recalculate the counters of received sendables."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "entity_names",
+            nargs="*",
+            metavar="entity_name",
+            help="Entity types to recalculate counters for (default: all mounted).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Load the URL patterns, for the entity types to get mounted.
+        get_resolver().url_patterns
+
+        entity_names = options["entity_names"] or MOUNTED_ENTITY_NAMES
+        content_types = [
+            ContentType.objects.get_for_model(app_settings[name].SENDABLE_CLASS)
+            for name in entity_names
+        ]
+        rebuild_counters(content_types)
+
+        self.stdout.write(f"Rebuilt counters of: {', '.join(entity_names)}.")
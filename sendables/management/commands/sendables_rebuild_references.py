@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.urls import get_resolver
+
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
+from sendables.core.storage import rebuild_references
+
+
+class Command(BaseCommand):
+    help = "Recalculate the remaining recipients of sendables."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "entity_names",
+            nargs="*",
+            metavar="entity_name",
+            help=(
+                "Entity types to recalculate remaining recipients for "
+                "(default: all mounted)."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Load the URL patterns, for the entity types to get mounted.
+        get_resolver().url_patterns
+
+        entity_names = options["entity_names"] or MOUNTED_ENTITY_NAMES
+        for name in entity_names:
+            rebuild_references(app_settings[name].SENDABLE_CLASS)
+
+        self.stdout.write(
+            f"Rebuilt remaining recipients of: {', '.join(entity_names)}."
+        )
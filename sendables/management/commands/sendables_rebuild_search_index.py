@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.urls import get_resolver
+
+from sendables.core.search import rebuild_search_index
+from sendables.core.settings import MOUNTED_ENTITY_NAMES, app_settings
+
+
+class Command(BaseCommand):
+    help = "Recreate the full-text search index of sendables."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "entity_names",
+            nargs="*",
+            metavar="entity_name",
+            help="Entity types to recreate the index of (default: all mounted).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Load the URL patterns, for the entity types to get mounted.
+        get_resolver().url_patterns
+
+        entity_names = options["entity_names"] or MOUNTED_ENTITY_NAMES
+        for entity_name in entity_names:
+            rebuild_search_index(app_settings[entity_name])
+
+        self.stdout.write(f"Rebuilt search index of: {', '.join(entity_names)}.")
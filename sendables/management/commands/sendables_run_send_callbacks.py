@@ -0,0 +1,43 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from sendables.core.callbacks import run_pending_send_callbacks
+
+
+class Command(BaseCommand):
+    help = "Invoke the post-send callbacks stored for later."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of sends to handle per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new sends, instead of exiting when done.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls, when looping (default: 5).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            count = total = run_pending_send_callbacks(options["batch_size"])
+            while count == options["batch_size"]:
+                count = run_pending_send_callbacks(options["batch_size"])
+                total += count
+
+            self.stdout.write(f"Handled {total} send(s).")
+
+            if not options["loop"]:
+                return
+
+            time.sleep(options["interval"])
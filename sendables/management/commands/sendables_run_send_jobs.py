@@ -0,0 +1,33 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from sendables.core.jobs import run_pending_send_jobs
+
+
+class Command(BaseCommand):
+    help = "Run the pending send jobs."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new jobs, instead of exiting when done.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls, when looping (default: 5).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            count = run_pending_send_jobs()
+            self.stdout.write(f"Ran {count} send job(s).")
+
+            if not options["loop"]:
+                return
+
+            time.sleep(options["interval"])
@@ -6,6 +6,12 @@ from sendables.core.settings import IMPORT_STRINGS, app_settings
 def configure_messages_app() -> None:
     app_settings["message"] = {
         "SEND_SERIALIZER_CLASS": "sendables.messages.serializers.SendMessageSerializer",
+        "SEND_BATCH_SERIALIZER_CLASS": (
+            "sendables.messages.serializers.SendMessageBatchSerializer"
+        ),
+        "BROADCAST_SERIALIZER_CLASS": (
+            "sendables.messages.serializers.BroadcastMessageSerializer"
+        ),
         "SENDABLE_CLASS": "sendables.messages.models.Message",
         "LIST_SERIALIZER_CLASS": "sendables.messages.serializers.MessageListSerializer",
         "LIST_SENT_SERIALIZER_CLASS": (
@@ -1,8 +1,14 @@
 from typing import Any, Iterable, cast
 
 from rest_framework import exceptions, serializers
-
-from sendables.core.serializers import ReceivedSendableSerializer, SendSerializer
+from rest_framework.fields import get_attribute
+
+from sendables.core.serializers import (
+    BroadcastSerializer,
+    ReceivedSendableSerializer,
+    SendBatchSerializer,
+    SendSerializer,
+)
 from sendables.core.settings import app_settings
 
 
@@ -38,38 +44,39 @@ class MessageSentParentSerializer(serializers.ListSerializer):
         self, association_data: Iterable  # type: ignore[override]
     ) -> list[dict[str, Any]]:
         """Construct a list of dicts, each containing data for a sent sendable,
-        including a list of recipients.
+        including a list of recipients, in a single pass over the association records.
         """
         settings = app_settings[self.context["entity_name"]]
 
-        # Sendable id, to sendable data
-        sendables = {}
-        # Sendable id, to recipient list
-        recipients: dict[int, list[dict[str, Any]]] = {}
+        # Resolve the recipient representation once, for all of the records. Use
+        # appropriate setting for list view or detail view.
+        field_type = (
+            settings.RECIPIENT_FIELD_TYPE_DETAIL
+            if self.in_detail_view()
+            else settings.RECIPIENT_FIELD_TYPE_LIST
+        )
+        recipient_field = field_type(context=self.context)
+
+        # Sendable id, to sendable data (including its recipient list)
+        sendables: dict[Any, dict[str, Any]] = {}
 
         for record in association_data:
-            if (sendable_id := record.sendable.id) not in sendables:
-                # Newly encountered sendable id, generate its data and create empty
-                # recipient list.
+            # Records are either model instances or dicts, if projected.
+            sendable_id = get_attribute(record, ["sendable", "id"])
+
+            try:
+                recipients = sendables[sendable_id]["recipients"]
+            except KeyError:
+                # Newly encountered sendable id, generate its data along with an
+                # empty recipient list.
                 data = self.child.to_representation(record)  # type: ignore[union-attr]
+                data["recipients"] = recipients = []
                 sendables[sendable_id] = data
-                recipients[sendable_id] = []
 
-            # Get recipient representation according to settings and add it to its
-            # respective sendable's list. Use appropriate setting for list view or
-            # detail view.
-            field_type = (
-                settings.RECIPIENT_FIELD_TYPE_DETAIL
-                if self.in_detail_view()
-                else settings.RECIPIENT_FIELD_TYPE_LIST
-            )
-            field = field_type(context=self.context)
-            recipients[sendable_id].append(field.to_representation(record.recipient))
+            recipient = get_attribute(record, ["recipient"])
+            recipients.append(recipient_field.to_representation(recipient))
 
-        for sendable_id, sendable_data in sendables.items():
-            sendable_data["recipients"] = recipients[sendable_id]
-
-        return cast(list[dict[str, Any]], sendables.values())
+        return list(sendables.values())
 
     @property
     def data(self) -> Any:
@@ -101,6 +108,18 @@ class SendMessageSerializer(SendSerializer):
         super().save(sender=self.context["request"].user)
 
 
+class SendMessageBatchSerializer(SendBatchSerializer):
+    def save(self, **kwargs: Any) -> None:
+        # While saving, include current user as the sender of the messages.
+        super().save(sender=self.context["request"].user)
+
+
+class BroadcastMessageSerializer(BroadcastSerializer):
+    def save(self, **kwargs: Any) -> None:
+        # While saving, include current user as the sender of the message.
+        super().save(sender=self.context["request"].user)
+
+
 class ParticipantSerializer(serializers.Serializer):
     def get_fields(self) -> dict[str, serializers.Field]:
         """Dynamically add a uniquely identifying field, and the username if not already
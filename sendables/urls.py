@@ -1,6 +1,9 @@
 from django.urls import include, path
 
+from sendables.core.urls import counts_path
+
 urlpatterns = [
     path("messages/", include("sendables.messages.urls")),
     path("notices/", include("sendables.notices.urls")),
+    counts_path("counts/"),
 ]
@@ -0,0 +1,163 @@
+from typing import Any
+
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import Broadcast, ReceivedSendable
+from tests.utils import (
+    FixturesMixin,
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+
+class BroadcastTests(FixturesMixin):
+    def setUp(self) -> None:
+        super().setUp()
+        self.admin = User.objects.create_superuser(username="root")
+
+    def broadcast(self, content: str, **data: Any) -> Response:
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(self.url, data={"content": content, **data})
+        self.client.force_authenticate(self.user)
+
+        return response
+
+    def get_contents(self, action: str = "list") -> list[str]:
+        response = self.client.get(reverse(f"{self.entity_name}-{action}"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return [item["content"] for item in response.data]
+
+    def count_received(self, user: Any) -> int:
+        return ReceivedSendable.objects.filter(recipient=user).count()
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_success(self) -> None:
+        received_count = ReceivedSendable.objects.count()
+
+        response = self.broadcast("To everyone")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # Nothing is stored per user, when sending.
+        self.assertEqual(Broadcast.objects.count(), 1)
+        self.assertEqual(ReceivedSendable.objects.count(), received_count)
+
+        self.assertEqual(self.get_contents()[0], "To everyone")
+        self.assertEqual(self.count_received(self.user), 3)
+
+        # Delivered only once.
+        self.assertEqual(self.get_contents().count("To everyone"), 1)
+        self.assertEqual(self.count_received(self.user), 3)
+
+        self.assertEqual(self.count_received(self.other_user), 1)
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_deleted_not_delivered_again(self) -> None:
+        self.broadcast("To everyone")
+        self.get_contents()
+
+        received_sendable = ReceivedSendable.objects.get(
+            recipient=self.user, object_id=Broadcast.objects.get().object_id
+        )
+        response = self.client.delete(
+            reverse(f"{self.entity_name}-delete"),
+            data={self.entity_name + "_ids": [received_sendable.id]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertNotIn("To everyone", self.get_contents())
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_to_group(self) -> None:
+        group = Group.objects.create(name="readers")
+        self.other_user.groups.add(group)
+
+        self.broadcast("To readers", group=group.id)
+
+        self.assertNotIn("To readers", self.get_contents())
+
+        self.client.force_authenticate(self.other_user)
+        self.assertIn("To readers", self.get_contents())
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_counted(self) -> None:
+        self.broadcast("To everyone")
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 3, "total": 3})
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_broadcast_modifies_etag(self) -> None:
+        url = reverse(f"{self.entity_name}-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.broadcast("To everyone")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("To everyone", [item["content"] for item in response.data])
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_non_admin_forbidden(self) -> None:
+        self.client.force_authenticate(self.other_user)
+        response = self.client.post(self.url, data={"content": "To everyone"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_broadcast_disabled(self) -> None:
+        response = self.broadcast("To everyone")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SendableBroadcastTests(BroadcastTests, SendableMixin, APITestCase):
+    action = "broadcast"
+
+
+class MessageBroadcastTests(BroadcastTests, MessageMixin, APITestCase):
+    action = "broadcast"
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_broadcast_deleted_sent(self) -> None:
+        self.broadcast("To everyone")
+        message = self.sendable_class.objects.get(content="To everyone")
+        self.assertEqual(message.sender, self.admin)
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete(
+            reverse("message-delete-sent"), data={"message_ids": [message.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Not delivered to anyone, after being deleted by its sender.
+        self.client.force_authenticate(self.user)
+        self.assertNotIn("To everyone", self.get_contents())
+        self.assertFalse(self.sendable_class.objects.filter(id=message.id).exists())
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    @with_setting_changed("DELETE_HANGING_SENDABLES", False)
+    def test_broadcast_deleted_sent_without_delete_hanging(self) -> None:
+        self.broadcast("To everyone")
+        message = self.sendable_class.objects.get(content="To everyone")
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete(
+            reverse("message-delete-sent"), data={"message_ids": [message.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Kept, but not delivered to anyone.
+        self.client.force_authenticate(self.user)
+        self.assertNotIn("To everyone", self.get_contents())
+        self.assertFalse(Broadcast.objects.exists())
+        self.assertTrue(self.sendable_class.objects.filter(id=message.id).exists())
+
+
+class NoticeBroadcastTests(BroadcastTests, NoticeMixin, APITestCase):
+    action = "broadcast"
@@ -0,0 +1,111 @@
+from typing import Any
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable
+from tests.utils import (
+    FixturesMixin,
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    with_setting_changed,
+)
+
+
+class CachingTests(FixturesMixin):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+
+    def get_contents(self, url: str | None = None) -> list[str]:
+        response = self.client.get(url or self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return [item["content"] for item in response.data]
+
+    def call_action(self, method: str, action: str, data: dict[str, Any]) -> None:
+        url = reverse(f"{self.entity_name}-{action}")
+        response = getattr(self.client, method)(url, data=data)
+        self.assertLess(response.status_code, status.HTTP_300_MULTIPLE_CHOICES)
+
+    def mark_read(self) -> None:
+        received_sendable_id = ReceivedSendable.objects.filter(
+            recipient=self.user
+        ).values_list("id", flat=True)[0]
+        self.call_action(
+            "patch", "mark-read", {self.entity_name + "_ids": [received_sendable_id]}
+        )
+
+    @with_setting_changed("RESPONSE_CACHE", "default")
+    def test_caching_hit(self) -> None:
+        contents = self.get_contents()
+
+        # Records not created through the API do not invalidate the cache.
+        self.send_sendable("new")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_contents(), contents)
+        self.assertEqual(len(queries), 0)
+
+        # Each user has their own entries.
+        self.client.force_authenticate(self.other_user)
+        self.assertEqual(self.get_contents(), [self.CONTENT_MULTIPLE])
+
+    @with_setting_changed("RESPONSE_CACHE", "default")
+    def test_caching_invalidated_by_mark(self) -> None:
+        self.get_contents()
+        self.send_sendable("new")
+
+        self.mark_read()
+        self.assertIn("new", self.get_contents())
+
+    @with_setting_changed("RESPONSE_CACHE", "default")
+    def test_caching_invalidated_by_send(self) -> None:
+        self.client.force_authenticate(self.other_user)
+        self.get_contents()
+
+        self.client.force_authenticate(self.user)
+        self.call_action(
+            "post", "send", {"content": "new", "recipient_ids": [self.other_user.id]}
+        )
+
+        self.client.force_authenticate(self.other_user)
+        self.assertIn("new", self.get_contents())
+
+    @with_setting_changed("RESPONSE_CACHE", "default")
+    @with_setting_changed("RESPONSE_CACHE_STALE_TIMEOUT", 60)
+    def test_caching_stale_while_revalidate(self) -> None:
+        contents = self.get_contents()
+        self.send_sendable("new")
+        self.mark_read()
+
+        # While another request refreshes the entry, the stale one is served.
+        with mock.patch.object(LocMemCache, "add", return_value=False):
+            self.assertEqual(self.get_contents(), contents)
+
+        self.assertIn("new", self.get_contents())
+
+    def test_caching_disabled(self) -> None:
+        self.get_contents()
+        self.send_sendable("new")
+
+        self.assertIn("new", self.get_contents())
+
+
+class SendableCachingTests(CachingTests, SendableMixin, APITestCase):
+    action = "list"
+
+
+class MessageCachingTests(CachingTests, MessageMixin, APITestCase):
+    action = "list"
+
+
+class NoticeCachingTests(CachingTests, NoticeMixin, APITestCase):
+    action = "list"
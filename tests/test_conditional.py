@@ -0,0 +1,151 @@
+from typing import Any
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable
+from tests.utils import (
+    FixturesMixin,
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    with_setting_changed,
+)
+
+
+class ConditionalTests(FixturesMixin):
+    def get(self, url: str | None = None, **headers: Any) -> Response:
+        return self.client.get(url or self.url, **headers)
+
+    def get_etag(self, url: str | None = None) -> str:
+        response = self.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response["ETag"]
+
+    def call_action(self, method: str, action: str, data: dict[str, Any]) -> None:
+        url = reverse(f"{self.entity_name}-{action}")
+        response = getattr(self.client, method)(url, data=data)
+        self.assertLess(response.status_code, status.HTTP_300_MULTIPLE_CHOICES)
+
+    def get_received_sendable_id(self) -> int:
+        return ReceivedSendable.objects.filter(  # type: ignore[no-any-return]
+            recipient=self.user
+        ).values_list("id", flat=True)[0]
+
+    def assert_modified(self, etag: str, url: str | None = None) -> None:
+        response = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_not_modified(self) -> None:
+        etag = self.get_etag()
+
+        # Only the version stamp is queried.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 1)
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_detail_not_modified(self) -> None:
+        url = reverse(
+            f"{self.entity_name}-detail",
+            kwargs={"id": self.get_received_sendable_id()},
+        )
+        etag = self.get_etag(url)
+
+        response = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Other URLs are tagged differently.
+        self.assertNotEqual(etag, self.get_etag())
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_modified_by_mark(self) -> None:
+        etag = self.get_etag()
+
+        data = {self.entity_name + "_ids": [self.get_received_sendable_id()]}
+        self.call_action("patch", "mark-read", data)
+        self.assert_modified(etag)
+
+        # Marking an already read sendable as read changes nothing.
+        etag = self.get_etag()
+        self.call_action("patch", "mark-read", data)
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_modified_by_delete(self) -> None:
+        etag = self.get_etag()
+
+        data = {self.entity_name + "_ids": [self.get_received_sendable_id()]}
+        self.call_action("delete", "delete", data)
+        self.assert_modified(etag)
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_modified_by_send(self) -> None:
+        self.client.force_authenticate(self.other_user)
+        etag = self.get_etag()
+
+        self.client.force_authenticate(self.user)
+        self.call_action(
+            "post", "send", {"content": "new", "recipient_ids": [self.other_user.id]}
+        )
+
+        self.client.force_authenticate(self.other_user)
+        self.assert_modified(etag)
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_if_modified_since(self) -> None:
+        # Nothing has been changed through the API yet.
+        response = self.get()
+        self.assertNotIn("Last-Modified", response)
+
+        data = {self.entity_name + "_ids": [self.get_received_sendable_id()]}
+        self.call_action("patch", "mark-read", data)
+
+        response = self.get()
+        self.assertIn("private", response["Cache-Control"])
+
+        response = self.get(HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_conditional_disabled(self) -> None:
+        response = self.get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+
+
+class SendableConditionalTests(ConditionalTests, SendableMixin, APITestCase):
+    action = "list"
+
+
+class MessageConditionalTests(ConditionalTests, MessageMixin, APITestCase):
+    action = "list"
+
+    @with_setting_changed("CONDITIONAL_REQUESTS", True)
+    def test_conditional_sent_modified_by_send(self) -> None:
+        url = reverse("message-list-sent")
+
+        self.client.force_authenticate(self.sender)
+        etag = self.get_etag(url)
+
+        response = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.call_action(
+            "post", "send", {"content": "new", "recipient_ids": [self.user.id]}
+        )
+        self.assert_modified(etag, url)
+
+
+class NoticeConditionalTests(ConditionalTests, NoticeMixin, APITestCase):
+    action = "list"
@@ -0,0 +1,136 @@
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.counters import add_to_counters, lock_by_type
+from sendables.core.models import ReceivedSendable
+from tests.utils import (
+    FixturesMixin,
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    assert_forbidden,
+    with_setting_changed,
+)
+
+
+class CountsTests(FixturesMixin):
+    def get(self) -> Response:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    def assert_counts(self, read: int, unread: int) -> None:
+        response = self.get()
+        self.assertEqual(
+            response.data, {"read": read, "unread": unread, "total": read + unread}
+        )
+
+    def get_received_sendable_ids(self) -> list[int]:
+        return list(
+            ReceivedSendable.objects.filter(recipient=self.user)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def call_action(self, method: str, action: str, data: dict[str, Any]) -> None:
+        url = reverse(f"{self.entity_name}-{action}")
+        response = getattr(self.client, method)(url, data=data)
+        self.assertLess(response.status_code, status.HTTP_300_MULTIPLE_CHOICES)
+
+    def mark(self, action: str, *received_sendable_ids: int) -> None:
+        self.call_action(
+            "patch", action, {self.entity_name + "_ids": received_sendable_ids}
+        )
+
+    def test_counts_success(self) -> None:
+        self.assert_counts(read=0, unread=2)
+
+        self.send_sendable("read one", is_read=True)
+        self.assert_counts(read=1, unread=2)
+
+    @assert_forbidden
+    def test_counts_forbidden(self) -> Response:
+        return self.client.get(self.url)
+
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_counts_maintained(self) -> None:
+        # Counters of records not created through the API need to be rebuilt.
+        self.assert_counts(read=0, unread=0)
+        call_command("sendables_rebuild_counters", self.entity_name, stdout=None)
+        self.assert_counts(read=0, unread=2)
+
+        first_id, second_id = self.get_received_sendable_ids()
+
+        self.mark("mark-read", first_id)
+        self.assert_counts(read=1, unread=1)
+
+        # Marking an already read sendable as read changes nothing.
+        self.mark("mark-read", first_id, second_id)
+        self.assert_counts(read=2, unread=0)
+
+        self.mark("mark-unread", second_id)
+        self.assert_counts(read=1, unread=1)
+
+        self.call_action("delete", "delete", {self.entity_name + "_ids": [first_id]})
+        self.assert_counts(read=0, unread=1)
+
+        self.call_action(
+            "post", "send", {"content": "new", "recipient_ids": [self.other_user.id]}
+        )
+        self.assert_counts(read=0, unread=1)
+
+        self.client.force_authenticate(self.other_user)
+        self.assert_counts(read=0, unread=2)
+
+        # Rebuilding results in the same counts as the ones maintained.
+        call_command("sendables_rebuild_counters", stdout=None)
+        self.assert_counts(read=0, unread=2)
+
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_counts_maintained_concurrent(self) -> None:
+        call_command("sendables_rebuild_counters", self.entity_name, stdout=None)
+        first_id, second_id = self.get_received_sendable_ids()
+
+        def lock(*args: Any) -> Any:
+            # Marked as read by another request, before getting locked.
+            ReceivedSendable.objects.filter(id=first_id).update(is_read=True)
+            add_to_counters(
+                [self.user.id],
+                ReceivedSendable.objects.get(id=first_id).content_type,
+                unread=-1,
+            )
+            return lock_by_type(*args)
+
+        with mock.patch("sendables.core.serializers.lock_by_type", side_effect=lock):
+            self.mark("mark-read", first_id, second_id)
+
+        # Counted once.
+        self.assert_counts(read=2, unread=0)
+
+    def test_all_counts(self) -> None:
+        response = self.client.get(reverse("sendables-counts"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(set(response.data), {"sendable", "message", "notice"})
+        self.assertEqual(
+            response.data[self.entity_name], {"read": 0, "unread": 2, "total": 2}
+        )
+
+
+class SendableCountsTests(CountsTests, SendableMixin, APITestCase):
+    action = "counts"
+
+
+class MessageCountsTests(CountsTests, MessageMixin, APITestCase):
+    action = "counts"
+
+
+class NoticeCountsTests(CountsTests, NoticeMixin, APITestCase):
+    action = "counts"
@@ -247,6 +247,32 @@ class DeleteTests(FixturesMixin):
             starting_associations_count,
         )
 
+    def test_delete_removed_sendable_not_matching_ids(self) -> None:
+        # Make the inbox "copy" ids differ from the sendable ids.
+        for _ in range(3):
+            self.send_sendable("Padding")
+        removed_sendable = self.create_sendable("Removed")
+        self.add_to_recipients(removed_sendable)
+        received_sendable = ReceivedSendable.objects.get(
+            object_id=removed_sendable.id, content_type=self.content_type
+        )
+        self.assertNotEqual(received_sendable.id, removed_sendable.id)
+
+        removed_sendable.is_removed = True
+        removed_sendable.save(update_fields=["is_removed"])
+
+        response = self.delete([received_sendable.id])
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(
+            self.sendable_class.objects.filter(id=removed_sendable.id).exists()
+        )
+        self.assertFalse(
+            RecipientSendableAssociation.objects.filter(
+                object_id=removed_sendable.id, content_type=self.content_type
+            ).exists()
+        )
+
 
 class SendableDeleteTests(DeleteTests, SendableMixin, APITestCase):
     action = "delete"
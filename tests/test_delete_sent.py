@@ -1,11 +1,19 @@
+from io import StringIO
 from typing import Collection, Sequence, cast
 
+from django.core.management import call_command
 from django.db.models import QuerySet
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
-from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+from sendables.core.models import (
+    ReceivedSendable,
+    RecipientSendableAssociation,
+    SearchEntry,
+)
+from sendables.core.storage import remove_references
+from sendables.core.types import FilterType
 from tests.utils import (
     FixturesMixin,
     MessageMixin,
@@ -185,6 +193,10 @@ class MessageDeleteSentTests(TestSentMixin, FixturesMixin, MessageMixin, APITest
             if received_sendable.sendable.id == sendable_id_to_delete
         ]
         ReceivedSendable.objects.filter(id__in=received_sendable_ids_to_delete).delete()
+        remove_references(
+            self.sendable_class,
+            [sendable_id_to_delete] * len(received_sendable_ids_to_delete),
+        )
 
         self.delete([sendable_id_to_delete, sendable_ids[1]])
 
@@ -244,3 +256,16 @@ class MessageDeleteSentTests(TestSentMixin, FixturesMixin, MessageMixin, APITest
         self.assertQuerySetEqual(result_received_sendables, expected_received_sendables)
 
         self.assertQuerySetEqual(result_associations, associations)
+
+    @with_setting_changed("FILTER_FIELDS_SENDABLES", {"content": FilterType.FULLTEXT})
+    def test_delete_sent_unindexed(self) -> None:
+        call_command("sendables_rebuild_search_index", "message", stdout=StringIO())
+
+        sendable_ids, _, received_sendables, _ = self.get_records()
+        sendable_id_to_delete, _ = self.delete_sample_records(
+            sendable_ids, received_sendables
+        )
+
+        indexed_ids = SearchEntry.objects.values_list("object_id", flat=True)
+        self.assertNotIn(sendable_id_to_delete, indexed_ids)
+        self.assertIn(sendable_ids[1], indexed_ids)
@@ -19,6 +19,8 @@ from tests.utils import (
 
 class DetailTests(FixturesMixin):
     view_name_suffix = ""
+    projection_key = "PROJECTION_RECEIVED"
+    projection = "sendables.core.policies.list.get_received_projection"
 
     def get(self, received_sendable_id: int) -> Response:
         url = reverse(
@@ -82,6 +84,12 @@ class DetailTests(FixturesMixin):
             ):
                 self.validate_slugged("The text.", "text")
 
+    def test_detail_projected(self) -> None:
+        with self.setting_changed(self.projection_key, self.projection):
+            self.test_detail_success()
+            self.test_detail_not_found()
+            self.test_detail_not_owned()
+
 
 class SendableDetailTests(DetailTests, SendableMixin, APITestCase):
     pass
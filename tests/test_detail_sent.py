@@ -7,6 +7,8 @@ from tests.utils import TestSentMixin, with_setting_changed
 
 class MessageDetailSentTests(TestSentMixin, MessageDetailTests):
     view_name_suffix = "-sent"
+    projection_key = "PROJECTION_SENT"
+    projection = "sendables.core.policies.list.get_sent_projection"
 
     def get_tested_record(self, sendable: Sendable) -> Sendable:
         return sendable
@@ -0,0 +1,150 @@
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core.cleanup import collect_hanging_sendables
+from sendables.core.models import (
+    CleanupCursor,
+    ReceivedSendable,
+    RecipientSendableAssociation,
+)
+from tests.utils import (
+    FixturesMixin,
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    with_setting_changed,
+)
+
+
+class GarbageCollectionTests(FixturesMixin):
+    def create_hanging(self, content: str) -> Any:
+        sendable = self.create_sendable(content)
+        self.add_to_recipients(sendable, self.other_user)
+
+        self.sendable_class.objects.filter(id=sendable.id).update(
+            is_removed=True, remaining_recipients=0
+        )
+        ReceivedSendable.objects.filter(object_id=sendable.id).delete()
+
+        return sendable
+
+    def gc(self, *args: str) -> str:
+        stdout = StringIO()
+        call_command("sendables_gc", self.entity_name, *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    def exists(self, sendable: Any) -> bool:
+        return bool(self.sendable_class.objects.filter(id=sendable.id).exists())
+
+    @with_setting_changed("DELETE_HANGING_SENDABLES", "deferred")
+    def test_gc_deferred(self) -> None:
+        sendable = self.create_sendable("Removed")
+        self.add_to_recipients(sendable)
+        self.sendable_class.objects.filter(id=sendable.id).update(is_removed=True)
+
+        received_sendable = ReceivedSendable.objects.get(object_id=sendable.id)
+        response = self.client.delete(
+            self.url, data={self.entity_name + "_ids": [received_sendable.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Left to the background cleanup.
+        self.assertTrue(self.exists(sendable))
+
+        self.assertIn(f"Deleted 1 hanging {self.entity_name}(s).", self.gc())
+
+        self.assertFalse(self.exists(sendable))
+        self.assertFalse(
+            RecipientSendableAssociation.objects.filter(
+                object_id=sendable.id, content_type=self.content_type
+            ).exists()
+        )
+
+    def test_gc_not_hanging(self) -> None:
+        sendable_count = self.sendable_class.objects.count()
+
+        referenced = self.create_sendable("Referenced")
+        self.add_to_recipients(referenced)
+        self.sendable_class.objects.filter(id=referenced.id).update(is_removed=True)
+
+        self.gc()
+
+        self.assertEqual(self.sendable_class.objects.count(), sendable_count + 1)
+
+    def test_gc_dry_run(self) -> None:
+        sendable = self.create_hanging("Removed")
+
+        self.assertIn(
+            f"Would delete 1 hanging {self.entity_name}(s), with 1 association "
+            "record(s).",
+            self.gc("--dry-run"),
+        )
+        self.assertTrue(self.exists(sendable))
+
+    def test_gc_checkpoint(self) -> None:
+        first = self.create_hanging("First")
+        second = self.create_hanging("Second")
+
+        self.assertEqual(collect_hanging_sendables(self.entity_name, 1), (1, False))
+        self.assertFalse(self.exists(first))
+        self.assertTrue(self.exists(second))
+
+        cursor = CleanupCursor.objects.get(content_type=self.content_type)
+        self.assertEqual(cursor.last_sendable_id, first.id)
+
+        # Resumed after the checkpoint, then reset at the end of the pass.
+        self.assertEqual(collect_hanging_sendables(self.entity_name, 1), (1, False))
+        self.assertEqual(collect_hanging_sendables(self.entity_name, 1), (0, True))
+        self.assertFalse(self.exists(second))
+
+        cursor.refresh_from_db()
+        self.assertEqual(cursor.last_sendable_id, 0)
+
+    def test_gc_rate(self) -> None:
+        for content in "First", "Second":
+            self.create_hanging(content)
+
+        with mock.patch("time.sleep") as sleep:
+            self.gc("--batch-size", "1", "--rate", "0.5")
+
+        self.assertEqual(sleep.call_count, 2)
+        self.assertGreater(sleep.call_args.args[0], 1)
+        self.assertFalse(self.sendable_class.objects.filter(is_removed=True).exists())
+
+
+class SendableGarbageCollectionTests(
+    GarbageCollectionTests, SendableMixin, APITestCase
+):
+    action = "delete"
+
+
+class MessageGarbageCollectionTests(GarbageCollectionTests, MessageMixin, APITestCase):
+    action = "delete"
+
+    @with_setting_changed("DELETE_HANGING_SENDABLES", "deferred")
+    def test_gc_deferred_delete_sent(self) -> None:
+        sendable = self.create_sendable("Sent")
+
+        self.client.force_authenticate(self.sender)
+        response = self.client.delete(
+            reverse("message-delete-sent"), data={"message_ids": [sendable.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Only marked as removed, even if hanging.
+        sendable.refresh_from_db()
+        self.assertTrue(sendable.is_removed)
+
+        self.gc()
+        self.assertFalse(self.exists(sendable))
+
+
+class NoticeGarbageCollectionTests(GarbageCollectionTests, NoticeMixin, APITestCase):
+    action = "delete"
@@ -1,12 +1,25 @@
+import json
+from base64 import urlsafe_b64encode
+from io import StringIO
 from typing import Any, cast
+from unittest import mock
 
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
 from sendables.core.models import ReceivedSendable
+from sendables.core.pagination import KeysetPagination
+from sendables.core.policies.filter import filter_sendables
+from sendables.core.settings import Settings
+from sendables.core.types import FilterType
 from tests.models import Sendable
 from tests.utils import (
     FixturesMixin,
@@ -14,12 +27,16 @@ from tests.utils import (
     NoticeMixin,
     SendableMixin,
     assert_forbidden,
+    with_setting_changed,
 )
 
 
 class ListTests(FixturesMixin):
     list_type = "LIST"
     sort_key = "SORT_RECEIVED_KEY"
+    ordering_key = "ORDERING_RECEIVED"
+    projection_key = "PROJECTION_RECEIVED"
+    projection = "sendables.core.policies.list.get_received_projection"
 
     def validate_items(self, response: Response, items: list[dict[str, Any]]) -> None:
         self.assertEqual(len(response.data), len(items))
@@ -77,6 +94,30 @@ class ListTests(FixturesMixin):
 
         self.assert_contents_in(response, self.CONTENT_SINGLE)
 
+    @with_setting_changed("FILTER_FIELDS_SENDABLES", {"content": FilterType.FULLTEXT})
+    def test_list_search_fulltext(self) -> None:
+        # Sendables not sent through the API need to be indexed first.
+        response = self.get(content="multiple")
+        self.assert_contents_in(response)
+
+        call_command(
+            "sendables_rebuild_search_index", self.entity_name, stdout=StringIO()
+        )
+
+        # All of the words are matched, as prefixes.
+        response = self.get(content="recip MULTIPLE")
+        self.assert_contents_in(response, self.CONTENT_MULTIPLE)
+
+        response = self.get(content="multiple hello")
+        self.assert_contents_in(response)
+
+        response = self.get(content=["hello", "multiple"])
+        self.assert_contents_in(response, self.CONTENT_SINGLE, self.CONTENT_MULTIPLE)
+
+        # Search syntax is escaped.
+        response = self.get(content='"to OR')
+        self.assert_contents_in(response)
+
     def test_list_search_sent_on(self) -> None:
         CONTENT = "late message"
         now_timestamp = timezone.now().timestamp()
@@ -87,6 +128,35 @@ class ListTests(FixturesMixin):
 
         self.assert_contents_in(response, CONTENT)
 
+    @mock.patch("sendables.core.mixins.get_generic_related_query_name")
+    def test_list_search_without_relation(self, get_query_name: mock.Mock) -> None:
+        get_query_name.return_value = None
+
+        self.test_list_search_content()
+        self.test_list_search_or_and()
+
+    def test_list_search_custom_filter(self) -> None:
+        def custom_filter_sendables(
+            request: Request, sendables: QuerySet, entity_settings: Settings
+        ) -> QuerySet:
+            return filter_sendables(request, sendables, entity_settings)
+
+        with self.setting_changed("FILTER_SENDABLES", custom_filter_sendables):
+            self.test_list_search_content()
+            self.test_list_search_or_and()
+
+    def test_list_search_queries(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            self.get()
+
+        with CaptureQueriesContext(connection) as search_context:
+            self.get(content="hello", sent_on__lte=timezone.now().timestamp())
+
+        # Searching is done within the same statements.
+        self.assertEqual(
+            len(search_context.captured_queries), len(context.captured_queries)
+        )
+
     def test_list_search_or(self) -> None:
         CONTENT_FIRST_TERM = self.CONTENT_SINGLE[:5]
         CONTENT_SECOND_TERM = self.CONTENT_MULTIPLE[:6]
@@ -187,6 +257,155 @@ class ListTests(FixturesMixin):
         self.assertEqual(response.data[1]["content"], CONTENT)
         self.assertEqual(response.data[2]["content"], self.CONTENT_MULTIPLE)
 
+    def test_list_custom_sql_ordering(self) -> None:
+        CONTENT = "Latest"
+
+        self.send_sendable(CONTENT)
+
+        with self.setting_changed(self.ordering_key, ["sent_on", "id"]):
+            response = self.get()
+
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0]["content"], self.CONTENT_SINGLE)
+        self.assertEqual(response.data[1]["content"], self.CONTENT_MULTIPLE)
+        self.assertEqual(response.data[2]["content"], CONTENT)
+
+    def get_ids(self, url: str) -> tuple[list[int], Response]:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return [item["id"] for item in response.data["results"]], response
+
+    def test_list_keyset_paginated(self) -> None:
+        class Pagination(KeysetPagination):
+            page_size = 5
+
+        for i in range(10):
+            self.send_sendable(f"test {i}")
+
+        all_ids = [item["id"] for item in self.get().data]
+
+        with self.setting_changed("PAGINATION_CLASS", Pagination):
+            ids, response = self.get_ids(self.url)
+            self.assertIsNone(response.data["previous"])
+
+            # Sending during browsing does not affect the following pages.
+            self.send_sendable("newest")
+
+            pages = [ids]
+            while (next_url := response.data["next"]) is not None:
+                ids, response = self.get_ids(next_url)
+                pages.append(ids)
+
+            self.assertEqual([len(ids) for ids in pages], [5, 5, 2])
+            self.assertEqual(sum(pages, []), all_ids)
+
+            previous_ids, response = self.get_ids(response.data["previous"])
+            self.assertEqual(previous_ids, pages[1])
+
+            previous_ids, response = self.get_ids(response.data["previous"])
+            self.assertEqual(previous_ids, pages[0])
+
+            # The sendable sent during browsing is found before the first page.
+            previous_ids, response = self.get_ids(response.data["previous"])
+            self.assertEqual(len(previous_ids), 1)
+            self.assertNotIn(previous_ids[0], all_ids)
+            self.assertIsNone(response.data["previous"])
+
+    def test_list_keyset_paginated_invalid_cursor(self) -> None:
+        class Pagination(KeysetPagination):
+            page_size = 5
+
+        with self.setting_changed("PAGINATION_CLASS", Pagination):
+            response = self.client.get(self.url, data={"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_keyset_paginated_tampered_cursor(self) -> None:
+        class Pagination(KeysetPagination):
+            page_size = 5
+
+        with self.setting_changed("PAGINATION_CLASS", Pagination):
+            for position in [False, "garbage", 2], [False, {"x": 1}, 2], [1, 2]:
+                cursor = urlsafe_b64encode(json.dumps({"p": position}).encode())
+                response = self.client.get(self.url, data={"cursor": cursor.decode()})
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_keyset_paginated_null(self) -> None:
+        class Pagination(KeysetPagination):
+            page_size = 2
+
+        for i in range(4):
+            self.send_sendable(f"test {i}")
+
+        # As for records from before the sort columns were copied.
+        ids = ReceivedSendable.objects.order_by("id").values_list("id", flat=True)
+        ReceivedSendable.objects.filter(id__in=ids[::2]).update(sent_on=None)
+
+        all_ids = [item["id"] for item in self.get().data]
+
+        with self.setting_changed("PAGINATION_CLASS", Pagination):
+            ids, response = self.get_ids(self.url)
+            pages = [ids]
+            while (next_url := response.data["next"]) is not None:
+                ids, response = self.get_ids(next_url)
+                pages.append(ids)
+
+            self.assertEqual(sum(pages, []), all_ids)
+
+            # And backwards.
+            for page in reversed(pages[:-1]):
+                ids, response = self.get_ids(response.data["previous"])
+                self.assertEqual(ids, page)
+
+    def test_list_streamed(self) -> None:
+        for i in range(4):
+            self.send_sendable(f"test {i}")
+
+        expected_data = json.loads(json.dumps(self.get().data))
+
+        for chunk_size in 1, 2, 100:
+            with self.setting_changed("STREAM_CHUNK_SIZE", chunk_size):
+                response = self.client.get(self.url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.streaming)
+            self.assertEqual(response["Content-Type"], "application/json")
+
+            content = b"".join(response.streaming_content)  # type: ignore[attr-defined]
+            data = json.loads(content)
+            self.assertEqual(data, expected_data)
+
+    def test_list_streamed_empty(self) -> None:
+        with self.setting_changed("STREAM_CHUNK_SIZE", 10):
+            response = self.client.get(self.url, data={"content": "nonexistent"})
+
+        content = b"".join(response.streaming_content)  # type: ignore[attr-defined]
+        self.assertEqual(content, b"[]")
+
+    def test_list_projected(self) -> None:
+        for i in range(4):
+            self.send_sendable(f"test {i}")
+
+        expected_data = self.get().data
+
+        with self.setting_changed(self.projection_key, self.projection):
+            with CaptureQueriesContext(connection) as context:
+                response = self.get()
+
+        self.assertEqual(response.data, expected_data)
+        # One query for the listed records and one for their sendables' data.
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_list_projected_keyset_paginated(self) -> None:
+        with self.setting_changed(self.projection_key, self.projection):
+            self.test_list_keyset_paginated()
+
+    def test_list_projected_streamed(self) -> None:
+        with self.setting_changed(self.projection_key, self.projection):
+            self.test_list_streamed()
+
 
 class SendableListTests(ListTests, SendableMixin, APITestCase):
     action = "list"
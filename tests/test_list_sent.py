@@ -1,3 +1,11 @@
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+
+from sendables.core.policies.filter import filter_recipients
+from sendables.core.settings import Settings
 from tests.test_list import MessageListTests
 from tests.utils import TestSentMixin, with_setting_changed
 
@@ -6,6 +14,9 @@ class MessageListSentTests(TestSentMixin, MessageListTests):
     action = "list-sent"
     list_type = "LIST_SENT"
     sort_key = "SORT_SENT_KEY"
+    ordering_key = "ORDERING_SENT"
+    projection_key = "PROJECTION_SENT"
+    projection = "sendables.core.policies.list.get_sent_projection"
 
     def test_list_sent_removed(self) -> None:
         sendable = self.sendable_class.objects.get(content=self.CONTENT_SINGLE)
@@ -15,6 +26,42 @@ class MessageListSentTests(TestSentMixin, MessageListTests):
         response = self.get()
         self.assert_contents_in(response, self.CONTENT_MULTIPLE)
 
+    def test_list_sent_search_recipient(self) -> None:
+        response = self.get(recipient_username=self.other_user.username)
+        self.assert_contents_in(response, self.CONTENT_MULTIPLE)
+
+        response = self.get(recipient_id=[self.user.id, self.other_user.id])
+        self.assert_contents_in(response, self.CONTENT_SINGLE, self.CONTENT_MULTIPLE)
+
+    def test_list_sent_search_recipient_custom_filter(self) -> None:
+        def custom_filter_recipients(
+            request: Request, users: QuerySet, entity_settings: Settings
+        ) -> QuerySet:
+            return filter_recipients(request, users, entity_settings)
+
+        with self.setting_changed("FILTER_RECIPIENTS", custom_filter_recipients):
+            self.test_list_sent_search_recipient()
+
+    def count_paginated_queries(self) -> int:
+        class Pagination(PageNumberPagination):
+            page_size = 2
+
+        with self.setting_changed("PAGINATION_CLASS", Pagination):
+            with CaptureQueriesContext(connection) as context:
+                self.get(page=1)
+
+        return len(context.captured_queries)
+
+    def test_list_sent_paginated_queries(self) -> None:
+        starting_count = self.count_paginated_queries()
+
+        for i in range(20):
+            sendable = self.create_sendable(f"test {i}")
+            for recipient in self.user, self.other_user:
+                self.add_to_recipients(sendable, recipient)
+
+        self.assertEqual(self.count_paginated_queries(), starting_count)
+
     @with_setting_changed("SENDABLE_CLASS", "tests.models.SluggedMessage")
     @with_setting_changed(
         "LIST_SENT_SERIALIZER_CLASS", "tests.utils.SluggedMessageSentSerializer"
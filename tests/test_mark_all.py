@@ -0,0 +1,124 @@
+from io import StringIO
+from typing import Any
+from urllib.parse import urlencode
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable
+from tests.types import TestCaseType
+from tests.utils import MessageMixin, NoticeMixin, SendableMixin, with_setting_changed
+
+
+class SelectAllTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+
+        for content in "Hello", "Hello again", "Bye":
+            self.receive(content, self.user)
+        self.receive("Hello", self.other_user)
+
+    def receive(self, content: str, user: Any, is_read: bool = False) -> Any:
+        sendable = self.sendable_class.objects.create(content=content)
+        ReceivedSendable.objects.create(
+            recipient=user, sendable=sendable, is_read=is_read
+        )
+
+        return sendable
+
+    def request(self, action: str, **query_params: str) -> Response:
+        method = self.client.delete if action == "delete-all" else self.client.patch
+        url = reverse(f"{self.entity_name}-{action}")
+
+        response = method(f"{url}?{urlencode(query_params)}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    def get_contents(self, user: Any, **filters: Any) -> list[str]:
+        return [
+            received_sendable.sendable.content
+            for received_sendable in ReceivedSendable.objects.filter(
+                recipient=user, **filters
+            )
+        ]
+
+    def test_mark_all_read_filtered(self) -> None:
+        response = self.request("mark-all-read", content="Hello")
+        self.assertEqual(response.data, {"count": 2})
+
+        self.assertCountEqual(
+            self.get_contents(self.user, is_read=True), ["Hello", "Hello again"]
+        )
+        self.assertEqual(self.get_contents(self.other_user, is_read=True), [])
+
+    def test_mark_all_unread(self) -> None:
+        ReceivedSendable.objects.update(is_read=True)
+
+        response = self.request("mark-all-unread")
+        self.assertEqual(response.data, {"count": 3})
+
+        self.assertEqual(self.get_contents(self.user, is_read=True), [])
+        self.assertEqual(self.get_contents(self.other_user, is_read=True), ["Hello"])
+
+    def test_delete_all_filtered(self) -> None:
+        response = self.request("delete-all", content="Hello")
+        self.assertEqual(response.data, {"count": 2})
+
+        self.assertEqual(self.get_contents(self.user), ["Bye"])
+        self.assertEqual(self.get_contents(self.other_user), ["Hello"])
+
+    def test_delete_all_none(self) -> None:
+        response = self.request("delete-all", content="Nothing")
+        self.assertEqual(response.data, {"count": 0})
+
+        self.assertEqual(ReceivedSendable.objects.count(), 4)
+
+    def test_delete_all_hanging(self) -> None:
+        removed = self.receive("Removed", self.user)
+        self.sendable_class.objects.filter(id=removed.id).update(is_removed=True)
+
+        self.request("delete-all")
+
+        self.assertFalse(self.sendable_class.objects.filter(id=removed.id).exists())
+        self.assertTrue(self.sendable_class.objects.filter(content="Bye").exists())
+
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_delete_all_counted(self) -> None:
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+
+        self.request("mark-all-read", content="Bye")
+        self.request("delete-all", content="Hello")
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 1, "unread": 0, "total": 1})
+
+    def test_select_all_queries(self) -> None:
+        with CaptureQueriesContext(connection) as small_queries:
+            self.request("mark-all-read", content="Bye")
+
+        for i in range(10):
+            self.receive(f"Hello #{i}", self.user)
+
+        with CaptureQueriesContext(connection) as large_queries:
+            self.request("mark-all-read", content="Hello")
+
+        # Marking costs the same statements, regardless of the number of items.
+        self.assertEqual(len(small_queries), len(large_queries))
+
+
+class SendableSelectAllTests(SelectAllTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageSelectAllTests(SelectAllTests, MessageMixin, APITestCase):
+    pass
+
+
+class NoticeSelectAllTests(SelectAllTests, NoticeMixin, APITestCase):
+    pass
@@ -0,0 +1,159 @@
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core import marks
+from sendables.core.models import ReceivedSendable
+from tests.types import TestCaseType
+from tests.utils import MessageMixin, NoticeMixin, SendableMixin, with_setting_changed
+
+
+class MarkBufferTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.received_ids = [
+            self.receive(content).id for content in ("Hello", "Hello again", "Bye")
+        ]
+
+        # Flushed explicitly instead.
+        patcher = mock.patch("sendables.core.marks.threading.Timer")
+        self.timer = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(marks._pending.clear)
+        self.addCleanup(setattr, marks, "_timer", None)
+
+    def receive(self, content: str) -> Any:
+        sendable = self.sendable_class.objects.create(content=content)
+        return ReceivedSendable.objects.create(recipient=self.user, sendable=sendable)
+
+    def mark(self, action: str, *received_ids: int) -> None:
+        response = self.client.patch(
+            reverse(f"{self.entity_name}-{action}"),
+            data={self.entity_name + "_ids": list(received_ids)},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def get_read_ids(self) -> list[int]:
+        return list(
+            ReceivedSendable.objects.filter(is_read=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    def test_mark_buffer(self) -> None:
+        first_id, second_id, third_id = self.received_ids
+
+        with CaptureQueriesContext(connection) as queries:
+            self.mark("mark-read", first_id, second_id)
+
+        # Nothing written, until flushed.
+        self.assertFalse(
+            any(query["sql"].startswith("UPDATE") for query in queries.captured_queries)
+        )
+        self.assertEqual(self.get_read_ids(), [])
+        self.timer.return_value.start.assert_called_once()
+
+        # Coalesced with the earlier marks.
+        self.mark("mark-unread", second_id)
+        self.mark("mark-read", third_id)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(marks.flush_marks(), 2)
+
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if query["sql"].startswith("UPDATE")
+                ]
+            ),
+            1,
+        )
+        self.assertEqual(self.get_read_ids(), [first_id, third_id])
+        self.timer.return_value.cancel.assert_called_once()
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    def test_mark_buffer_read_own(self) -> None:
+        self.mark("mark-read", self.received_ids[0])
+
+        response = self.client.get(reverse(f"{self.entity_name}-list-read"))
+        self.assertEqual(len(response.data), 1)
+
+        self.assertEqual(self.get_read_ids(), self.received_ids[:1])
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    @with_setting_changed("MARK_BUFFER_SIZE", 2)
+    def test_mark_buffer_full(self) -> None:
+        self.mark("mark-read", self.received_ids[0])
+        self.assertEqual(self.get_read_ids(), [])
+
+        self.mark("mark-read", *self.received_ids[1:])
+        self.assertEqual(self.get_read_ids(), self.received_ids)
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_mark_buffer_counted(self) -> None:
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+
+        self.mark("mark-read", *self.received_ids)
+        self.mark("mark-unread", self.received_ids[0])
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 2, "unread": 1, "total": 3})
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    @with_setting_changed("READ_WATERMARK", True)
+    def test_mark_buffer_watermark(self) -> None:
+        self.client.patch(reverse(f"{self.entity_name}-mark-all-read"))
+
+        self.mark("mark-unread", self.received_ids[0])
+        marks.flush_marks()
+
+        # Marked as unread after the watermark.
+        response = self.client.get(reverse(f"{self.entity_name}-list-unread"))
+        self.assertEqual(len(response.data), 1)
+
+    @with_setting_changed("BUFFER_MARKS", True)
+    def test_mark_buffer_failed(self) -> None:
+        first_id, second_id, _ = self.received_ids
+        self.mark("mark-read", first_id, second_id)
+
+        def fail(*args: Any) -> None:
+            # Marked again while flushing.
+            marks.buffer_marks(self.entity_name, self.user.pk, [second_id], False)
+            raise RuntimeError("Database unavailable")
+
+        with mock.patch("sendables.core.marks.apply_marks", side_effect=fail):
+            with self.assertRaises(RuntimeError):
+                marks.flush_marks()
+
+        # Kept pending, with the newer mark in place.
+        self.assertEqual(
+            marks._pending[self.entity_name][self.user.pk],
+            {second_id: False, first_id: True},
+        )
+
+        self.assertEqual(marks.flush_marks(), 1)
+        self.assertEqual(self.get_read_ids(), [first_id])
+
+
+class SendableMarkBufferTests(MarkBufferTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageMarkBufferTests(MarkBufferTests, MessageMixin, APITestCase):
+    pass
+
+
+class NoticeMarkBufferTests(MarkBufferTests, NoticeMixin, APITestCase):
+    pass
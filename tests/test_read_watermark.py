@@ -0,0 +1,141 @@
+from io import StringIO
+from typing import Any
+from urllib.parse import urlencode
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReadWatermark, ReceivedSendable
+from sendables.core.pagination import KeysetPagination
+from tests.types import TestCaseType
+from tests.utils import MessageMixin, NoticeMixin, SendableMixin, with_setting_changed
+
+
+class Pagination(KeysetPagination):
+    page_size = 2
+
+
+class ReadWatermarkTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+
+        for content in "Hello", "Hello again", "Bye":
+            self.receive(content)
+
+    def receive(self, content: str) -> Any:
+        sendable = self.sendable_class.objects.create(content=content)
+        return ReceivedSendable.objects.create(recipient=self.user, sendable=sendable)
+
+    def request(self, action: str, data: Any = None, **query_params: str) -> Response:
+        url = reverse(f"{self.entity_name}-{action}")
+
+        response = self.client.patch(f"{url}?{urlencode(query_params)}", data=data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    def get_read_states(self, action: str = "list") -> dict[str, bool]:
+        response = self.client.get(reverse(f"{self.entity_name}-{action}"))
+        return {item["content"]: item["is_read"] for item in response.data}
+
+    def get_counts(self) -> Any:
+        return self.client.get(reverse(f"{self.entity_name}-counts")).data
+
+    @with_setting_changed("READ_WATERMARK", True)
+    def test_read_watermark_mark_all(self) -> None:
+        response = self.request("mark-all-read")
+        self.assertEqual(response.data, {"count": 3})
+
+        # Only the watermark is stored.
+        self.assertEqual(ReadWatermark.objects.count(), 1)
+        self.assertFalse(ReceivedSendable.objects.filter(is_read=True).exists())
+
+        self.assertEqual(
+            self.get_read_states(), {"Hello": True, "Hello again": True, "Bye": True}
+        )
+        self.assertEqual(self.get_read_states("list-unread"), {})
+        self.assertEqual(len(self.get_read_states("list-read")), 3)
+        self.assertEqual(self.get_counts(), {"read": 3, "unread": 0, "total": 3})
+
+        # Nothing left to mark.
+        self.assertEqual(self.request("mark-all-read").data, {"count": 0})
+
+    @with_setting_changed("READ_WATERMARK", True)
+    def test_read_watermark_later(self) -> None:
+        self.request("mark-all-read")
+
+        # Received, or marked as unread, after the watermark.
+        self.receive("New")
+        received_sendable = ReceivedSendable.objects.filter(
+            recipient=self.user
+        ).earliest("id")
+        self.request(
+            "mark-unread", data={self.entity_name + "_ids": [received_sendable.id]}
+        )
+
+        self.assertEqual(
+            self.get_read_states("list-unread"), {"Hello": False, "New": False}
+        )
+        self.assertEqual(self.get_counts(), {"read": 2, "unread": 2, "total": 4})
+
+        response = self.client.get(
+            reverse(f"{self.entity_name}-detail", args=[received_sendable.id])
+        )
+        self.assertFalse(response.data["is_read"])
+
+    @with_setting_changed("READ_WATERMARK", True)
+    def test_read_watermark_filtered(self) -> None:
+        response = self.request("mark-all-read", content="Hello")
+        self.assertEqual(response.data, {"count": 2})
+
+        # Marked one by one.
+        self.assertFalse(ReadWatermark.objects.exists())
+        self.assertEqual(ReceivedSendable.objects.filter(is_read=True).count(), 2)
+
+    @with_setting_changed("READ_WATERMARK", True)
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_read_watermark_counted(self) -> None:
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+
+        self.request("mark-all-read")
+        self.receive("New")
+        self.assertEqual(self.get_counts(), {"read": 3, "unread": 0, "total": 3})
+
+        # Rebuilt counters agree with the watermark.
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+        self.assertEqual(self.get_counts(), {"read": 3, "unread": 1, "total": 4})
+
+    @with_setting_changed("READ_WATERMARK", True)
+    @with_setting_changed("PAGINATION_CLASS", Pagination)
+    def test_read_watermark_keyset_paginated(self) -> None:
+        self.request("mark-all-read")
+        self.receive("New")
+
+        for projection in None, "sendables.core.policies.list.get_received_projection":
+            with self.setting_changed("PROJECTION_RECEIVED", projection):
+                contents = []
+                url: str | None = reverse(f"{self.entity_name}-list")
+                while url is not None:
+                    response = self.client.get(url)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+                    contents += [item["content"] for item in response.data["results"]]
+                    url = response.data["next"]
+
+                # Unread first, by the read state the watermark results in.
+                self.assertEqual(contents, ["New", "Bye", "Hello again", "Hello"])
+
+
+class SendableReadWatermarkTests(ReadWatermarkTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageReadWatermarkTests(ReadWatermarkTests, MessageMixin, APITestCase):
+    pass
+
+
+class NoticeReadWatermarkTests(ReadWatermarkTests, NoticeMixin, APITestCase):
+    pass
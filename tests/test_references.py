@@ -0,0 +1,150 @@
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable
+from sendables.core.storage import remove_received_references
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+
+class ReferencesTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.third_user = User.objects.create_user(username="carol")
+
+    def send(self, *recipients: Any) -> Any:
+        response = self.client.post(
+            reverse(f"{self.entity_name}-send"),
+            data={
+                "content": "Hello",
+                "recipient_ids": [recipient.id for recipient in recipients],
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        return self.sendable_class.objects.latest("id")
+
+    def delete(self, user: Any, sendable: Any) -> None:
+        received_sendable = ReceivedSendable.objects.get(
+            recipient=user, object_id=sendable.id
+        )
+
+        self.client.force_authenticate(user)
+        response = self.client.delete(
+            reverse(f"{self.entity_name}-delete"),
+            data={self.entity_name + "_ids": [received_sendable.id]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.client.force_authenticate(self.user)
+
+    def get_remaining_recipients(self, sendable: Any) -> int:
+        sendable.refresh_from_db()
+        return int(sendable.remaining_recipients)
+
+    def test_references_send(self) -> None:
+        sendable = self.send(self.other_user, self.third_user)
+        self.assertEqual(self.get_remaining_recipients(sendable), 2)
+
+        self.delete(self.other_user, sendable)
+        self.assertEqual(self.get_remaining_recipients(sendable), 1)
+
+    def test_references_send_batch(self) -> None:
+        response = self.client.post(
+            reverse(f"{self.entity_name}-send-batch"),
+            data={
+                f"{self.entity_name}s": [
+                    {"content": "first", "recipient_ids": [self.other_user.id]},
+                    {
+                        "content": "second",
+                        "recipient_ids": [self.other_user.id, self.third_user.id],
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        remaining_recipients = dict(
+            self.sendable_class.objects.values_list("content", "remaining_recipients")
+        )
+        self.assertEqual(remaining_recipients, {"first": 1, "second": 2})
+
+    @with_setting_changed("ALLOW_BROADCASTS", True)
+    def test_references_broadcast(self) -> None:
+        self.client.force_authenticate(User.objects.create_superuser(username="root"))
+        self.client.post(
+            reverse(f"{self.entity_name}-broadcast"), data={"content": "Hello"}
+        )
+        sendable = self.sendable_class.objects.get()
+        self.assertEqual(self.get_remaining_recipients(sendable), 0)
+
+        for user in self.other_user, self.third_user:
+            self.client.force_authenticate(user)
+            self.client.get(reverse(f"{self.entity_name}-list"))
+
+        self.assertEqual(self.get_remaining_recipients(sendable), 2)
+
+    def test_references_rebuild(self) -> None:
+        sendable = self.send(self.other_user, self.third_user)
+        self.sendable_class.objects.update(remaining_recipients=0)
+
+        call_command(
+            "sendables_rebuild_references", self.entity_name, stdout=StringIO()
+        )
+
+        self.assertEqual(self.get_remaining_recipients(sendable), 2)
+
+    def test_references_removed_concurrently(self) -> None:
+        sendable = self.send(self.other_user)
+
+        def remove(*args: Any) -> None:
+            # Removed by its sender, while waiting for the lock.
+            self.sendable_class.objects.filter(id=sendable.id).update(is_removed=True)
+            remove_received_references(*args)
+
+        with mock.patch(
+            "sendables.core.serializers.remove_received_references", side_effect=remove
+        ):
+            self.delete(self.other_user, sendable)
+
+        self.assertFalse(self.sendable_class.objects.filter(id=sendable.id).exists())
+
+
+class SendableReferencesTests(ReferencesTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageReferencesTests(ReferencesTests, MessageMixin, APITestCase):
+    def delete_sent(self, sendable: Any) -> None:
+        response = self.client.delete(
+            reverse(f"{self.entity_name}-delete-sent"),
+            data={self.entity_name + "_ids": [sendable.id]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_references_hanging(self) -> None:
+        sendable = self.send(self.other_user, self.third_user)
+        self.delete(self.other_user, sendable)
+
+        # Still received by a recipient.
+        self.delete_sent(sendable)
+        self.assertTrue(self.sendable_class.objects.filter(id=sendable.id).exists())
+
+        self.delete(self.third_user, sendable)
+        self.assertFalse(self.sendable_class.objects.filter(id=sendable.id).exists())
+
+
+class NoticeReferencesTests(ReferencesTests, NoticeMixin, APITestCase):
+    pass
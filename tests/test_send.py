@@ -1,11 +1,18 @@
 from typing import Any, Sequence, TypeVar, cast
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
-from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+from sendables.core.models import (
+    ReceivedSendable,
+    RecipientSendableAssociation,
+    SearchEntry,
+)
+from sendables.core.types import FilterType
 from tests.models import Sendable
 from tests.types import TestCaseType
 from tests.utils import (
@@ -81,11 +88,51 @@ class SendTests(TestCaseType):
         received_sendable = self.get_sole_record(ReceivedSendable)
         self.assertEqual(received_sendable.sendable, sendable)
         self.assertEqual(received_sendable.recipient, self.other_user)
+        self.assertEqual(received_sendable.sent_on, sendable.sent_on)
 
         association = self.get_sole_record(RecipientSendableAssociation)
         self.assertEqual(association.sendable, sendable)
         self.assertEqual(association.recipient, self.other_user)
 
+    def test_send_fan_out_queries(self) -> None:
+        third_user = User.objects.create_user(username="carol")
+
+        with CaptureQueriesContext(connection) as single_queries:
+            self.assert_created(self.send("single", self.other_user.id))
+
+        with CaptureQueriesContext(connection) as multiple_queries:
+            self.assert_created(
+                self.send("multiple", self.other_user.id, third_user.id)
+            )
+
+        # Fanning out costs the same statements, regardless of the recipient count.
+        self.assertEqual(len(single_queries), len(multiple_queries))
+
+        sendable = self.sendable_class.objects.get(content="multiple")
+        for model_class in ReceivedSendable, RecipientSendableAssociation:
+            records = model_class.objects.filter(object_id=sendable.id)
+            self.assertCountEqual(
+                [record.recipient for record in records], [self.other_user, third_user]
+            )
+
+        received_sendable = ReceivedSendable.objects.filter(object_id=sendable.id)[0]
+        self.assertEqual(received_sendable.sendable, sendable)
+        self.assertEqual(received_sendable.sent_on, sendable.sent_on)
+        self.assertFalse(received_sendable.is_read)
+
+    @with_setting_changed("FILTER_FIELDS_SENDABLES", {"content": FilterType.FULLTEXT})
+    def test_send_indexed(self) -> None:
+        CONTENT = "searchable words"
+
+        response = self.send(CONTENT, self.other_user.id)
+        self.assert_created(response)
+
+        sendable = self.sendable_class.objects.get()
+        entry = SearchEntry.objects.get()
+        self.assertEqual(entry.object_id, sendable.id)
+        self.assertEqual(entry.field_name, "content")
+        self.assertEqual(entry.document, CONTENT)
+
     @assert_forbidden
     def test_send_forbidden(self) -> Response:
         return self.send("hello", self.other_user.id)
@@ -0,0 +1,132 @@
+from typing import Any
+
+from django.contrib.auth.models import Group
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable, SendJob
+from sendables.core.types import FilterType
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+FILTER_FIELDS_RECIPIENTS = {
+    "username": FilterType.STARTSWITH,
+    "groups__name": FilterType.EQUALS,
+}
+
+
+class SendAudienceTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.moderators = [
+            User.objects.create_user(username="mod_carol"),
+            User.objects.create_user(username="mod_dave"),
+        ]
+
+    def send(self, **data: Any) -> Response:
+        return self.client.post(
+            self.url, data={"content": "Hello", **data}, format="json"
+        )
+
+    def get_recipients(self) -> list[Any]:
+        return [
+            received_sendable.recipient
+            for received_sendable in ReceivedSendable.objects.all()
+        ]
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    @with_setting_changed("FILTER_FIELDS_RECIPIENTS", FILTER_FIELDS_RECIPIENTS)
+    def test_send_audience_success(self) -> None:
+        response = self.send(audience={"username": "mod_"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertCountEqual(self.get_recipients(), self.moderators)
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    @with_setting_changed("FILTER_FIELDS_RECIPIENTS", FILTER_FIELDS_RECIPIENTS)
+    def test_send_audience_group(self) -> None:
+        group = Group.objects.create(name="readers")
+        self.other_user.groups.add(group)
+        self.moderators[0].groups.add(group)
+
+        response = self.send(audience={"groups__name": ["readers"]})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertCountEqual(
+            self.get_recipients(), [self.other_user, self.moderators[0]]
+        )
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    @with_setting_changed("FILTER_FIELDS_RECIPIENTS", FILTER_FIELDS_RECIPIENTS)
+    def test_send_audience_groups_overlapping(self) -> None:
+        for name in "a", "b":
+            self.other_user.groups.add(Group.objects.create(name=name))
+
+        response = self.send(audience={"groups__name": ["a", "b"]})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # Received once, though a member of both groups.
+        self.assertEqual(self.get_recipients(), [self.other_user])
+        self.assertEqual(self.sendable_class.objects.get().remaining_recipients, 1)
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    @with_setting_changed("FILTER_FIELDS_RECIPIENTS", FILTER_FIELDS_RECIPIENTS)
+    @with_setting_changed("SEND_JOB_THRESHOLD", 1)
+    @with_setting_changed("SEND_JOB_EXECUTOR", "sendables.core.jobs.run_in_worker")
+    def test_send_audience_job(self) -> None:
+        response = self.send(audience={"username": "mod_"})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        job = SendJob.objects.get(id=response.data["job_id"])
+        self.assertEqual(
+            sum(job.chunks.values_list("size", flat=True)), len(self.moderators)
+        )
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    def test_send_audience_no_filters(self) -> None:
+        response = self.send(audience={"unknown": ["x"]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(ReceivedSendable.objects.exists())
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    def test_send_audience_no_recipients(self) -> None:
+        response = self.send(audience={"username": ["nobody"]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    def test_send_audience_and_ids(self) -> None:
+        response = self.send(
+            audience={"username": ["alice"]}, recipient_ids=[self.other_user.id]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @with_setting_changed("ALLOW_AUDIENCE_SEND", True)
+    def test_send_audience_neither(self) -> None:
+        response = self.send()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_send_audience_disallowed(self) -> None:
+        response = self.send(audience={"username": ["alice"]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(ReceivedSendable.objects.exists())
+
+
+class SendableSendAudienceTests(SendAudienceTests, SendableMixin, APITestCase):
+    action = "send"
+
+
+class MessageSendAudienceTests(SendAudienceTests, MessageMixin, APITestCase):
+    action = "send"
+
+
+class NoticeSendAudienceTests(SendAudienceTests, NoticeMixin, APITestCase):
+    action = "send"
@@ -0,0 +1,151 @@
+from typing import Any
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+batches: list[Any] = []
+
+
+def record_batch(request: Any, batch: list[Any]) -> None:
+    batches.append(batch)
+
+
+class SendBatchTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.third_user = User.objects.create_user(username="carol")
+
+    def send_batch(self, *items: tuple[str, list[Any]]) -> Response:
+        return self.client.post(
+            self.url,
+            data={
+                f"{self.entity_name}s": [
+                    {"content": content, "recipient_ids": recipient_ids}
+                    for content, recipient_ids in items
+                ]
+            },
+            format="json",
+        )
+
+    def get_recipients(self, model_class: Any, content: str) -> list[Any]:
+        sendable = self.sendable_class.objects.get(content=content)
+        records = model_class.objects.filter(object_id=sendable.id)
+
+        return [record.recipient for record in records]
+
+    def test_send_batch_success(self) -> None:
+        response = self.send_batch(
+            ("first", [self.other_user.id]),
+            ("second", [self.other_user.id, self.third_user.id]),
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        for model_class in ReceivedSendable, RecipientSendableAssociation:
+            self.assertEqual(
+                self.get_recipients(model_class, "first"), [self.other_user]
+            )
+            self.assertCountEqual(
+                self.get_recipients(model_class, "second"),
+                [self.other_user, self.third_user],
+            )
+
+    def test_send_batch_queries(self) -> None:
+        with CaptureQueriesContext(connection) as small_queries:
+            self.send_batch(("a", [self.other_user.id]))
+
+        with CaptureQueriesContext(connection) as large_queries:
+            self.send_batch(
+                ("b", [self.other_user.id]),
+                ("c", [self.third_user.id]),
+                ("d", [self.other_user.id, self.third_user.id]),
+            )
+
+        # Sending costs the same statements, regardless of the batch size.
+        self.assertEqual(len(small_queries), len(large_queries))
+
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_send_batch_counted(self) -> None:
+        self.send_batch(
+            ("first", [self.other_user.id]),
+            ("second", [self.other_user.id, self.third_user.id]),
+        )
+
+        self.client.force_authenticate(self.third_user)
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 1, "total": 1})
+
+    @with_setting_changed(
+        "AFTER_SEND_BATCH_CALLBACKS", ["tests.test_send_batch.record_batch"]
+    )
+    def test_send_batch_callbacks(self) -> None:
+        batches.clear()
+
+        self.send_batch(
+            ("first", [self.other_user.id]),
+            ("second", [self.third_user.id, 0]),
+        )
+
+        self.assertEqual(
+            batches,
+            [
+                [
+                    ({"content": "first"}, [self.other_user.id]),
+                    ({"content": "second"}, [self.third_user.id]),
+                ]
+            ],
+        )
+
+    def test_send_batch_no_valid_ids(self) -> None:
+        response = self.send_batch(("first", [self.other_user.id]), ("second", [0]))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(ReceivedSendable.objects.exists())
+
+    @with_setting_changed("SEND_BATCH_MAX_SIZE", 1)
+    def test_send_batch_too_large(self) -> None:
+        response = self.send_batch(
+            ("first", [self.other_user.id]), ("second", [self.other_user.id])
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_send_batch_empty(self) -> None:
+        response = self.send_batch()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class SendableSendBatchTests(SendBatchTests, SendableMixin, APITestCase):
+    action = "send-batch"
+
+
+class MessageSendBatchTests(SendBatchTests, MessageMixin, APITestCase):
+    action = "send-batch"
+
+    def test_send_batch_sender(self) -> None:
+        self.send_batch(("first", [self.other_user.id]))
+
+        message = self.sendable_class.objects.get(content="first")
+        self.assertEqual(message.sender, self.user)
+
+
+class NoticeSendBatchTests(SendBatchTests, NoticeMixin, APITestCase):
+    action = "send-batch"
+
+    def test_send_batch_non_admin_forbidden(self) -> None:
+        self.client.force_authenticate(self.other_user)
+
+        response = self.send_batch(("first", [self.user.id]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
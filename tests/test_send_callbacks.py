@@ -0,0 +1,210 @@
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core import callbacks
+from sendables.core.models import SendCallback
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+calls: list[Any] = []
+
+
+def record_send(request: Any, sent_fields: dict[str, Any], recipients: Any) -> None:
+    calls.append((request is not None, sent_fields, list(recipients)))
+
+
+def record_batch(request: Any, batch: list[Any]) -> None:
+    calls.append((request is not None, batch))
+
+
+def fail(*args: Any) -> None:
+    raise RuntimeError("Service unavailable")
+
+
+class SendCallbackTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.third_user = User.objects.create_user(username="carol")
+        calls.clear()
+
+    def send(self, content: str, *recipients: Any) -> Response:
+        return self.client.post(
+            self.url,
+            data={
+                "content": content,
+                "recipient_ids": [recipient.id for recipient in recipients],
+            },
+        )
+
+    def run_callbacks(self) -> None:
+        call_command("sendables_run_send_callbacks", stdout=StringIO())
+
+    @with_setting_changed(
+        "AFTER_SEND_CALLBACKS", ["tests.test_send_callbacks.record_send"]
+    )
+    def test_send_callbacks_inline(self) -> None:
+        self.send("Hello", self.other_user)
+
+        self.assertEqual(calls, [(True, {"content": "Hello"}, [self.other_user])])
+        self.assertFalse(SendCallback.objects.exists())
+
+    @with_setting_changed(
+        "AFTER_SEND_CALLBACKS", ["tests.test_send_callbacks.record_send"]
+    )
+    @with_setting_changed("COALESCE_SEND_CALLBACKS", True)
+    def test_send_callbacks_inline_coalesced(self) -> None:
+        self.send("Hello", self.other_user)
+
+        # Nothing deferred to coalesce.
+        self.assertEqual(calls, [(True, {"content": "Hello"}, [self.other_user])])
+
+    @with_setting_changed(
+        "AFTER_SEND_CALLBACKS", ["tests.test_send_callbacks.record_send"]
+    )
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_in_thread_pool"
+    )
+    def test_send_callbacks_thread_pool(self) -> None:
+        pool = mock.Mock()
+        pool.submit.side_effect = lambda function: function()
+
+        with mock.patch("sendables.core.callbacks._thread_pool", pool):
+            with mock.patch("sendables.core.callbacks.connections"):
+                with self.captureOnCommitCallbacks() as on_commit_callbacks:
+                    self.send("Hello", self.other_user)
+
+                # Not invoked before the sending is committed.
+                self.assertEqual(calls, [])
+
+                for on_commit_callback in on_commit_callbacks:
+                    on_commit_callback()
+
+        self.assertEqual(calls, [(True, {"content": "Hello"}, [self.other_user])])
+
+    @with_setting_changed(
+        "AFTER_SEND_BATCH_CALLBACKS", ["tests.test_send_callbacks.record_batch"]
+    )
+    @with_setting_changed("COALESCE_SEND_CALLBACKS", True)
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_in_thread_pool"
+    )
+    def test_send_callbacks_thread_pool_coalesced(self) -> None:
+        pool = mock.Mock()
+
+        with mock.patch("sendables.core.callbacks._thread_pool", pool):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.send("First", self.other_user)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.send("Second", self.other_user, self.third_user)
+
+        # Queued while the pool was busy, so handled by a single drain.
+        self.assertEqual(pool.submit.call_count, 1)
+        with mock.patch("sendables.core.callbacks.connections"):
+            pool.submit.call_args.args[0]()
+
+        self.assertEqual(
+            calls,
+            [
+                (
+                    False,
+                    [
+                        ({"content": "First"}, [self.other_user.id]),
+                        (
+                            {"content": "Second"},
+                            [self.other_user.id, self.third_user.id],
+                        ),
+                    ],
+                )
+            ],
+        )
+
+    @with_setting_changed(
+        "AFTER_SEND_CALLBACKS", ["tests.test_send_callbacks.record_send"]
+    )
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_to_outbox"
+    )
+    def test_send_callbacks_outbox(self) -> None:
+        self.send("Hello", self.other_user, self.third_user)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(SendCallback.objects.count(), 1)
+
+        self.run_callbacks()
+
+        self.assertEqual(len(calls), 1)
+        has_request, sent_fields, recipients = calls[0]
+        self.assertFalse(has_request)
+        self.assertEqual(sent_fields, {"content": "Hello"})
+        self.assertCountEqual(recipients, [self.other_user, self.third_user])
+        self.assertFalse(SendCallback.objects.exists())
+
+    @with_setting_changed(
+        "AFTER_SEND_BATCH_CALLBACKS", ["tests.test_send_callbacks.record_batch"]
+    )
+    @with_setting_changed("COALESCE_SEND_CALLBACKS", True)
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_to_outbox"
+    )
+    def test_send_callbacks_outbox_coalesced(self) -> None:
+        self.send("First", self.other_user)
+        self.send("Second", self.third_user)
+
+        self.run_callbacks()
+
+        self.assertEqual(
+            calls,
+            [
+                (
+                    False,
+                    [
+                        ({"content": "First"}, [self.other_user.id]),
+                        ({"content": "Second"}, [self.third_user.id]),
+                    ],
+                )
+            ],
+        )
+
+    @with_setting_changed("AFTER_SEND_CALLBACKS", ["tests.test_send_callbacks.fail"])
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_to_outbox"
+    )
+    def test_send_callbacks_outbox_failed(self) -> None:
+        self.send("Hello", self.other_user)
+
+        with self.assertRaises(RuntimeError):
+            callbacks.run_pending_send_callbacks()
+
+        # Kept, to be retried.
+        self.assertEqual(SendCallback.objects.count(), 1)
+
+    @with_setting_changed(
+        "SEND_CALLBACK_DISPATCHER", "sendables.core.callbacks.dispatch_to_outbox"
+    )
+    def test_send_callbacks_none_configured(self) -> None:
+        self.send("Hello", self.other_user)
+
+        self.assertFalse(SendCallback.objects.exists())
+
+
+class SendableSendCallbackTests(SendCallbackTests, SendableMixin, APITestCase):
+    action = "send"
+
+
+class MessageSendCallbackTests(SendCallbackTests, MessageMixin, APITestCase):
+    action = "send"
+
+
+class NoticeSendCallbackTests(SendCallbackTests, NoticeMixin, APITestCase):
+    action = "send"
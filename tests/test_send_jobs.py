@@ -0,0 +1,174 @@
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from sendables.core.fanout import fan_out
+from sendables.core.jobs import run_send_job
+from sendables.core.models import (
+    ReceivedSendable,
+    RecipientSendableAssociation,
+    SendJob,
+    SendJobChunk,
+    SendJobRecipient,
+)
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+
+class SendJobTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.recipients = [
+            self.other_user,
+            User.objects.create_user(username="carol"),
+            User.objects.create_user(username="dave"),
+        ]
+
+    def send(self) -> Response:
+        return self.client.post(
+            reverse(f"{self.entity_name}-send"),
+            data={
+                "content": "To many",
+                "recipient_ids": [user.id for user in self.recipients],
+            },
+        )
+
+    def get_job(self, job_id: Any) -> Response:
+        return self.client.get(
+            reverse(f"{self.entity_name}-send-job", kwargs={"id": job_id})
+        )
+
+    def run_jobs(self) -> None:
+        call_command("sendables_run_send_jobs", stdout=StringIO())
+
+    def assert_sent(self) -> None:
+        for model_class in ReceivedSendable, RecipientSendableAssociation:
+            records = model_class.objects.all()
+            self.assertCountEqual(
+                [record.recipient for record in records], self.recipients
+            )
+
+        self.assertFalse(SendJobRecipient.objects.exists())
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 2)
+    @with_setting_changed("SEND_JOB_CHUNK_SIZE", 2)
+    @with_setting_changed("SEND_JOB_EXECUTOR", "sendables.core.jobs.run_in_worker")
+    def test_send_job_success(self) -> None:
+        response = self.send()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        job_id = response.data["job_id"]
+        self.assertEqual(SendJobChunk.objects.filter(job=job_id).count(), 2)
+        self.assertFalse(ReceivedSendable.objects.exists())
+
+        response = self.get_job(job_id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response.data["total"], 3)
+        self.assertEqual(response.data["sent"], 0)
+
+        self.run_jobs()
+        self.assert_sent()
+
+        response = self.get_job(job_id)
+        self.assertEqual(response.data["status"], "done")
+        self.assertEqual(response.data["sent"], 3)
+        self.assertIsNotNone(response.data["finished_on"])
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 2)
+    @with_setting_changed("SEND_JOB_EXECUTOR", "sendables.core.jobs.run_in_worker")
+    def test_send_job_retried(self) -> None:
+        job_id = self.send().data["job_id"]
+
+        calls = []
+
+        def fail_once(*args: Any) -> int:
+            calls.append(args)
+            if len(calls) == 1:
+                raise RuntimeError("Connection lost")
+
+            return fan_out(*args)
+
+        with mock.patch("sendables.core.jobs.fan_out", side_effect=fail_once):
+            self.run_jobs()
+
+        self.assert_sent()
+
+        chunk = SendJobChunk.objects.get(job=job_id)
+        self.assertEqual(chunk.attempts, 2)
+        self.assertEqual(chunk.error, "RuntimeError('Connection lost')")
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 2)
+    @with_setting_changed("SEND_JOB_MAX_ATTEMPTS", 2)
+    @with_setting_changed("SEND_JOB_EXECUTOR", "sendables.core.jobs.run_in_worker")
+    def test_send_job_failed(self) -> None:
+        job_id = self.send().data["job_id"]
+
+        with mock.patch("sendables.core.jobs.fan_out", side_effect=RuntimeError):
+            self.run_jobs()
+
+        self.assertFalse(ReceivedSendable.objects.exists())
+        response = self.get_job(job_id)
+        self.assertEqual(response.data["status"], "failed")
+        self.assertEqual(response.data["sent"], 0)
+
+        # Failed chunks can be retried, once allowed more attempts.
+        with self.setting_changed("SEND_JOB_MAX_ATTEMPTS", 3):
+            run_send_job(job_id)
+
+        self.assert_sent()
+        self.assertEqual(self.get_job(job_id).data["status"], "done")
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 2)
+    def test_send_job_thread_pool(self) -> None:
+        pool = mock.Mock()
+        pool.submit.side_effect = lambda function, job_id: run_send_job(job_id)
+
+        with mock.patch("sendables.core.jobs._thread_pool", pool):
+            with self.captureOnCommitCallbacks(execute=True):
+                job_id = self.send().data["job_id"]
+
+        self.assert_sent()
+        self.assertEqual(SendJob.objects.get(id=job_id).status, "done")
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 3)
+    def test_send_job_below_threshold(self) -> None:
+        response = self.send()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("job_id", response.data)
+        self.assertFalse(SendJob.objects.exists())
+        self.assert_sent()
+
+    @with_setting_changed("SEND_JOB_THRESHOLD", 2)
+    @with_setting_changed("SEND_JOB_EXECUTOR", "sendables.core.jobs.run_in_worker")
+    def test_send_job_of_other_user(self) -> None:
+        job_id = self.send().data["job_id"]
+
+        self.client.force_authenticate(self.other_user)
+        response = self.get_job(job_id)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SendableSendJobTests(SendJobTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageSendJobTests(SendJobTests, MessageMixin, APITestCase):
+    pass
+
+
+class NoticeSendJobTests(SendJobTests, NoticeMixin, APITestCase):
+    pass
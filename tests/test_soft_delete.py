@@ -0,0 +1,135 @@
+from io import StringIO
+from typing import Any
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable
+from tests.types import TestCaseType
+from tests.utils import MessageMixin, NoticeMixin, SendableMixin, with_setting_changed
+
+
+class SoftDeleteTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.received_sendables = [
+            self.receive(content) for content in ("Hello", "Hello again", "Bye")
+        ]
+
+    def receive(self, content: str) -> Any:
+        sendable = self.sendable_class.objects.create(content=content)
+        return ReceivedSendable.objects.create(recipient=self.user, sendable=sendable)
+
+    def delete(self, *received_sendables: Any) -> None:
+        response = self.client.delete(
+            reverse(f"{self.entity_name}-delete"),
+            data={
+                self.entity_name
+                + "_ids": [
+                    received_sendable.id for received_sendable in received_sendables
+                ]
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def purge(self, *args: str) -> str:
+        stdout = StringIO()
+        call_command("sendables_purge_received", self.entity_name, *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    @with_setting_changed("SOFT_DELETE_RECEIVED", True)
+    def test_soft_delete(self) -> None:
+        first, *rest = self.received_sendables
+
+        with CaptureQueriesContext(connection) as queries:
+            self.delete(first)
+
+        self.assertFalse(
+            any(query["sql"].startswith("DELETE") for query in queries.captured_queries)
+        )
+        self.assertTrue(ReceivedSendable.objects.filter(id=first.id).exists())
+
+        response = self.client.get(reverse(f"{self.entity_name}-list"))
+        self.assertEqual(
+            [item["id"] for item in response.data], [rest[1].id, rest[0].id]
+        )
+
+        response = self.client.get(
+            reverse(f"{self.entity_name}-detail", args=[first.id])
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 2, "total": 2})
+
+    @with_setting_changed("SOFT_DELETE_RECEIVED", True)
+    def test_soft_delete_purge(self) -> None:
+        first, second, _ = self.received_sendables
+        self.sendable_class.objects.filter(id=first.object_id).update(is_removed=True)
+
+        self.delete(first, second)
+
+        # Left hanging until purged.
+        self.assertTrue(self.sendable_class.objects.filter(id=first.object_id).exists())
+
+        self.assertIn(
+            f"Would purge 2 received {self.entity_name}(s).", self.purge("--dry-run")
+        )
+        self.assertEqual(ReceivedSendable.objects.count(), 3)
+
+        self.assertIn(
+            f"Purged 2 received {self.entity_name}(s).", self.purge("--batch-size", "1")
+        )
+        self.assertEqual(ReceivedSendable.objects.count(), 1)
+        self.assertFalse(
+            self.sendable_class.objects.filter(id=first.object_id).exists()
+        )
+        self.assertTrue(
+            self.sendable_class.objects.filter(id=second.object_id).exists()
+        )
+
+    @with_setting_changed("SOFT_DELETE_RECEIVED", True)
+    @with_setting_changed("MAINTAIN_COUNTERS", True)
+    def test_soft_delete_counted(self) -> None:
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+
+        self.delete(self.received_sendables[0])
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 2, "total": 2})
+
+        # Rebuilt counters agree.
+        call_command("sendables_rebuild_counters", stdout=StringIO())
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 2, "total": 2})
+
+    @with_setting_changed("SOFT_DELETE_RECEIVED", True)
+    @with_setting_changed("UNIFIED_STORAGE", True)
+    def test_soft_delete_unified(self) -> None:
+        first, second, _ = self.received_sendables
+        ReceivedSendable.objects.filter(id=second.id).update(visible_to_sender=False)
+
+        self.delete(first, second)
+        self.purge()
+
+        # Still needed as sent-to info.
+        self.assertTrue(ReceivedSendable.objects.filter(id=first.id).exists())
+        self.assertFalse(ReceivedSendable.objects.filter(id=second.id).exists())
+
+
+class SendableSoftDeleteTests(SoftDeleteTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageSoftDeleteTests(SoftDeleteTests, MessageMixin, APITestCase):
+    pass
+
+
+class NoticeSoftDeleteTests(SoftDeleteTests, NoticeMixin, APITestCase):
+    pass
@@ -0,0 +1,136 @@
+from typing import Any
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sendables.core.models import ReceivedSendable, RecipientSendableAssociation
+from tests.types import TestCaseType
+from tests.utils import (
+    MessageMixin,
+    NoticeMixin,
+    SendableMixin,
+    User,
+    with_setting_changed,
+)
+
+
+class UnifiedStorageTests(TestCaseType):
+    def setUp(self) -> None:
+        super().setUp()
+        self.third_user = User.objects.create_user(username="carol")
+
+        with self.setting_changed("UNIFIED_STORAGE", True):
+            self.client.post(
+                reverse(f"{self.entity_name}-send"),
+                data={
+                    "content": "Hello",
+                    "recipient_ids": [self.other_user.id, self.third_user.id],
+                },
+            )
+        self.sendable = self.sendable_class.objects.get()
+
+    def get_received_sendable(self, user: Any) -> ReceivedSendable:
+        received_sendable = ReceivedSendable.objects.get(recipient=user)
+        return received_sendable  # type: ignore[no-any-return]
+
+    def delete(self, user: Any) -> None:
+        self.client.force_authenticate(user)
+        response = self.client.delete(
+            reverse(f"{self.entity_name}-delete"),
+            data={
+                self.entity_name + "_ids": [self.get_received_sendable(user).id],
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_unified_storage_send(self) -> None:
+        self.assertEqual(ReceivedSendable.objects.count(), 2)
+        self.assertFalse(RecipientSendableAssociation.objects.exists())
+
+    @with_setting_changed("UNIFIED_STORAGE", True)
+    def test_unified_storage_delete(self) -> None:
+        self.delete(self.other_user)
+
+        # Kept as sent-to info, but gone from the recipient's inbox.
+        received_sendable = self.get_received_sendable(self.other_user)
+        self.assertTrue(received_sendable.deleted_by_recipient)
+
+        response = self.client.get(reverse(f"{self.entity_name}-list"))
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(reverse(f"{self.entity_name}-counts"))
+        self.assertEqual(response.data, {"read": 0, "unread": 0, "total": 0})
+
+        response = self.client.patch(
+            reverse(f"{self.entity_name}-mark-read"),
+            data={self.entity_name + "_ids": [received_sendable.id]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(self.third_user)
+        response = self.client.get(reverse(f"{self.entity_name}-list"))
+        self.assertEqual(len(response.data), 1)
+
+
+class SendableUnifiedStorageTests(UnifiedStorageTests, SendableMixin, APITestCase):
+    pass
+
+
+class MessageUnifiedStorageTests(UnifiedStorageTests, MessageMixin, APITestCase):
+    def get_sent_recipients(self) -> list[str]:
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse("message-list-sent"))
+
+        return [
+            recipient["username"]
+            for item in response.data
+            for recipient in item["recipients"]
+        ]
+
+    @with_setting_changed("UNIFIED_STORAGE", True)
+    def test_unified_storage_list_sent(self) -> None:
+        self.assertCountEqual(self.get_sent_recipients(), ["alice", "carol"])
+
+        # Still shown as sent to recipients that deleted it.
+        self.delete(self.other_user)
+        self.assertCountEqual(self.get_sent_recipients(), ["alice", "carol"])
+
+        response = self.client.get(
+            reverse("message-list-sent"), data={"recipient_username": "alice"}
+        )
+        self.assertEqual(len(response.data), 1)
+
+        response = self.client.get(
+            reverse("message-detail-sent", kwargs={"id": self.sendable.id})
+        )
+        self.assertEqual(len(response.data["recipients"]), 2)
+
+    @with_setting_changed("UNIFIED_STORAGE", True)
+    def test_unified_storage_delete_sent(self) -> None:
+        self.delete(self.other_user)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(
+            reverse("message-delete-sent"), data={"message_ids": [self.sendable.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # Records deleted by both sides are gone, the rest are hidden from the sender.
+        self.assertEqual(self.get_sent_recipients(), [])
+        self.assertFalse(
+            ReceivedSendable.objects.filter(recipient=self.other_user).exists()
+        )
+        self.assertFalse(self.get_received_sendable(self.third_user).visible_to_sender)
+
+        self.sendable.refresh_from_db()
+        self.assertTrue(self.sendable.is_removed)
+
+        # The last inbox "copy" being deleted, the sendable goes too.
+        self.delete(self.third_user)
+        self.assertFalse(ReceivedSendable.objects.exists())
+        self.assertFalse(self.sendable_class.objects.exists())
+
+
+class NoticeUnifiedStorageTests(UnifiedStorageTests, NoticeMixin, APITestCase):
+    pass
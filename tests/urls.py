@@ -1,7 +1,8 @@
-from sendables.core.urls import sendables_path
+from sendables.core.urls import counts_path, sendables_path
 
 urlpatterns = [
     sendables_path("sendables/"),
     sendables_path("messages/", "message"),
     sendables_path("notices/", "notice"),
+    counts_path("counts/"),
 ]